@@ -35,6 +35,7 @@ from jaclang.runtimelib.architype import (
     DSFunc,
     EdgeAnchor as _EdgeAnchor,
     EdgeArchitype as _EdgeArchitype,
+    Frontier,
     NodeAnchor as _NodeAnchor,
     NodeArchitype as _NodeArchitype,
     Permission as _Permission,
@@ -652,7 +653,8 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
 
         __collection__: str | None = "node"
         __default_indexes__: list[dict] = [
-            {"keys": [("_id", ASCENDING), ("name", ASCENDING), ("root", ASCENDING)]}
+            {"keys": [("_id", ASCENDING), ("name", ASCENDING), ("root", ASCENDING)]},
+            {"keys": [("root", ASCENDING)]},
         ]
 
         @classmethod
@@ -730,7 +732,8 @@ class EdgeAnchor(BaseAnchor, _EdgeAnchor):  # type: ignore[misc]
 
         __collection__: str | None = "edge"
         __default_indexes__: list[dict] = [
-            {"keys": [("_id", ASCENDING), ("name", ASCENDING), ("root", ASCENDING)]}
+            {"keys": [("_id", ASCENDING), ("name", ASCENDING), ("root", ASCENDING)]},
+            {"keys": [("root", ASCENDING)]},
         ]
 
         @classmethod
@@ -801,9 +804,9 @@ class WalkerAnchor(BaseAnchor, _WalkerAnchor):  # type: ignore[misc]
 
     architype: "WalkerArchitype"
     path: list[Anchor] = field(default_factory=list)
-    next: list[Anchor] = field(default_factory=list)
+    next: Frontier = field(default_factory=Frontier)
     returns: list[Any] = field(default_factory=list)
-    ignores: list[Anchor] = field(default_factory=list)
+    ignores: set[Anchor] = field(default_factory=set)
     disengaged: bool = False
 
     class Collection(BaseCollection["WalkerAnchor"]):
@@ -811,7 +814,8 @@ class WalkerAnchor(BaseAnchor, _WalkerAnchor):  # type: ignore[misc]
 
         __collection__: str | None = "walker"
         __default_indexes__: list[dict] = [
-            {"keys": [("_id", ASCENDING), ("name", ASCENDING), ("root", ASCENDING)]}
+            {"keys": [("_id", ASCENDING), ("name", ASCENDING), ("root", ASCENDING)]},
+            {"keys": [("root", ASCENDING)]},
         ]
 
         @classmethod
@@ -75,6 +75,7 @@ class JaseciContext(ExecutionContext):
         ctx.base = ExecutionContext.get()
         ctx.request = request
         ctx.mem = MongoDB()
+        ctx.access_cache = {}
         ctx.reports = []
         ctx.status = 200
 
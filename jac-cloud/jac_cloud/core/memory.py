@@ -45,7 +45,9 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
                     nodes.add(edge.source)
                 if edge.target:
                     nodes.add(edge.target)
-            self.find(nodes)
+            # find only queries once consumed
+            for _ in self.find(nodes):
+                pass
 
     def find(  # type: ignore[override]
         self,
@@ -101,6 +103,21 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
 
         return data
 
+    def find_by_root(  # type: ignore[override]
+        self, root_id: ObjectId, session: ClientSession | None = None
+    ) -> Generator[BaseAnchor, None, None]:
+        """Find anchors owned by root."""
+        for cl in (
+            NodeAnchor.Collection,
+            EdgeAnchor.Collection,
+            WalkerAnchor.Collection,
+        ):
+            for anchor in cl.find(
+                {"root": root_id}, session=session or self.__session__
+            ):
+                self.__mem__[anchor.id] = anchor
+                yield anchor
+
     def close(self) -> None:
         """Close memory handler."""
         bulk_write = self.get_bulk_write()
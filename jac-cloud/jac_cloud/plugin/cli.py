@@ -3,11 +3,11 @@
 from getpass import getpass
 from os import getenv
 from os.path import split
-from pickle import load
 
 from jaclang import jac_import
 from jaclang.cli.cmdreg import cmd_registry
 from jaclang.plugin.default import hookimpl
+from jaclang.runtimelib.bundle import load_bundle
 from jaclang.runtimelib.context import ExecutionContext
 from jaclang.runtimelib.machine import JacMachine, JacProgram
 
@@ -48,16 +48,17 @@ class JacCmd:
                     override_name="__main__",
                 )
             elif filename.endswith(".jir"):
-                with open(filename, "rb") as f:
-                    JacMachine(base).attach_program(
-                        JacProgram(mod_bundle=load(f), bytecode=None, sem_ir=None)
-                    )
-                    jac_import(
-                        target=mod,
-                        base_path=base,
-                        cachable=True,
-                        override_name="__main__",
+                JacMachine(base).attach_program(
+                    JacProgram(
+                        mod_bundle=load_bundle(filename), bytecode=None, sem_ir=None
                     )
+                )
+                jac_import(
+                    target=mod,
+                    base_path=base,
+                    cachable=True,
+                    override_name="__main__",
+                )
             else:
                 jctx.close()
                 JacMachine.detach()
@@ -89,16 +90,17 @@ class JacCmd:
                     override_name="__main__",
                 )
             elif filename.endswith(".jir"):
-                with open(filename, "rb") as f:
-                    JacMachine(base).attach_program(
-                        JacProgram(mod_bundle=load(f), bytecode=None, sem_ir=None)
-                    )
-                    jac_import(
-                        target=mod,
-                        base_path=base,
-                        cachable=True,
-                        override_name="__main__",
+                JacMachine(base).attach_program(
+                    JacProgram(
+                        mod_bundle=load_bundle(filename), bytecode=None, sem_ir=None
                     )
+                )
+                jac_import(
+                    target=mod,
+                    base_path=base,
+                    cachable=True,
+                    override_name="__main__",
+                )
 
             if not email:
                 trial = 0
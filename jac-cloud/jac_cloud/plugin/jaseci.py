@@ -22,10 +22,9 @@ from fastapi import (
 )
 from fastapi.responses import ORJSONResponse
 
-from jaclang.compiler.constant import EdgeDir
 from jaclang.plugin.default import JacFeatureImpl, hookimpl
 from jaclang.plugin.feature import JacFeature as Jac
-from jaclang.runtimelib.architype import DSFunc
+from jaclang.runtimelib.architype import DSFunc, DSFuncTable
 
 from orjson import loads
 
@@ -332,6 +331,7 @@ class JacAccessValidationPlugin:
             access.anchors[ref_id] = level
             anchor._set.update({f"access.roots.anchors.{ref_id}": level.name})
             anchor._unset.pop(f"access.roots.anchors.{ref_id}", None)
+            JaseciContext.get().access_cache.clear()
 
     @staticmethod
     @hookimpl
@@ -356,6 +356,7 @@ class JacAccessValidationPlugin:
         ):
             anchor._unset.update({f"access.roots.anchors.{ref_id}": True})
             anchor._set.pop(f"access.roots.anchors.{ref_id}", None)
+            JaseciContext.get().access_cache.clear()
 
     @staticmethod
     @hookimpl
@@ -371,6 +372,7 @@ class JacAccessValidationPlugin:
         if isinstance(anchor, BaseAnchor) and level != anchor.access.all:
             anchor.access.all = level
             anchor._set.update({"access.all": level.name})
+            JaseciContext.get().access_cache.clear()
 
     @staticmethod
     @hookimpl
@@ -385,6 +387,7 @@ class JacAccessValidationPlugin:
         if isinstance(anchor, BaseAnchor) and anchor.access.all > AccessLevel.NO_ACCESS:
             anchor.access.all = AccessLevel.NO_ACCESS
             anchor._set.update({"access.all": AccessLevel.NO_ACCESS.name})
+            JaseciContext.get().access_cache.clear()
 
     @staticmethod
     @hookimpl
@@ -408,6 +411,10 @@ class JacAccessValidationPlugin:
         if jroot == jctx.system_root or jroot.id == to.root or jroot == to:
             return AccessLevel.WRITE
 
+        # if access of current root to target anchor is already resolved
+        if (access_level := jctx.access_cache.get((jroot.id, to.id))) is not None:
+            return access_level
+
         access_level = AccessLevel.NO_ACCESS
 
         # if target anchor have set access.all
@@ -432,45 +439,10 @@ class JacAccessValidationPlugin:
         if level > AccessLevel.NO_ACCESS and access_level == AccessLevel.NO_ACCESS:
             access_level = level
 
+        jctx.access_cache[(jroot.id, to.id)] = access_level
         return access_level
 
 
-class JacNodePlugin:
-    """Jac Node Operations."""
-
-    @staticmethod
-    @hookimpl
-    def get_edges(
-        node: NodeAnchor,
-        dir: EdgeDir,
-        filter_func: Callable[[list[EdgeArchitype]], list[EdgeArchitype]] | None,
-        target_obj: list[NodeArchitype] | None,
-    ) -> list[EdgeArchitype]:
-        """Get edges connected to this node."""
-        if FastAPI.is_enabled():
-            JaseciContext.get().mem.populate_data(node.edges)
-
-        return JacFeatureImpl.get_edges(
-            node=node, dir=dir, filter_func=filter_func, target_obj=target_obj  # type: ignore[arg-type, return-value]
-        )
-
-    @staticmethod
-    @hookimpl
-    def edges_to_nodes(
-        node: NodeAnchor,
-        dir: EdgeDir,
-        filter_func: Callable[[list[EdgeArchitype]], list[EdgeArchitype]] | None,
-        target_obj: list[NodeArchitype] | None,
-    ) -> list[NodeArchitype]:
-        """Get set of nodes connected to this node."""
-        if FastAPI.is_enabled():
-            JaseciContext.get().mem.populate_data(node.edges)
-
-        return JacFeatureImpl.edges_to_nodes(
-            node=node, dir=dir, filter_func=filter_func, target_obj=target_obj  # type: ignore[arg-type, return-value]
-        )
-
-
 class JacEdgePlugin:
     """Jac Edge Operations."""
 
@@ -489,7 +461,7 @@ class JacEdgePlugin:
         edge.target.disconnect_edge(edge)
 
 
-class JacPlugin(JacAccessValidationPlugin, JacNodePlugin, JacEdgePlugin):
+class JacPlugin(JacAccessValidationPlugin, JacEdgePlugin):
     """Jaseci Implementations."""
 
     @staticmethod
@@ -511,24 +483,12 @@ class JacPlugin(JacAccessValidationPlugin, JacNodePlugin, JacEdgePlugin):
         ctx = JaseciContext.get()
         ranchor = root.__jac__ if root else ctx.root
 
-        deleted_count = 0  # noqa: SIM113
+        deleted_count = 0
 
-        for node in NodeAnchor.Collection.find(
-            {"_id": {"$ne": ranchor.id}, "root": ranchor.id}
-        ):
-            ctx.mem.__mem__[node.id] = node
-            Jac.destroy(node)
-            deleted_count += 1
-
-        for edge in EdgeAnchor.Collection.find({"root": ranchor.id}):
-            ctx.mem.__mem__[edge.id] = edge
-            Jac.destroy(edge)
-            deleted_count += 1
-
-        for walker in WalkerAnchor.Collection.find({"root": ranchor.id}):
-            ctx.mem.__mem__[walker.id] = walker
-            Jac.destroy(walker)
-            deleted_count += 1
+        for anchor in ctx.mem.find_by_root(ranchor.id):
+            if anchor != ranchor:
+                Jac.destroy(anchor)
+                deleted_count += 1
 
         return deleted_count
 
@@ -708,8 +668,8 @@ class JacPlugin(JacAccessValidationPlugin, JacNodePlugin, JacEdgePlugin):
                 access=Permission(),
                 state=AnchorState(),
             )
-            source.edges.append(eanch)
-            target.edges.append(eanch)
+            source.add_edge(eanch)
+            target.add_edge(eanch)
             source.connect_edge(eanch)
             target.connect_edge(eanch)
 
@@ -780,68 +740,35 @@ class JacPlugin(JacAccessValidationPlugin, JacNodePlugin, JacEdgePlugin):
             raise TypeError("Invalid walker object")
 
         walker.path = []
-        walker.next = [node]
+        walker.next.reset(node)
         walker.returns = []
 
-        if walker.next:
-            current_node = walker.next[-1].architype
-            for i in warch._jac_entry_funcs_:
-                trigger = i.get_funcparam_annotations(i.func)
-                if not trigger:
-                    if i.func:
-                        walker.returns.append(i.func(warch, current_node))
-                    else:
-                        raise ValueError(f"No function {i.name} to call.")
+        current_node: Architype = node.architype
+        table = DSFuncTable.get(warch.__class__, current_node.__class__)
+        for i in table.entry:
+            walker.returns.append(i.func(warch, current_node))  # type: ignore[misc]
         while len(walker.next):
-            if current_node := walker.next.pop(0).architype:
-                for i in current_node._jac_entry_funcs_:
-                    trigger = i.get_funcparam_annotations(i.func)
-                    if not trigger or isinstance(warch, trigger):
-                        if i.func:
-                            walker.returns.append(i.func(current_node, warch))
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
+            if current_node := walker.next.pop().architype:
+                table = DSFuncTable.get(warch.__class__, current_node.__class__)
+                for i in table.node_entry:
+                    walker.returns.append(i.func(current_node, warch))  # type: ignore[misc]
                     if walker.disengaged:
                         return warch
-                for i in warch._jac_entry_funcs_:
-                    trigger = i.get_funcparam_annotations(i.func)
-                    if not trigger or isinstance(current_node, trigger):
-                        if i.func and trigger:
-                            walker.returns.append(i.func(warch, current_node))
-                        elif not trigger:
-                            continue
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
+                for i in table.walker_entry:
+                    walker.returns.append(i.func(warch, current_node))  # type: ignore[misc]
                     if walker.disengaged:
                         return warch
-                for i in warch._jac_exit_funcs_:
-                    trigger = i.get_funcparam_annotations(i.func)
-                    if not trigger or isinstance(current_node, trigger):
-                        if i.func and trigger:
-                            walker.returns.append(i.func(warch, current_node))
-                        elif not trigger:
-                            continue
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
+                for i in table.walker_exit:
+                    walker.returns.append(i.func(warch, current_node))  # type: ignore[misc]
                     if walker.disengaged:
                         return warch
-                for i in current_node._jac_exit_funcs_:
-                    trigger = i.get_funcparam_annotations(i.func)
-                    if not trigger or isinstance(warch, trigger):
-                        if i.func:
-                            walker.returns.append(i.func(current_node, warch))
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
+                for i in table.node_exit:
+                    walker.returns.append(i.func(current_node, warch))  # type: ignore[misc]
                     if walker.disengaged:
                         return warch
-        for i in warch._jac_exit_funcs_:
-            trigger = i.get_funcparam_annotations(i.func)
-            if not trigger:
-                if i.func:
-                    walker.returns.append(i.func(warch, current_node))
-                else:
-                    raise ValueError(f"No function {i.name} to call.")
-        walker.ignores = []
+        for i in table.exit:
+            walker.returns.append(i.func(warch, current_node))  # type: ignore[misc]
+        walker.ignores = set()
         return warch
 
     @staticmethod
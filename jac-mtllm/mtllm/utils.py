@@ -84,19 +84,7 @@ def get_type_annotation(data: Any) -> str:  # noqa: ANN401
 
 def get_filtered_registry(mod_registry: SemRegistry, scope: SemScope) -> SemRegistry:
     """Get the filtered registry based on the scope."""
-    avail_scopes = []
-    while True:
-        avail_scopes.append(str(scope))
-        if not scope.parent:
-            break
-        scope = scope.parent
-
-    filtered_registry = SemRegistry()
-    for _scope, sem_info_list in mod_registry.registry.items():
-        if str(_scope) in avail_scopes:
-            filtered_registry.registry[_scope] = sem_info_list
-
-    return filtered_registry
+    return mod_registry.filtered(scope)
 
 
 def extract_template_placeholders(template: str) -> list:
@@ -2,12 +2,13 @@
 
 import ast as ast3
 import importlib
+import json
 import marshal
 import os
-import pickle
 import shutil
 import sys
 import types
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
 import jaclang.compiler.absyntree as ast
@@ -21,9 +22,11 @@ from jaclang.compiler.passes.tool.schedules import format_pass
 from jaclang.plugin.builtin import dotgen
 from jaclang.plugin.feature import JacCmd as Cmd
 from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.runtimelib.bundle import load_bundle, write_bundle
 from jaclang.runtimelib.constructs import WalkerArchitype
 from jaclang.runtimelib.context import ExecutionContext
 from jaclang.runtimelib.machine import JacMachine, JacProgram
+from jaclang.settings import settings
 from jaclang.utils.helpers import debugger as db
 from jaclang.utils.lang_tools import AstTool
 
@@ -32,42 +35,74 @@ Cmd.create_cmd()
 Jac.setup()
 
 
+def format_jac_file(filename: str) -> Optional[str]:
+    """Format a .jac file, None if it has errors."""
+    code_gen_format = jac_file_to_pass(filename, schedule=format_pass)
+    return None if code_gen_format.errors_had else code_gen_format.ir.gen.jac
+
+
 @cmd_registry.register
-def format(path: str, outfile: str = "", debug: bool = False) -> None:
-    """Run the specified .jac file or format all .jac files in a given directory."""
+def format(
+    path: str, outfile: str = "", debug: bool = False, check: bool = False
+) -> None:
+    """Run the specified .jac file or format all .jac files in a given directory.
+
+    With check, files are left as they are and the command fails if any of them
+    is not formatted.
+    """
 
-    def format_file(filename: str) -> None:
-        code_gen_format = jac_file_to_pass(filename, schedule=format_pass)
-        if code_gen_format.errors_had:
+    def apply(filename: str, formatted: Optional[str]) -> bool:
+        if formatted is None:
             print(
                 f"Errors occurred while formatting the file {filename}.",
                 file=sys.stderr,
             )
-        elif debug:
-            print(code_gen_format.ir.gen.jac)
+            return False
+        if check:
+            with open(filename) as f:
+                if f.read() == formatted:
+                    return True
+            print(f"Would reformat {filename}", file=sys.stderr)
+            return False
+        if debug:
+            print(formatted)
         elif outfile:
             with open(outfile, "w") as f:
-                f.write(code_gen_format.ir.gen.jac)
+                f.write(formatted)
         else:
             with open(filename, "w") as f:
-                f.write(code_gen_format.ir.gen.jac)
+                f.write(formatted)
+        return True
 
     if path.endswith(".jac"):
         if os.path.exists(path):
-            format_file(path)
+            passed = apply(path, format_jac_file(path))
         else:
             print("File does not exist.", file=sys.stderr)
+            return
     elif os.path.isdir(path):
-        count = 0
-        for root, _, files in os.walk(path):
-            for file in files:
-                if file.endswith(".jac"):
-                    file_path = os.path.join(root, file)
-                    format_file(file_path)
-                    count += 1
-        print(f"Formatted {count} '.jac' files.", file=sys.stderr)
+        files = sorted(
+            os.path.join(root, file)
+            for root, _, names in os.walk(path)
+            for file in names
+            if file.endswith(".jac")
+        )
+        workers = min(settings.compile_workers or os.cpu_count() or 1, len(files))
+        # starting worker processes only pays off for larger trees
+        if workers > 1 and len(files) >= 8:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(format_jac_file, files, chunksize=4))
+        else:
+            results = [format_jac_file(i) for i in files]
+        outcomes = [apply(*i) for i in zip(files, results)]
+        passed = all(outcomes)
+        action = "Checked" if check else "Formatted"
+        print(f"{action} {len(files)} '.jac' files.", file=sys.stderr)
     else:
         print("Not a .jac file or directory.", file=sys.stderr)
+        return
+    if check and not passed:
+        sys.exit(1)
 
 
 @cmd_registry.register
@@ -104,16 +139,15 @@ def run(
             print(e, file=sys.stderr)
     elif filename.endswith(".jir"):
         try:
-            with open(filename, "rb") as f:
-                JacMachine(base).attach_program(
-                    JacProgram(mod_bundle=pickle.load(f), bytecode=None, sem_ir=None)
-                )
-                jac_import(
-                    target=mod,
-                    base_path=base,
-                    cachable=cache,
-                    override_name="__main__" if main else None,
-                )
+            JacMachine(base).attach_program(
+                JacProgram(mod_bundle=load_bundle(filename), bytecode=None, sem_ir=None)
+            )
+            jac_import(
+                target=mod,
+                base_path=base,
+                cachable=cache,
+                override_name="__main__" if main else None,
+            )
         except Exception as e:
             print(e, file=sys.stderr)
 
@@ -154,16 +188,15 @@ def get_object(
             override_name="__main__" if main else None,
         )
     elif filename.endswith(".jir"):
-        with open(filename, "rb") as f:
-            JacMachine(base).attach_program(
-                JacProgram(mod_bundle=pickle.load(f), bytecode=None, sem_ir=None)
-            )
-            jac_import(
-                target=mod,
-                base_path=base,
-                cachable=cache,
-                override_name="__main__" if main else None,
-            )
+        JacMachine(base).attach_program(
+            JacProgram(mod_bundle=load_bundle(filename), bytecode=None, sem_ir=None)
+        )
+        jac_import(
+            target=mod,
+            base_path=base,
+            cachable=cache,
+            override_name="__main__" if main else None,
+        )
     else:
         jctx.close()
         JacMachine.detach()
@@ -189,10 +222,10 @@ def build(filename: str) -> None:
         errs = len(out.errors_had)
         warnings = len(out.warnings_had)
         print(f"Errors: {errs}, Warnings: {warnings}")
-        for i in out.ir.flatten():
-            i.gen.clean()
-        with open(filename[:-4] + ".jir", "wb") as f:
-            pickle.dump(out.ir, f)
+        if isinstance(out.ir, ast.Module):
+            write_bundle(filename[:-4] + ".jir", out.ir)
+        else:
+            print(f"Could not build {filename}.", file=sys.stderr)
     else:
         print("Not a .jac file.", file=sys.stderr)
 
@@ -244,7 +277,7 @@ def enter(
     :param filename: The path to the .jac file.
     :param entrypoint: The name of the entrypoint function.
     :param args: Arguments to pass to the entrypoint function.
-    :param session: shelve.Shelf file path.
+    :param session: shelve.Shelf file path or storage uri (e.g. sqlite://graph.db).
     :param root: root executor.
     :param node: starting node.
     """
@@ -271,16 +304,15 @@ def enter(
             override_name="__main__" if main else None,
         )
     elif filename.endswith(".jir"):
-        with open(filename, "rb") as f:
-            JacMachine(base).attach_program(
-                JacProgram(mod_bundle=pickle.load(f), bytecode=None, sem_ir=None)
-            )
-            ret_module = jac_import(
-                target=mod,
-                base_path=base,
-                cachable=cache,
-                override_name="__main__" if main else None,
-            )
+        JacMachine(base).attach_program(
+            JacProgram(mod_bundle=load_bundle(filename), bytecode=None, sem_ir=None)
+        )
+        ret_module = jac_import(
+            target=mod,
+            base_path=base,
+            cachable=cache,
+            override_name="__main__" if main else None,
+        )
     else:
         jctx.close()
         JacMachine.detach()
@@ -363,6 +395,37 @@ def tool(tool: str, args: Optional[list] = None) -> None:
         print(f"Ast tool {tool} not found.", file=sys.stderr)
 
 
+@cmd_registry.register
+def bench(
+    workloads: str,
+    size: int = 1000,
+    repeat: int = 3,
+    seed: int = 0,
+    outfile: str = "",
+) -> None:
+    """Benchmark the data spatial runtime on generated graphs.
+
+    :param workloads: Comma separated workloads (fan_out, chain, random, hub) or all.
+    :param size: Number of nodes per generated graph.
+    :param repeat: Runs per measurement, the best one is reported.
+    :param seed: Seed of graph generation.
+    :param outfile: File to write JSON results to instead of stdout.
+    """
+    from jaclang.runtimelib.bench import WORKLOADS, run_benchmarks
+
+    names = list(WORKLOADS) if workloads == "all" else workloads.split(",")
+    if unknown := [name for name in names if name not in WORKLOADS]:
+        print(f"Unknown workloads: {', '.join(unknown)}", file=sys.stderr)
+        return
+
+    results = json.dumps(run_benchmarks(names, size, repeat, seed), indent=2)
+    if outfile:
+        with open(outfile, "w") as f:
+            f.write(results)
+    else:
+        print(results)
+
+
 @cmd_registry.register
 def clean() -> None:
     """Remove the __jac_gen__ , __pycache__ folders.
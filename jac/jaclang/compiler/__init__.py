@@ -5,6 +5,7 @@ import logging
 import os
 import shutil
 import sys
+from typing import Any, cast
 
 from jaclang.utils.helpers import auto_generate_refs
 from jaclang.vendor.lark.tools import standalone
@@ -44,10 +45,18 @@ except ModuleNotFoundError:
 jac_lark.logger.setLevel(logging.DEBUG)
 contextlib.suppress(ModuleNotFoundError)
 
+# read from the serialized grammar, building a parser here doubles startup cost
+# (MEMO and DATA are unpickled over the literals mypy infers their types from)
+memo = cast(dict[int, Any], jac_lark.MEMO)
+data = cast(dict[str, Any], jac_lark.DATA)
 TOKEN_MAP = {
     x.name: x.pattern.value
-    for x in jac_lark.Lark_StandAlone().parser.lexer_conf.terminals
+    for x in (
+        jac_lark.TerminalDef.deserialize(memo[i["@"]], memo)
+        for i in data["parser"]["lexer_conf"]["terminals"]
+    )
 }
+del memo, data
 
 # fmt: off
 TOKEN_MAP.update(
@@ -5,6 +5,7 @@ from __future__ import annotations
 import ast as ast3
 import builtins
 import os
+from bisect import bisect_left
 from dataclasses import dataclass
 from hashlib import md5
 from types import EllipsisType
@@ -35,6 +36,42 @@ from jaclang.utils.treeprinter import dotgen_ast_tree, print_ast_tree
 
 if TYPE_CHECKING:
     from jaclang.compiler.symtable import Symbol, SymbolTable
+    from jaclang.vendor.mypy.nodes import Node as MypyNode
+    from jaclang.vendor.mypy.types import Type as MypyType
+
+
+class SubNodeIndex:
+    """Flat per type index of the nodes of a tree in post order.
+
+    Every indexed node holds the range of positions taken by its descendants,
+    so the sub nodes of a type are a slice of that type's node list.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty index."""
+        self.size = 0
+        self.nodes: dict[type, list[AstNode]] = {}
+        self.positions: dict[type, list[int]] = {}
+
+    def add(self, node: AstNode) -> int:
+        """Add node after its descendants and return its position."""
+        typ = type(node)
+        if typ not in self.nodes:
+            self.nodes[typ] = []
+            self.positions[typ] = []
+        self.nodes[typ].append(node)
+        self.positions[typ].append(self.size)
+        self.size += 1
+        return self.size - 1
+
+    def get(self, typ: type, start: int, end: int) -> list[AstNode]:
+        """Get nodes of type between positions start and end."""
+        if typ not in self.nodes:
+            return []
+        positions = self.positions[typ]
+        return self.nodes[typ][
+            bisect_left(positions, start) : bisect_left(positions, end)
+        ]
 
 
 class AstNode:
@@ -45,7 +82,8 @@ class AstNode:
         self.parent: Optional[AstNode] = None
         self.kid: list[AstNode] = [x.set_parent(self) for x in kid]
         self._sym_tab: Optional[SymbolTable] = None
-        self._sub_node_tab: dict[type, list[AstNode]] = {}
+        self._sub_node_tab: Optional[SubNodeIndex] = None
+        self._sub_node_range: tuple[int, int] = (0, 0)
         self._in_mod_nodes: list[AstNode] = []
         self.gen: CodeGenTarget = CodeGenTarget()
         self.meta: dict[str, str] = {}
@@ -638,6 +676,11 @@ class Module(AstDocNode):
         self.mod_deps: dict[str, Module] = {}
         self.py_mod_dep_map: dict[str, str] = {}
         self.py_raise_map: dict[str, str] = {}
+        # mypy types of expressions, only held from type checking until fused
+        self.expr_types: dict[MypyNode, MypyType] = {}
+        # top-level elements whose analysis is carried over from an earlier
+        # check, the type checker skips the function bodies inside them
+        self.reused_elements: set[AstNode] = set()
         self.registry = registry
         self.terminals: list[Token] = terminals
         self.is_raised_from_py: bool = False
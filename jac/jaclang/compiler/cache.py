@@ -0,0 +1,135 @@
+"""Bytecode cache manifests for compiled Jac modules.
+
+Every cached `.jbc` file in `__jac_gen__` is paired with a manifest recording the
+compiler version and content hashes of the module source, its annexed impl/test
+modules and the Jac modules it imports. The cached bytecode is only reused while
+all of these still match.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from typing import Iterable, Optional
+
+from jaclang.compiler.constant import Constants as Con
+
+MANIFEST_VERSION = 1
+
+# path -> (mtime_ns, size, sha256), avoids rehashing files that did not change
+_hashes: dict[str, tuple[int, int, str]] = {}
+
+
+@cache
+def compiler_version() -> str:
+    """Get installed jaclang version."""
+    try:
+        return version("jaclang")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def file_hash(path: str) -> Optional[str]:
+    """Get sha256 of file content, None if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    cached = _hashes.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    _hashes[path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def find_annexes(mod_path: str) -> tuple[list[str], list[str]]:
+    """Find impl and test annex files of a module."""
+    if not mod_path.endswith(".jac"):
+        return [], []
+    base_path = mod_path[:-4]
+    directory = os.path.dirname(mod_path)
+    if not directory:
+        directory = os.getcwd()
+        base_path = os.path.join(directory, base_path)
+    impl_folder = base_path + ".impl"
+    test_folder = base_path + ".test"
+    search_files = [os.path.join(directory, i) for i in os.listdir(directory)]
+    for folder in (impl_folder, test_folder):
+        if os.path.isdir(folder):
+            search_files += [os.path.join(folder, i) for i in os.listdir(folder)]
+    impls: list[str] = []
+    tests: list[str] = []
+    for cur_file in search_files:
+        if mod_path.endswith(cur_file):
+            continue
+        if (
+            cur_file.startswith(f"{base_path}.")
+            or impl_folder == os.path.dirname(cur_file)
+        ) and cur_file.endswith(".impl.jac"):
+            impls.append(cur_file)
+        if (
+            cur_file.startswith(f"{base_path}.")
+            or test_folder == os.path.dirname(cur_file)
+        ) and cur_file.endswith(".test.jac"):
+            tests.append(cur_file)
+    return impls, tests
+
+
+def cache_targets(mod_path: str) -> tuple[str, str, str]:
+    """Get generated python, bytecode and manifest paths of a module."""
+    base_path, file_name = os.path.split(mod_path)
+    base_name, _ = os.path.splitext(file_name)
+    out_dir = os.path.join(base_path, Con.JAC_GEN_DIR)
+    return (
+        os.path.join(out_dir, f"{base_name}.py"),
+        os.path.join(out_dir, f"{base_name}.jbc"),
+        os.path.join(out_dir, f"{base_name}.manifest.json"),
+    )
+
+
+def build_manifest(mod_path: str, deps: Iterable[str]) -> dict:
+    """Build manifest of a module from its current sources."""
+    impls, tests = find_annexes(mod_path)
+    return {
+        "manifest": MANIFEST_VERSION,
+        "jaclang": compiler_version(),
+        "source": file_hash(mod_path),
+        "annexes": {i: file_hash(i) for i in sorted(impls + tests)},
+        "deps": {i: file_hash(i) for i in sorted(set(deps))},
+    }
+
+
+def write_manifest(mod_path: str, deps: Iterable[str]) -> None:
+    """Write manifest of a freshly cached module."""
+    with open(cache_targets(mod_path)[2], "w") as f:
+        json.dump(build_manifest(mod_path, deps), f, indent=1)
+
+
+def is_cached(mod_path: str) -> bool:
+    """Check cached bytecode of a module is still valid."""
+    _, out_path_pyc, out_path_manifest = cache_targets(mod_path)
+    if not os.path.exists(out_path_pyc):
+        return False
+    try:
+        with open(out_path_manifest) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("manifest") != MANIFEST_VERSION
+        or manifest.get("jaclang") != compiler_version()
+        or manifest.get("source") != file_hash(mod_path)
+    ):
+        return False
+    impls, tests = find_annexes(mod_path)
+    annexes = manifest.get("annexes", {})
+    deps = manifest.get("deps", {})
+    return set(annexes) == set(impls + tests) and all(
+        file_hash(path) == digest for path, digest in [*annexes.items(), *deps.items()]
+    )
@@ -5,6 +5,8 @@ from __future__ import annotations
 import keyword
 import logging
 import os
+import threading
+from collections import OrderedDict
 from typing import Callable, TypeAlias
 
 
@@ -12,6 +14,7 @@ import jaclang.compiler.absyntree as ast
 from jaclang.compiler import jac_lark as jl  # type: ignore
 from jaclang.compiler.constant import EdgeDir, Tokens as Tok
 from jaclang.compiler.passes.ir_pass import Pass
+from jaclang.settings import settings
 from jaclang.vendor.lark import Lark, Transformer, Tree, logger
 
 
@@ -25,6 +28,7 @@ class JacParser(Pass):
         self.source = input_ir
         self.mod_path = input_ir.loc.mod_path
         self.node_list: list[ast.AstNode] = []
+        self.node_ids: set[int] = set()
         if JacParser.dev_mode:
             JacParser.make_dev()
         Pass.__init__(self, input_ir=input_ir, prior=None)
@@ -91,18 +95,35 @@ class JacParser(Pass):
 
     @staticmethod
     def _comment_callback(comment: jl.Token) -> None:
-        JacParser.comment_cache.append(comment)
+        JacParser.comment_cache.comments.append(comment)
 
     @staticmethod
     def parse(
         ir: str, on_error: Callable[[jl.UnexpectedInput], bool]
     ) -> tuple[jl.Tree[jl.Tree[str]], list[jl.Token]]:
-        """Parse input IR."""
-        JacParser.comment_cache = []
-        return (
-            JacParser.parser.parse(ir, on_error=on_error),
-            JacParser.comment_cache,
-        )
+        """Parse input IR, reusing the parse tree of an identical source."""
+        with JacParser.tree_cache_lock:
+            if ir in JacParser.tree_cache:
+                JacParser.tree_cache.move_to_end(ir)
+                return JacParser.tree_cache[ir]
+        comments: list[jl.Token] = []
+        JacParser.comment_cache.comments = comments
+        try:
+            parsed = (JacParser.parser.parse(ir, on_error=on_error), comments)
+        finally:
+            del JacParser.comment_cache.comments
+        if settings.parse_cache_size > 0:
+            with JacParser.tree_cache_lock:
+                JacParser.tree_cache[ir] = parsed
+                while len(JacParser.tree_cache) > settings.parse_cache_size:
+                    JacParser.tree_cache.popitem(last=False)
+        return parsed
+
+    @staticmethod
+    def is_cached(ir: str) -> bool:
+        """Check if input IR has a cached parse tree."""
+        with JacParser.tree_cache_lock:
+            return ir in JacParser.tree_cache
 
     @staticmethod
     def make_dev() -> None:
@@ -115,9 +136,18 @@ class JacParser(Pass):
             lexer_callbacks={"COMMENT": JacParser._comment_callback},
         )
         JacParser.JacTransformer = Transformer[Tree[str], ast.AstNode]  # type: ignore
+        with JacParser.tree_cache_lock:
+            JacParser.tree_cache.clear()
         logger.setLevel(logging.DEBUG)
 
-    comment_cache: list[jl.Token] = []
+    # comments of the parse running on each thread, collected by the lexer
+    comment_cache = threading.local()
+    # source -> (parse tree, comments) of recent parses, least recent first
+    tree_cache: OrderedDict[str, tuple[jl.Tree[jl.Tree[str]], list[jl.Token]]] = (
+        OrderedDict()
+    )
+    # language server analyses and the workspace indexer parse on several threads
+    tree_cache_lock = threading.Lock()
 
     parser = jl.Lark_StandAlone(lexer_callbacks={"COMMENT": _comment_callback})  # type: ignore
     JacTransformer: TypeAlias = jl.Transformer[jl.Tree[str], ast.AstNode]
@@ -141,7 +171,8 @@ class JacParser(Pass):
         def nu(self, node: ast.T) -> ast.T:
             """Update node."""
             self.parse_ref.cur_node = node
-            if node not in self.parse_ref.node_list:
+            if id(node) not in self.parse_ref.node_ids:
+                self.parse_ref.node_ids.add(id(node))
                 self.parse_ref.node_list.append(node)
             return node
 
@@ -3980,6 +4011,7 @@ class JacParser(Pass):
         def __default_token__(self, token: jl.Token) -> ast.Token:
             """Token handler."""
             ret_type = ast.Token
+            value = token.value
             if token.type in [Tok.NAME, Tok.KWESC_NAME]:
                 ret_type = ast.Name
             if token.type in [
@@ -4010,15 +4042,15 @@ class JacParser(Pass):
             ]:
                 ret_type = ast.String
                 if token.type == Tok.FSTR_BESC:
-                    token.value = token.value[1:]
+                    value = value[1:]
             elif token.type == Tok.BOOL:
                 ret_type = ast.Bool
-            elif token.type == Tok.PYNLINE and isinstance(token.value, str):
-                token.value = token.value.replace("::py::", "")
+            elif token.type == Tok.PYNLINE and isinstance(value, str):
+                value = value.replace("::py::", "")
             ret = ret_type(
                 orig_src=self.parse_ref.source,
                 name=token.type,
-                value=token.value[2:] if token.type == Tok.KWESC_NAME else token.value,
+                value=value[2:] if token.type == Tok.KWESC_NAME else value,
                 line=token.line if token.line is not None else 0,
                 end_line=token.end_line if token.end_line is not None else 0,
                 col_start=token.column if token.column is not None else 0,
@@ -1,5 +1,5 @@
 """Passes for Jac."""
 
-from .ir_pass import Pass
+from .ir_pass import Pass, PassCancelledError, cancellable
 
-__all__ = ["Pass"]
+__all__ = ["Pass", "PassCancelledError", "cancellable"]
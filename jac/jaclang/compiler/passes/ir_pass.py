@@ -1,26 +1,69 @@
 """Abstract class for IR Passes for Jac."""
 
+import threading
 import time
-from typing import Optional, Type, TypeVar
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, TYPE_CHECKING, Type, TypeVar, cast
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes.transform import Transform
 from jaclang.settings import settings
 from jaclang.utils.helpers import pascal_to_snake
 
+if TYPE_CHECKING:
+    from jaclang.compiler.passes.profiler import CompileProfiler
+
 T = TypeVar("T", bound=ast.AstNode)
 
+Handler = Optional[Callable[["Pass", ast.AstNode], None]]
+
+# cancel event of the compilation running on each thread
+cancel_scope = threading.local()
+
+
+class PassCancelledError(Exception):
+    """Compilation was cancelled while a pass was running."""
+
+
+@contextmanager
+def cancellable(event: threading.Event) -> Iterator[None]:
+    """Stop passes created on this thread at their next node once event is set."""
+    prior = getattr(cancel_scope, "event", None)
+    cancel_scope.event = event
+    try:
+        yield
+    finally:
+        cancel_scope.event = prior
+
 
 class Pass(Transform[T]):
     """Abstract class for IR passes."""
 
+    # node type -> (enter_*, exit_*) functions, built lazily per pass class
+    dispatch_table: dict[type, tuple[Handler, Handler]] = {}
+    # set while profiling, handlers are then wrapped as they get dispatched
+    profiler: Optional["CompileProfiler"] = None
+
+    def __init_subclass__(cls) -> None:
+        """Give each pass class its own dispatch table."""
+        super().__init_subclass__()
+        cls.dispatch_table = {}
+
     def __init__(self, input_ir: T, prior: Optional[Transform]) -> None:
         """Initialize parser."""
         self.term_signal = False
         self.prune_signal = False
         self.ir: ast.AstNode = input_ir
         self.time_taken = 0.0
-        Transform.__init__(self, input_ir, prior)
+        self.cancel_event: Optional[threading.Event] = getattr(
+            cancel_scope, "event", None
+        )
+        if Pass.profiler:
+            Pass.profiler.run_pass(
+                self, lambda: Transform.__init__(self, input_ir, prior)
+            )
+        else:
+            Transform.__init__(self, input_ir, prior)
 
     def before_pass(self) -> None:
         """Run once before pass."""
@@ -30,15 +73,41 @@ class Pass(Transform[T]):
         """Run once after pass."""
         pass
 
+    @classmethod
+    def get_handlers(cls, typ: type) -> tuple[Handler, Handler]:
+        """Get enter and exit handlers of node type."""
+        handlers = cls.dispatch_table.get(typ)
+        if handlers is None:
+            name = pascal_to_snake(typ.__name__)
+            handlers = cls.dispatch_table[typ] = (
+                getattr(cls, f"enter_{name}", None),
+                getattr(cls, f"exit_{name}", None),
+            )
+            if Pass.profiler:
+                handlers = cls.dispatch_table[typ] = (
+                    Pass.profiler.wrap(cls, handlers[0]),
+                    Pass.profiler.wrap(cls, handlers[1]),
+                )
+        return handlers
+
+    @classmethod
+    def clear_dispatch_tables(cls) -> None:
+        """Clear dispatch tables of pass class and its subclasses."""
+        cls.dispatch_table.clear()
+        for sub in cls.__subclasses__():
+            sub.clear_dispatch_tables()
+
     def enter_node(self, node: ast.AstNode) -> None:
         """Run on entering node."""
-        if hasattr(self, f"enter_{pascal_to_snake(type(node).__name__)}"):
-            getattr(self, f"enter_{pascal_to_snake(type(node).__name__)}")(node)
+        handler = self.get_handlers(type(node))[0]
+        if handler:
+            handler(self, node)
 
     def exit_node(self, node: ast.AstNode) -> None:
         """Run on exiting node."""
-        if hasattr(self, f"exit_{pascal_to_snake(type(node).__name__)}"):
-            getattr(self, f"exit_{pascal_to_snake(type(node).__name__)}")(node)
+        handler = self.get_handlers(type(node))[1]
+        if handler:
+            handler(self, node)
 
     def terminate(self) -> None:
         """Terminate traversal."""
@@ -57,11 +126,9 @@ class Pass(Transform[T]):
         # Assumes pass built the sub node table
         if not node:
             return result
-        elif len(node._sub_node_tab):
-            if typ in node._sub_node_tab:
-                for i in node._sub_node_tab[typ]:
-                    if isinstance(i, typ):
-                        result.append(i)
+        elif node._sub_node_tab:
+            start, end = node._sub_node_range
+            result = cast(list[T], node._sub_node_tab.get(typ, start, end))
         elif len(node.kid):
             if not brute_force:
                 raise ValueError(f"Node has no sub_node_tab. {node}")
@@ -120,10 +187,19 @@ class Pass(Transform[T]):
             )
         return self.ir
 
+    def check_cancelled(self) -> None:
+        """Raise when the compilation running this pass got cancelled."""
+        if self.cancel_event and self.cancel_event.is_set():
+            raise PassCancelledError(f"{self.__class__.__name__} cancelled")
+
     def traverse(self, node: ast.AstNode) -> ast.AstNode:
         """Traverse tree."""
+        if settings.iterative_traversal:
+            return self.traverse_iter(node)
         if self.term_signal:
             return node
+        if self.cancel_event:
+            self.check_cancelled()
         self.cur_node = node
         self.enter_node(node)
         if not self.prune_signal:
@@ -138,6 +214,37 @@ class Pass(Transform[T]):
         self.exit_node(node)
         return node
 
+    def traverse_iter(self, node: ast.AstNode) -> ast.AstNode:
+        """Traverse tree with an explicit stack, same visit order as traverse."""
+        if self.term_signal:
+            return node
+        stack = [(node, self.enter_kids(node))]
+        while stack:
+            if self.term_signal:
+                self.cur_node = node
+                return node
+            if self.cancel_event:
+                self.check_cancelled()
+            cur, kids = stack[-1]
+            for kid in kids:
+                if kid:
+                    stack.append((kid, self.enter_kids(kid)))
+                    break
+            else:
+                stack.pop()
+                self.cur_node = cur
+                self.exit_node(cur)
+        return node
+
+    def enter_kids(self, node: ast.AstNode) -> Iterator[ast.AstNode]:
+        """Enter node and get the kids to traverse."""
+        self.cur_node = node
+        self.enter_node(node)
+        if self.prune_signal:
+            self.prune_signal = False
+            return iter(())
+        return iter(node.kid)
+
     def error(self, msg: str, node_override: Optional[ast.AstNode] = None) -> None:
         """Pass Error."""
         self.log_error(msg, node_override=node_override)
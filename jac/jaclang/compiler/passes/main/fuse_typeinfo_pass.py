@@ -15,11 +15,11 @@ from jaclang.compiler.symtable import SymbolTable
 from jaclang.settings import settings
 from jaclang.utils.helpers import pascal_to_snake
 from jaclang.vendor.mypy.nodes import Node as VNode  # bit of a hack
+from jaclang.vendor.mypy.types import Type as VType
 
 
 import mypy.nodes as MypyNodes  # noqa N812
 import mypy.types as MypyTypes  # noqa N812
-from mypy.checkexpr import Type as MyType
 
 
 T = TypeVar("T", bound=ast.AstSymbolNode)
@@ -28,7 +28,18 @@ T = TypeVar("T", bound=ast.AstSymbolNode)
 class FuseTypeInfoPass(Pass):
     """Python and bytecode file self.__debug_printing pass."""
 
-    node_type_hash: dict[MypyNodes.Node | VNode, MyType] = {}
+    def before_pass(self) -> None:
+        """Take expression types recorded by the type checker."""
+        self.node_type_hash: dict[VNode, VType] = (
+            self.ir.expr_types if isinstance(self.ir, ast.Module) else {}
+        )
+        return super().before_pass()
+
+    def after_pass(self) -> None:
+        """Release expression types once fused."""
+        if isinstance(self.ir, ast.Module):
+            self.ir.expr_types = {}
+        return super().after_pass()
 
     # Override this to support enter expression.
     def enter_node(self, node: ast.AstNode) -> None:
@@ -42,7 +53,7 @@ class FuseTypeInfoPass(Pass):
         if settings.fuse_type_info_debug:
             self.log_info("FuseTypeInfo::" + msg)
 
-    def __call_type_handler(self, mypy_type: MypyTypes.Type) -> Optional[str]:
+    def __call_type_handler(self, mypy_type: MypyTypes.Type | VType) -> Optional[str]:
         mypy_type_name = pascal_to_snake(mypy_type.__class__.__name__)
         type_handler_name = f"get_type_from_{mypy_type_name}"
         if hasattr(self, type_handler_name):
@@ -157,6 +168,10 @@ class FuseTypeInfoPass(Pass):
                     func(self, node)  # type: ignore
                     self.__set_type_sym_table_link(node)
 
+                # Types carried over from an earlier check, see Module.reused_elements
+                elif node.expr_type != "NoType":
+                    self.__set_type_sym_table_link(node)
+
                 # Jac node doesn't have mypy nodes linked to it
                 else:
                     self.__debug_print(
@@ -269,7 +284,7 @@ class FuseTypeInfoPass(Pass):
         # If the corrosponding mypy ast node type has stored here, get the values.
         mypy_node = node.gen.mypy_ast[0]
         if mypy_node in self.node_type_hash:
-            mytype: MyType = self.node_type_hash[mypy_node]
+            mytype: VType = self.node_type_hash[mypy_node]
             node.expr_type = self.__call_type_handler(mytype) or node.expr_type
 
         # Set they symbol type for collection expression.
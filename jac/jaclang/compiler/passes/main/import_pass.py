@@ -6,32 +6,79 @@ symbols are available for matching.
 """
 
 import ast as py_ast
+import multiprocessing
 import os
 import pathlib
+from concurrent.futures import BrokenExecutor, Executor, Future, ProcessPoolExecutor
 from typing import Optional
 
 
 import jaclang.compiler.absyntree as ast
+from jaclang.compiler.cache import find_annexes
 from jaclang.compiler.passes import Pass
 from jaclang.compiler.passes.main import SubNodeTabPass, SymTabBuildPass
+from jaclang.compiler.passes.transform import Alert
 from jaclang.settings import settings
 from jaclang.utils.log import logging
 
 
 logger = logging.getLogger(__name__)
 
+ParsedMod = tuple[Optional[ast.AstNode], list[Alert], list[Alert]]
+
+
+def parse_jac_module(target: str) -> ParsedMod:
+    """Parse a Jac module file with its alerts."""
+    from jaclang.compiler.compile import jac_file_to_pass
+
+    try:
+        mod_pass = jac_file_to_pass(file_path=target, target=SubNodeTabPass)
+    except Exception as e:
+        logger.info(e)
+        return None, [], []
+    return mod_pass.ir, mod_pass.errors_had, mod_pass.warnings_had
+
+
+# worker count -> process pool, kept for the life of the process
+parse_pools: dict[int, Executor] = {}
+
+
+def parse_pool(workers: int) -> Executor:
+    """Get process pool for parsing modules, starting it on first use."""
+    if workers not in parse_pools:
+        # fresh forkserver/spawn workers, forking a threaded language server is unsafe
+        ctx: multiprocessing.context.BaseContext
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            ctx = multiprocessing.get_context("forkserver")
+            ctx.set_forkserver_preload([__name__])
+        else:
+            ctx = multiprocessing.get_context("spawn")
+        parse_pools[workers] = ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+    return parse_pools[workers]
+
+
+def drop_parse_pool(workers: int) -> None:
+    """Shut down a broken parse pool so the next compile starts a fresh one."""
+    if pool := parse_pools.pop(workers, None):
+        pool.shutdown(wait=False, cancel_futures=True)
+
 
 class JacImportPass(Pass):
     """Jac statically imports Jac modules."""
 
+    # import graph levels smaller than this are not worth starting a pool for
+    parallel_min_modules = 8
+
     def before_pass(self) -> None:
         """Run once before pass."""
         self.import_table: dict[str, ast.Module] = {}
+        self.parsed: dict[str, ParsedMod] = {}
 
     def enter_module(self, node: ast.Module) -> None:
         """Run Importer."""
         self.cur_node = node
         self.import_table[node.loc.mod_path] = node
+        self.parse_import_graph(node)
         self.annex_impl(node)
         self.terminate()  # Turns off auto traversal for deliberate traversal
         self.run_again = True
@@ -44,6 +91,96 @@ class JacImportPass(Pass):
             SubNodeTabPass(prior=self, input_ir=node)
 
         node.mod_deps.update(self.import_table)
+        self.parsed.clear()
+
+    def parse_import_graph(self, node: ast.Module) -> None:
+        """Parse every Jac module reachable from node ahead of importing.
+
+        Only runs when compile_workers asks for more than one process. Modules
+        are parsed a level of the import graph at a time, in a process pool
+        once a level is large enough. Parsed modules are only consumed by
+        import_jac_mod_from_file, so attach order and alerts match the serial
+        path exactly. The pool re-imports the main module in its workers, so
+        scripts enabling it need an if __name__ == "__main__" guard.
+        """
+        workers = settings.compile_workers or os.cpu_count() or 1
+        if workers < 2:
+            return
+        seen = {node.loc.mod_path}
+        pool: Optional[Executor] = None
+        level = [node]
+        while level:
+            targets = []
+            for mod in level:
+                for target in self.find_jac_imports(mod):
+                    if target not in seen:
+                        seen.add(target)
+                        targets.append(target)
+            # sources parsed before are served from the parse tree cache
+            uncached = [i for i in targets if not self.is_parse_cached(i)]
+            if len(uncached) >= self.parallel_min_modules and not pool:
+                pool = parse_pool(workers)
+            futures: dict[str, Future[ParsedMod]] = {}
+            try:
+                if pool:
+                    futures = {i: pool.submit(parse_jac_module, i) for i in uncached}
+            except BrokenExecutor as e:
+                logger.warning(f"Parse pool failed, parsing serially: {e}")
+                drop_parse_pool(workers)
+                pool = None
+            level = []
+            for target in targets:
+                try:
+                    parsed = (
+                        futures[target].result()
+                        if target in futures
+                        else parse_jac_module(target)
+                    )
+                except Exception as e:
+                    logger.warning(f"Parsing {target} in pool failed: {e}")
+                    if isinstance(e, BrokenExecutor):
+                        drop_parse_pool(workers)
+                        futures.clear()
+                        pool = None
+                    parsed = parse_jac_module(target)
+                self.parsed[target] = parsed
+                if isinstance(parsed[0], ast.Module):
+                    level.append(parsed[0])
+
+    @staticmethod
+    def is_parse_cached(target: str) -> bool:
+        """Check if the source of a module file has a cached parse tree."""
+        from jaclang.compiler.parser import JacParser
+
+        try:
+            with open(target) as file:
+                return JacParser.is_cached(file.read())
+        except OSError:
+            return False
+
+    def find_jac_imports(self, node: ast.Module) -> list[str]:
+        """Find files of annexes and Jac modules imported by a module."""
+        impls, tests = find_annexes(node.loc.mod_path)
+        targets = impls + tests
+        for path in self.get_all_sub_nodes(node, ast.ModulePath):
+            imp_node = path.parent_of_type(ast.Import)
+            if not imp_node.is_jac:
+                continue
+            target = path.resolve_relative_path()
+            if not os.path.isdir(target):
+                targets.append(target)
+                continue
+            targets.append(os.path.join(target, "__init__.jac"))
+            if path == imp_node.from_loc:
+                for i in imp_node.items.items:
+                    if isinstance(i, ast.ModuleItem):
+                        target = path.resolve_relative_path(i.name.value)
+                        targets.append(
+                            os.path.join(target, "__init__.jac")
+                            if os.path.isdir(target)
+                            else target
+                        )
+        return [i for i in targets if os.path.isfile(i)]
 
     def process_import(self, i: ast.ModulePath) -> None:
         """Process an import."""
@@ -70,47 +207,19 @@ class JacImportPass(Pass):
             self.error("Module has no path")
         if not node.loc.mod_path.endswith(".jac"):
             return
-        base_path = node.loc.mod_path[:-4]
-        directory = os.path.dirname(node.loc.mod_path)
-        if not directory:
-            directory = os.getcwd()
-            base_path = os.path.join(directory, base_path)
-        impl_folder = base_path + ".impl"
-        test_folder = base_path + ".test"
-        search_files = [
-            os.path.join(directory, impl_file) for impl_file in os.listdir(directory)
-        ]
-        if os.path.exists(impl_folder):
-            search_files += [
-                os.path.join(impl_folder, impl_file)
-                for impl_file in os.listdir(impl_folder)
-            ]
-        if os.path.exists(test_folder):
-            search_files += [
-                os.path.join(test_folder, test_file)
-                for test_file in os.listdir(test_folder)
-            ]
-        for cur_file in search_files:
-            if node.loc.mod_path.endswith(cur_file):
-                continue
-            if (
-                cur_file.startswith(f"{base_path}.")
-                or impl_folder == os.path.dirname(cur_file)
-            ) and cur_file.endswith(".impl.jac"):
-                mod = self.import_jac_mod_from_file(cur_file)
-                if mod:
-                    node.impl_mod.append(mod)
-                    node.add_kids_left([mod], pos_update=False)
-                    mod.parent = node
-            if (
-                cur_file.startswith(f"{base_path}.")
-                or test_folder == os.path.dirname(cur_file)
-            ) and cur_file.endswith(".test.jac"):
-                mod = self.import_jac_mod_from_file(cur_file)
-                if mod and not settings.ignore_test_annex:
-                    node.test_mod.append(mod)
-                    node.add_kids_right([mod], pos_update=False)
-                    mod.parent = node
+        impls, tests = find_annexes(node.loc.mod_path)
+        for cur_file in impls:
+            mod = self.import_jac_mod_from_file(cur_file)
+            if mod:
+                node.impl_mod.append(mod)
+                node.add_kids_left([mod], pos_update=False)
+                mod.parent = node
+        for cur_file in tests:
+            mod = self.import_jac_mod_from_file(cur_file)
+            if mod and not settings.ignore_test_annex:
+                node.test_mod.append(mod)
+                node.add_kids_right([mod], pos_update=False)
+                mod.parent = node
 
     def enter_module_path(self, node: ast.ModulePath) -> None:
         """Sub objects.
@@ -169,22 +278,18 @@ class JacImportPass(Pass):
 
     def import_jac_mod_from_file(self, target: str) -> ast.Module | None:
         """Import a module from a file."""
-        from jaclang.compiler.compile import jac_file_to_pass
-        from jaclang.compiler.passes.main import SubNodeTabPass
-
         if not os.path.exists(target):
             self.error(f"Could not find module {target}")
             return None
         if target in self.import_table:
             return self.import_table[target]
-        try:
-            mod_pass = jac_file_to_pass(file_path=target, target=SubNodeTabPass)
-            self.errors_had += mod_pass.errors_had
-            self.warnings_had += mod_pass.warnings_had
-            mod = mod_pass.ir
-        except Exception as e:
-            logger.info(e)
-            mod = None
+        mod, errors, warnings = (
+            self.parsed.pop(target)
+            if target in self.parsed
+            else parse_jac_module(target)
+        )
+        self.errors_had += errors
+        self.warnings_had += warnings
         if isinstance(mod, ast.Module):
             self.import_table[target] = mod
             mod.is_imported = True
@@ -327,6 +432,10 @@ class PyImportPass(JacImportPass):
             SymTabBuildPass(input_ir=mod, prior=self)
             mod.parent = None
 
+    def parse_import_graph(self, node: ast.Module) -> None:
+        """Skip parsing Jac imports, these were imported by JacImportPass."""
+        return None
+
     def annex_impl(self, node: ast.Module) -> None:
         """Annex impl and test modules."""
         return None
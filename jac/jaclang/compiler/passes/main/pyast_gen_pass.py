@@ -2377,13 +2377,16 @@ class PyastGenPass(Pass):
                                     ctx=ast3.Load(),
                                 )
                             ),
-                            (
-                                node.op.edge_spec.filter_cond.gen.py_ast[0]
-                                if node.op.edge_spec.filter_cond is not None
-                                else self.sync(ast3.Constant(value=None))
-                            ),
+                            self.gen_edge_filter(node.op.edge_spec),
+                        ],
+                        keywords=[
+                            self.sync(
+                                ast3.keyword(
+                                    arg="edge_type",
+                                    value=self.gen_edge_type(node.op.edge_spec),
+                                )
+                            )
                         ],
-                        keywords=[],
                     )
                 )
             ]
@@ -3288,12 +3291,7 @@ class PyastGenPass(Pass):
                     ),
                     self.sync(
                         ast3.keyword(
-                            arg="filter_func",
-                            value=self.sync(
-                                node.filter_cond.gen.py_ast[0]
-                                if node.filter_cond
-                                else self.sync(ast3.Constant(value=None))
-                            ),
+                            arg="filter_func", value=self.gen_edge_filter(node)
                         )
                     ),
                     self.sync(
@@ -3302,10 +3300,25 @@ class PyastGenPass(Pass):
                             value=self.sync(ast3.Constant(value=edges_only)),
                         )
                     ),
+                    self.sync(
+                        ast3.keyword(arg="edge_type", value=self.gen_edge_type(node))
+                    ),
                 ],
             )
         )
 
+    def gen_edge_filter(self, node: ast.EdgeOpRef) -> ast3.AST:
+        """Generate filter of the field comparisons of an edge op ref."""
+        if node.filter_cond and node.filter_cond.compares:
+            return node.filter_cond.gen.py_ast[0]
+        return self.sync(ast3.Constant(value=None))
+
+    def gen_edge_type(self, node: ast.EdgeOpRef) -> ast3.AST:
+        """Generate edge type of an edge op ref, looked up in the edge index."""
+        if node.filter_cond and node.filter_cond.f_type:
+            return node.filter_cond.f_type.gen.py_ast[0]
+        return self.sync(ast3.Constant(value=None))
+
     def exit_disconnect_op(self, node: ast.DisconnectOp) -> None:
         """Sub objects.
 
@@ -3424,7 +3437,11 @@ class PyastGenPass(Pass):
                                                         )
                                                     )
                                                 ]
+                                                # edge refs pass their type apart
                                                 if node.f_type
+                                                and not isinstance(
+                                                    node.parent, ast.EdgeOpRef
+                                                )
                                                 else []
                                             )
                                             + [
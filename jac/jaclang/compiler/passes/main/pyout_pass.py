@@ -2,14 +2,14 @@
 
 This pass creates and manages compilation of Python code from the AST. This pass
 also creates bytecode files from the Python code, and manages the caching of
-relevant files.
+relevant files, recording a manifest used to validate cached bytecode.
 """
 
 import os
 
 
 import jaclang.compiler.absyntree as ast
-from jaclang.compiler.constant import Constants as Con
+from jaclang.compiler.cache import cache_targets, is_cached, write_manifest
 from jaclang.compiler.passes import Pass
 
 
@@ -39,14 +39,13 @@ class PyOutPass(Pass):
             i for i in self.get_all_sub_nodes(node, ast.Module) if not i.stub_only
         ]
         for mod in mods:
-            mod_path, out_path_py, out_path_pyc = self.get_output_targets(mod)
-            if os.path.exists(out_path_pyc) and os.path.getmtime(
-                out_path_pyc
-            ) > os.path.getmtime(mod_path):
+            if is_cached(mod.loc.mod_path):
                 continue
+            mod_path, out_path_py, out_path_pyc = self.get_output_targets(mod)
             try:
                 self.gen_python(mod, out_path=out_path_py)
                 self.dump_bytecode(mod, mod_path=mod_path, out_path=out_path_pyc)
+                write_manifest(mod_path, self.get_jac_deps(mod))
             except Exception as e:
                 self.warning(f"Error in generating Python code: {e}", node)
         self.terminate()
@@ -66,21 +65,25 @@ class PyOutPass(Pass):
                 f"Soemthing went wrong with {node.loc.mod_path} compilation.", node
             )
 
+    def get_jac_deps(self, node: ast.Module) -> list[str]:
+        """Get paths of Jac modules imported by a module."""
+        annexes = {i.loc.mod_path for i in node.impl_mod + node.test_mod}
+        return [
+            i.loc.mod_path
+            for i in self.get_all_sub_nodes(node, ast.Module)
+            if not i.stub_only
+            and i.loc.mod_path.endswith(".jac")
+            and i.loc.mod_path not in annexes
+        ]
+
     def get_output_targets(self, node: ast.Module) -> tuple[str, str, str]:
         """Get output targets."""
-        base_path, file_name = os.path.split(node.loc.mod_path)
-        gen_path = os.path.join(base_path, Con.JAC_GEN_DIR)
-        mod_dir, file_name = os.path.split(node.loc.mod_path)
-        mod_dir = mod_dir.replace(base_path, "").lstrip(os.sep)
-        base_name, _ = os.path.splitext(file_name)
-        out_dir = os.path.join(gen_path, mod_dir)
+        out_path_py, out_path_pyc, _ = cache_targets(node.loc.mod_path)
+        gen_path = os.path.dirname(out_path_pyc)
         try:
             os.makedirs(gen_path, exist_ok=True)
             with open(os.path.join(gen_path, "__init__.py"), "w"):
                 pass
-            os.makedirs(out_dir, exist_ok=True)
         except Exception as e:
-            self.warning(f"Can't create directory {out_dir}: {e}", node)
-        out_path_py = os.path.join(out_dir, f"{base_name}.py")
-        out_path_pyc = os.path.join(out_dir, f"{base_name}.jbc")
+            self.warning(f"Can't create directory {gen_path}: {e}", node)
         return node.loc.mod_path, out_path_py, out_path_pyc
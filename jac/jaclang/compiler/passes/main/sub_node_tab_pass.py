@@ -1,12 +1,11 @@
 """Subnode Table building pass.
 
-This pass builds a table of subnodes for each node in the AST. This is used
-for fast lookup of nodes of a certain type in the AST. This is just a utility
-pass and is not required for any other pass to work.
+This pass builds a flat index of the nodes of each type in the AST, with every
+node recording the range its descendants take in it. This is used for fast
+lookup of nodes of a certain type in the AST. This is just a utility pass and
+is not required for any other pass to work.
 """
 
-from copy import copy
-
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes import Pass
 
@@ -14,23 +13,18 @@ from jaclang.compiler.passes import Pass
 class SubNodeTabPass(Pass):
     """AST Enrichment Pass for basic high level semantics."""
 
+    def before_pass(self) -> None:
+        """Start a new index."""
+        self.index = ast.SubNodeIndex()
+        self.starts: list[int] = []
+
     def enter_node(self, node: ast.AstNode) -> None:
         """Table builder."""
         super().enter_node(node)
-        node._sub_node_tab = {}  # clears on entry
+        self.starts.append(self.index.size)
 
     def exit_node(self, node: ast.AstNode) -> None:
         """Table builder."""
         super().exit_node(node)
-        for i in node.kid:
-            if not i:
-                continue
-            for k, v in i._sub_node_tab.items():
-                if k in node._sub_node_tab:
-                    node._sub_node_tab[k].extend(v)
-                else:
-                    node._sub_node_tab[k] = copy(v)
-            if type(i) in node._sub_node_tab:
-                node._sub_node_tab[type(i)].append(i)
-            else:
-                node._sub_node_tab[type(i)] = [i]
+        node._sub_node_tab = self.index
+        node._sub_node_range = (self.starts.pop(), self.index.add(node))
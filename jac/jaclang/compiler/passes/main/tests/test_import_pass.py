@@ -3,13 +3,17 @@
 import io
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
 
 import jaclang.compiler.absyntree as ast
 from jaclang.cli import cli
 from jaclang.compiler.compile import jac_file_to_pass
+from jaclang.compiler.parser import JacParser
 from jaclang.compiler.passes.main import JacImportPass
 from jaclang.compiler.passes.main.fuse_typeinfo_pass import FuseTypeInfoPass
 from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+from jaclang.settings import settings
 from jaclang.utils.test import TestCase
 
 
@@ -49,6 +53,45 @@ class ImportPassPassTests(TestCase):
         self.assertIn("autoimpl.impl", mod_names)
         self.assertIn("autoimpl.something.else.impl", mod_names)
 
+    def test_parallel_import_matches_serial(self) -> None:
+        """Test modules parsed in a process pool match the serial import."""
+        results = []
+        submitted = []
+        workers, cache_size = settings.compile_workers, settings.parse_cache_size
+        try:
+            # no cached parse trees, so every imported module goes to the pool
+            settings.parse_cache_size = 0
+            JacParser.tree_cache.clear()
+            for count in (1, 2):
+                settings.compile_workers = count
+                with patch.object(
+                    JacImportPass, "parallel_min_modules", 2
+                ), patch.object(
+                    ProcessPoolExecutor,
+                    "submit",
+                    autospec=True,
+                    side_effect=ProcessPoolExecutor.submit,
+                ) as submit:
+                    state = jac_file_to_pass(self.fixture_abs_path("incautoimpl.jac"))
+                submitted.append(submit.call_count)
+                results.append(
+                    (
+                        [
+                            i.loc.mod_path
+                            for i in state.ir.get_all_sub_nodes(ast.Module)
+                        ],
+                        list(state.ir.mod_deps),
+                        [str(i) for i in state.errors_had + state.warnings_had],
+                        state.ir.gen.py,
+                    )
+                )
+        finally:
+            settings.compile_workers = workers
+            settings.parse_cache_size = cache_size
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(0, submitted[0])
+        self.assertEqual(len(results[1][0]) - 1, submitted[1])
+
     def test_annexalbe_by_discovery(self) -> None:
         """Basic test for pass."""
         state = jac_file_to_pass(
@@ -0,0 +1,90 @@
+"""Test pass traversal."""
+
+import sys
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.compile import jac_file_to_pass, jac_str_to_pass
+from jaclang.compiler.passes import Pass
+from jaclang.compiler.passes.main import SubNodeTabPass
+from jaclang.settings import settings
+from jaclang.utils.test import TestCase
+
+
+class RecordPass(Pass):
+    """Record visited nodes."""
+
+    def before_pass(self) -> None:
+        """Start recording."""
+        self.visits: list[tuple[str, ast.AstNode]] = []
+
+    def enter_node(self, node: ast.AstNode) -> None:
+        """Record entering node."""
+        self.visits.append(("enter", node))
+        super().enter_node(node)
+
+    def exit_node(self, node: ast.AstNode) -> None:
+        """Record exiting node."""
+        self.visits.append(("exit", node))
+        super().exit_node(node)
+
+    def enter_ability(self, node: ast.Ability) -> None:
+        """Skip ability bodies."""
+        self.prune()
+
+    def exit_architype(self, node: ast.Architype) -> None:
+        """Stop at the second architype."""
+        if sum(isinstance(i, ast.Architype) for _, i in self.visits) > 2:
+            self.terminate()
+
+
+class IrPassTests(TestCase):
+    """Test pass traversal."""
+
+    def test_dispatch_table(self) -> None:
+        """Test handlers are resolved once per pass class and node type."""
+        RecordPass.dispatch_table.clear()
+        state = jac_file_to_pass(
+            self.examples_abs_path("manual_code/circle.jac"), SubNodeTabPass
+        )
+        RecordPass(input_ir=state.ir, prior=None)
+        self.assertEqual(
+            RecordPass.dispatch_table[ast.Ability],
+            (RecordPass.enter_ability, None),
+        )
+        self.assertEqual(
+            RecordPass.dispatch_table[ast.Architype],
+            (None, RecordPass.exit_architype),
+        )
+        self.assertNotIn(ast.Ability, Pass.dispatch_table)
+
+    def test_iterative_traversal(self) -> None:
+        """Test iterative traversal matches recursive traversal."""
+        state = jac_file_to_pass(
+            self.examples_abs_path("manual_code/circle.jac"), SubNodeTabPass
+        )
+        visits = []
+        try:
+            for iterative in (False, True):
+                settings.iterative_traversal = iterative
+                visits.append(RecordPass(input_ir=state.ir, prior=None).visits)
+        finally:
+            settings.iterative_traversal = False
+        self.assertTrue(visits[0])
+        self.assertEqual(visits[0], visits[1])
+
+    def test_iterative_traversal_depth(self) -> None:
+        """Test iterative traversal is not bound by the recursion limit."""
+        state = jac_str_to_pass(
+            "with entry { x = " + "- " * 200 + "1; }", "", target=SubNodeTabPass
+        )
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(200)
+        try:
+            settings.iterative_traversal = True
+            record = RecordPass(input_ir=state.ir, prior=None)
+        finally:
+            settings.iterative_traversal = False
+            sys.setrecursionlimit(limit)
+        self.assertEqual(
+            sum(isinstance(i, ast.UnaryExpr) for _, i in record.visits), 400
+        )
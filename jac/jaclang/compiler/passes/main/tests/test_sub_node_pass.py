@@ -1,5 +1,6 @@
 """Test sub node pass module."""
 
+import jaclang.compiler.absyntree as ast
 from jaclang.compiler.compile import jac_file_to_pass
 from jaclang.compiler.passes.main import SubNodeTabPass
 from jaclang.utils.test import TestCase
@@ -18,8 +19,15 @@ class SubNodePassTests(TestCase):
             file_path=self.examples_abs_path("manual_code/circle.jac"),
             target=SubNodeTabPass,
         )
+
+        def post_order(node: ast.AstNode) -> list[ast.AstNode]:
+            return [j for i in node.kid for j in [*post_order(i), i]]
+
         for i in code_gen.ir.kid[1].kid:
-            for k, v in i._sub_node_tab.items():
-                for n in v:
-                    self.assertIn(n, code_gen.get_all_sub_nodes(i, k, brute_force=True))
+            assert i._sub_node_tab
+            for k in i._sub_node_tab.nodes:
+                self.assertEqual(
+                    code_gen.get_all_sub_nodes(i, k),
+                    [j for j in post_order(i) if type(j) is k],
+                )
         self.assertFalse(code_gen.errors_had)
@@ -1,9 +1,12 @@
 """Test pass module."""
 
+import os
 from typing import List
 
+import jaclang.compiler.passes.main.type_check_pass as tcp
 from jaclang.compiler.compile import jac_file_to_pass
 from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+from jaclang.settings import settings
 from jaclang.utils.lang_tools import AstTool
 from jaclang.utils.test import TestCase
 
@@ -49,6 +52,39 @@ class MypyTypeCheckPassTests(TestCase):
         ]:
             self.assertIn(i, errs + files)
 
+    def test_warm_build_reuse(self) -> None:
+        """Test warm type checks reuse the manager and report the same errors."""
+        messages = []
+        managers = []
+        func = self.fixture_abs_path("func.jac")
+        compiler_dir = os.path.dirname(os.path.dirname(os.path.dirname(tcp.__file__)))
+        other = os.path.join(compiler_dir, "tests", "fixtures", "hello_world.jac")
+        try:
+            for warm, path in (
+                (False, func),
+                (True, func),
+                (True, other),
+                (True, func),
+            ):
+                settings.mypy_warm_cache = warm
+                type_checked = jac_file_to_pass(
+                    file_path=path, schedule=py_code_gen_typed
+                )
+                if path == func:
+                    messages.append(sorted(str(i) for i in type_checked.warnings_had))
+                    warm_build = tcp.warm_builds.get(os.path.dirname(func))
+                    managers.append(warm_build and warm_build.manager)
+        finally:
+            settings.mypy_warm_cache = False
+            tcp.warm_builds.clear()
+        self.assertTrue(messages[0])
+        self.assertEqual(messages[0], messages[1])
+        self.assertEqual(messages[0], messages[2])
+        self.assertIsNotNone(managers[1])
+        # checks of another module path keep their own warm build
+        self.assertIs(managers[1], managers[2])
+        self.assertNotIn("func", managers[2].modules)
+
     def test_type_coverage(self) -> None:
         """Testing for type info coverage in sym_tab via ast."""
         out = AstTool().ir(["ast", f"{self.fixture_abs_path('type_info.jac')}"])
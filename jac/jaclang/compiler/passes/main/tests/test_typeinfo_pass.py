@@ -1,8 +1,13 @@
 """Test pass module."""
 
+import gc
+import weakref
+
+import jaclang.compiler.passes.main.type_check_pass as tcp
 from jaclang.compiler.compile import jac_file_to_pass
 from jaclang.compiler.passes.main.fuse_typeinfo_pass import FuseTypeInfoPass
 from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+from jaclang.settings import settings
 from jaclang.utils.test import TestCase
 
 
@@ -27,3 +32,22 @@ class TestFuseTypeInfo(TestCase):
         ]
         for type_info in type_info_list:
             self.assertIn(type_info, str(gen_ast))
+
+    def test_repeated_compile_memory(self) -> None:
+        """Test type info of repeated compilations is released."""
+        compiled = []
+        try:
+            settings.mypy_warm_cache = True
+            for _ in range(100):
+                ir = jac_file_to_pass(
+                    self.fixture_abs_path("func.jac"), schedule=py_code_gen_typed
+                ).ir
+                compiled.append(weakref.ref(ir))
+        finally:
+            settings.mypy_warm_cache = False
+            tcp.warm_builds.clear()
+        self.assertEqual(ir.expr_types, {})
+        self.assertIn("Type: builtins.str", ir.pp())
+        del ir
+        gc.collect()
+        self.assertEqual([i for i in compiled if i() is not None], [])
@@ -4,14 +4,23 @@ This is used to call mypy type checking into Jac files by integrating
 mypy apis into Jac and use jac py ast in it.
 """
 
+import ast as ast3
 import os
 import pathlib
 import sys
+import threading
+from collections import OrderedDict
+from typing import Optional, TYPE_CHECKING, cast
 
 import jaclang.compiler.absyntree as ast
 import jaclang.compiler.passes.utils.mypy_ast_build as myab
 from jaclang.compiler.constant import Constants as Con
 from jaclang.compiler.passes import Pass
+from jaclang.settings import settings
+
+if TYPE_CHECKING:
+    from jaclang.vendor.mypy.nodes import Node as VNode
+    from jaclang.vendor.mypy.types import Type as VType
 
 
 class JacTypeCheckPass(Pass):
@@ -33,20 +42,44 @@ class JacTypeCheckPass(Pass):
 
     def after_pass(self) -> None:
         """Call mypy api after traversing all the modules."""
+        self.check_cancelled()
         try:
             self.api(os.path.dirname(self.ir.loc.mod_path))
         except Exception as e:
             self.error(f"Unable to run type checking: {e}")
         return super().after_pass()
 
+    @staticmethod
     def default_message_cb(
-        self, filename: str | None, new_messages: list[str], is_serious: bool
+        filename: str | None, new_messages: list[str], is_serious: bool
     ) -> None:
         """Mypy errors reporter."""
 
     def api(self, top_module_path: str = "") -> None:
         """Call mypy APIs to implement type checking in Jac."""
-        # Creating mypy api objects
+        with type_check_lock:
+            if not settings.mypy_warm_cache:
+                self.check(self.new_manager(top_module_path))
+                return
+            warm = warm_builds.pop(top_module_path, None)
+            if warm and warm.is_valid():
+                self.reuse_manager(warm.manager)
+                graph = self.check(warm.manager, warm.graph)
+            else:
+                warm = WarmBuild(self.new_manager(top_module_path))
+                graph = self.check(warm.manager)
+            for module in self.__modules:
+                graph.pop(module.name, None)
+                warm.manager.modules.pop(module.name, None)
+                warm.manager.ast_cache.pop(module.name, None)
+            set_errors(warm.manager, myab.mye.Errors(warm.manager.options))
+            warm.keep(graph)
+            warm_builds[top_module_path] = warm
+            while len(warm_builds) > settings.mypy_warm_builds:
+                warm_builds.popitem(last=False)
+
+    def new_manager(self, top_module_path: str) -> myab.BuildManager:
+        """Create mypy build manager."""
         options = myab.myb.Options()
         options.ignore_missing_imports = True
         options.cache_dir = Con.JAC_MYPY_CACHE
@@ -58,7 +91,7 @@ class JacTypeCheckPass(Pass):
         search_paths = myab.compute_search_paths([], options, str(self.__path))
         plugin, snapshot = myab.load_plugins(options, errors, sys.stdout, [])
 
-        manager = myab.BuildManager(
+        return myab.BuildManager(
             data_dir=".",
             search_paths=search_paths,
             ignore_prefix=os.getcwd(),
@@ -75,7 +108,21 @@ class JacTypeCheckPass(Pass):
             stderr=sys.stderr,
         )
 
-        mypy_graph: myab.Graph = {}
+    def reuse_manager(self, manager: myab.BuildManager) -> None:
+        """Report errors of a warm build manager to this pass."""
+        set_errors(manager, myab.Errors(self, manager.options))
+        manager.flush_errors = self.default_message_cb
+        manager.fscache.flush()
+        manager.find_module_cache.clear()
+        myab.mypy_to_jac_node_map.clear()
+
+    def check(
+        self, manager: myab.BuildManager, old_graph: Optional[myab.Graph] = None
+    ) -> myab.Graph:
+        """Type check the modules, reusing the analyzed old graph if given."""
+        options = manager.options
+        errors = manager.errors
+        graph: myab.Graph = dict(old_graph or {})
         new_modules = []
         for module in self.__modules:
             tree = myab.ASTConverter(
@@ -84,6 +131,7 @@ class JacTypeCheckPass(Pass):
                 errors=errors,
                 strip_function_bodies=False,
                 path=module.loc.mod_path,
+                skipped_bodies=self.skipped_bodies(module),
             ).visit(module.gen.py_ast[0])
 
             st = myab.State(
@@ -94,34 +142,130 @@ class JacTypeCheckPass(Pass):
                 root_source=False,
                 ast_override=tree,
             )
-            mypy_graph[module.name] = st
+            graph[module.name] = st
             new_modules.append(st)
 
         if not isinstance(self.ir, ast.Module):
             raise self.ice("Expected module node. Impossible")
-        mypy_graph = myab.load_graph(
-            [
-                myab.BuildSource(
-                    path=str(self.__path / "typeshed" / "stdlib" / "builtins.pyi"),
-                    module="builtins",
-                ),
-            ],
+        graph = myab.load_graph(
+            (
+                []
+                if "builtins" in graph
+                else [
+                    myab.BuildSource(
+                        path=str(self.__path / "typeshed" / "stdlib" / "builtins.pyi"),
+                        module="builtins",
+                    ),
+                ]
+            ),
             manager,
-            old_graph=mypy_graph,
+            old_graph=graph,
             new_modules=new_modules,  # To parse the dependancies of modules
         )
-        mypy_graph = {
-            k: v
-            for k, v in mypy_graph.items()
-            if (
-                k.startswith("jaclang.plugin")
-                or not (k.startswith("jaclang.") or k.startswith("mypy."))
-            )
-        }
+        mypy_graph = {k: v for k, v in graph.items() if is_checked(k)}
         for i in mypy_graph:
             self.ir.py_mod_dep_map[i] = mypy_graph[i].xpath
             for j in mypy_graph[i].dependencies:
                 self.ir.py_mod_dep_map[j] = str(
                     myab.find_module_with_reason(j, manager)
                 )
-        myab.process_graph(mypy_graph, manager)
+        expr_types: dict[VNode, VType] = {}
+        self.ir.expr_types = expr_types
+        # mypy is the vendored package at runtime, only its import name differs
+        manager.expr_types = cast(
+            dict[myab.mypy_nodes.Node, myab.mycke.Type], expr_types
+        )
+        if old_graph is None:
+            myab.process_graph(mypy_graph, manager)
+        else:
+            myab.process_new_modules(
+                graph, {i.id for i in new_modules if is_checked(i.id)}, manager
+            )
+        manager.expr_types = {}
+        myab.mypy_to_jac_node_map.clear()
+        return graph
+
+    @staticmethod
+    def skipped_bodies(module: ast.Module) -> set[ast3.AST]:
+        """Get functions of reused elements whose bodies need no checking."""
+        skipped: set[ast3.AST] = set()
+        for element in module.reused_elements:
+            for ability in [element, *element.get_all_sub_nodes(ast.Ability)]:
+                # modules imported by the element are part of its sub nodes
+                if (
+                    not isinstance(ability, ast.Ability)
+                    or not isinstance(ability.body, ast.SubNodeList)
+                    or ability.loc.mod_path != module.loc.mod_path
+                    or not ability.gen.py_ast
+                ):
+                    continue
+                func = ability.gen.py_ast[0]
+                # attributes assigned in a body and yields shape the types
+                # other code sees, such bodies are always checked
+                if not any(
+                    isinstance(i, (ast3.Yield, ast3.YieldFrom))
+                    or (
+                        isinstance(i, ast3.Attribute)
+                        and isinstance(i.ctx, ast3.Store)
+                        and isinstance(i.value, ast3.Name)
+                        and i.value.id == "self"
+                    )
+                    for i in ast3.walk(func)
+                ):
+                    skipped.add(func)
+        return skipped
+
+
+def set_errors(manager: myab.BuildManager, errors: myab.mye.Errors) -> None:
+    """Report errors of a build manager to another errors object."""
+    manager.errors = errors
+    manager.semantic_analyzer.errors = errors
+    manager.semantic_analyzer.msg.errors = errors
+
+
+def is_checked(module: str) -> bool:
+    """Check module is type checked rather than only loaded."""
+    return module.startswith("jaclang.plugin") or not (
+        module.startswith("jaclang.") or module.startswith("mypy.")
+    )
+
+
+class WarmBuild:
+    """Type checked mypy graph kept between checks of one module path."""
+
+    def __init__(self, manager: myab.BuildManager) -> None:
+        """Wrap a fresh build manager."""
+        self.manager = manager
+        self.graph: myab.Graph = {}
+        self.stats: dict[str, tuple[int, int]] = {}
+
+    def keep(self, graph: myab.Graph) -> None:
+        """Keep analyzed graph, recording the files it was built from."""
+        self.graph = graph
+        for state in graph.values():
+            state.free_state()
+            if state.path and state.path not in self.stats:
+                try:
+                    stat = os.stat(state.path)
+                except OSError:
+                    continue
+                self.stats[state.path] = (stat.st_mtime_ns, stat.st_size)
+
+    def is_valid(self) -> bool:
+        """Check graph was built from unchanged files."""
+        for path, (mtime, size) in self.stats.items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return False
+            if (stat.st_mtime_ns, stat.st_size) != (mtime, size):
+                return False
+        return True
+
+
+# module path -> warm build of its checks, least recently used first,
+# see settings.mypy_warm_cache
+warm_builds: OrderedDict[str, WarmBuild] = OrderedDict()
+# mypy keeps process global state (mypy.state, mypy_to_jac_node_map), so type
+# checks run one at a time, callers wanting parallel analyses queue them instead
+type_check_lock = threading.Lock()
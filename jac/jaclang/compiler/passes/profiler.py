@@ -0,0 +1,156 @@
+"""Profiler of compiler passes and their AST node handlers.
+
+While a profiler is active every pass run and every enter_*/exit_* handler call is
+a frame on a stack. Frames are aggregated by name for the JSON report and by full
+stack for flamegraph compatible collapsed stacks.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from functools import wraps
+from time import perf_counter
+from typing import Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jaclang.compiler.passes.ir_pass import Handler, Pass
+
+
+class Frame:
+    """Running pass or handler call."""
+
+    def __init__(self, name: str, memory: int) -> None:
+        """Start frame."""
+        self.name = name
+        self.memory = memory
+        self.child_time = 0.0
+        self.start = perf_counter()
+
+
+class Stat:
+    """Aggregated timings of a pass or handler."""
+
+    def __init__(self) -> None:
+        """Initialize stat."""
+        self.calls = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+        self.memory = 0
+
+    def as_dict(self) -> dict:
+        """Get stat as JSON serializable dict."""
+        return {
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "self_time": self.self_time,
+            "memory": self.memory,
+        }
+
+
+class CompileProfiler:
+    """Collect wall time, calls and allocated memory of passes and handlers."""
+
+    def __init__(self, trace_memory: bool = True) -> None:
+        """Initialize profiler."""
+        self.trace_memory = trace_memory
+        self.stack: list[Frame] = []
+        self.passes: dict[str, Stat] = {}
+        self.handlers: dict[str, Stat] = {}
+        # collapsed stack -> self time
+        self.stacks: dict[str, float] = {}
+        self.total_time = 0.0
+
+    def __enter__(self) -> CompileProfiler:
+        """Start profiling passes."""
+        from jaclang.compiler.passes.ir_pass import Pass
+
+        if self.trace_memory:
+            tracemalloc.start()
+        Pass.profiler = self
+        Pass.clear_dispatch_tables()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop profiling passes."""
+        from jaclang.compiler.passes.ir_pass import Pass
+
+        Pass.profiler = None
+        Pass.clear_dispatch_tables()
+        if self.trace_memory:
+            tracemalloc.stop()
+
+    def traced_memory(self) -> int:
+        """Get currently allocated memory."""
+        return tracemalloc.get_traced_memory()[0] if self.trace_memory else 0
+
+    def push(self, name: str) -> None:
+        """Enter a frame."""
+        self.stack.append(Frame(name, self.traced_memory()))
+
+    def pop(self, stats: dict[str, Stat]) -> None:
+        """Leave current frame and record it."""
+        frame = self.stack.pop()
+        elapsed = perf_counter() - frame.start
+        self_time = elapsed - frame.child_time
+        path = ";".join([i.name for i in self.stack] + [frame.name])
+        self.stacks[path] = self.stacks.get(path, 0.0) + self_time
+        stat = stats.setdefault(frame.name, Stat())
+        stat.calls += 1
+        stat.self_time += self_time
+        # recursive frames are already counted by their outermost call
+        if all(i.name != frame.name for i in self.stack):
+            stat.total_time += elapsed
+            stat.memory += self.traced_memory() - frame.memory
+        if self.stack:
+            self.stack[-1].child_time += elapsed
+        else:
+            self.total_time += elapsed
+
+    def run_pass(self, pass_: Pass, run: Callable[[], None]) -> None:
+        """Run a pass as a frame."""
+        self.push(type(pass_).__name__)
+        try:
+            run()
+        finally:
+            self.pop(self.passes)
+
+    def wrap(self, cls: type, handler: Handler) -> Handler:
+        """Wrap a node handler of a pass class to be recorded."""
+        if handler is None:
+            return None
+        name = f"{cls.__name__}.{handler.__name__}"
+        func = handler
+
+        @wraps(func)
+        def profiled(pass_: Pass, node: object) -> None:
+            self.push(name)
+            try:
+                func(pass_, node)  # type: ignore[arg-type]
+            finally:
+                self.pop(self.handlers)
+
+        return profiled
+
+    def report(self) -> dict:
+        """Get JSON serializable report sorted by total time."""
+
+        def ordered(stats: dict[str, Stat]) -> dict:
+            return {
+                name: stat.as_dict()
+                for name, stat in sorted(
+                    stats.items(), key=lambda i: i[1].total_time, reverse=True
+                )
+            }
+
+        return {
+            "total_time": self.total_time,
+            "passes": ordered(self.passes),
+            "handlers": ordered(self.handlers),
+        }
+
+    def collapsed_stacks(self, unit: float = 1e6) -> str:
+        """Get self times as collapsed stacks, in microseconds by default."""
+        return "\n".join(
+            f"{path} {round(self_time * unit)}"
+            for path, self_time in sorted(self.stacks.items())
+        )
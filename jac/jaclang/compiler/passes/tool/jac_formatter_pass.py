@@ -22,27 +22,45 @@ class JacFormatPass(Pass):
         self.indent_size = 4
         self.indent_level = 0
         self.MAX_LINE_LENGTH = int(float(settings.max_line_length) / 2)
+        self.terminal_index: dict[int, int] = (
+            {id(tok): i for i, tok in enumerate(self.ir.terminals)}
+            if isinstance(self.ir, ast.Module)
+            else {}
+        )
+        # code emitted to the node being exited, joined into gen.jac after exit
+        self.parts: list[str] = []
+        self.multiline = False
 
     def enter_node(self, node: ast.AstNode) -> None:
         """Enter node."""
         node.gen.jac = ""
         super().enter_node(node)
 
+    def exit_node(self, node: ast.AstNode) -> None:
+        """Exit node."""
+        self.parts = [node.gen.jac] if node.gen.jac else []
+        self.multiline = "\n" in node.gen.jac
+        super().exit_node(node)
+        node.gen.jac = "".join(self.parts)
+        self.parts = []
+
     def token_before(self, node: ast.Token) -> Optional[ast.Token]:
         """Token before."""
         if not isinstance(self.ir, ast.Module):
             raise self.ice("IR must be module. Impossible")
-        if self.ir.terminals.index(node) == 0:
+        index = self.terminal_index[id(node)]
+        if index == 0:
             return None
-        return self.ir.terminals[self.ir.terminals.index(node) - 1]
+        return self.ir.terminals[index - 1]
 
     def token_after(self, node: ast.Token) -> Optional[ast.Token]:
         """Token after."""
         if not isinstance(self.ir, ast.Module):
             raise self.ice("IR must be module. Impossible")
-        if self.ir.terminals.index(node) == len(self.ir.terminals) - 1:
+        index = self.terminal_index[id(node)]
+        if index == len(self.ir.terminals) - 1:
             return None
-        return self.ir.terminals[self.ir.terminals.index(node) + 1]
+        return self.ir.terminals[index + 1]
 
     def indent_str(self) -> str:
         """Return string for indent."""
@@ -50,13 +68,39 @@ class JacFormatPass(Pass):
 
     def emit(self, node: ast.AstNode, s: str, strip_mode: bool = True) -> None:
         """Emit code to node."""
-        indented_str = re.sub(r"\n(?!\n)", f"\n{self.indent_str()}", s)
-        node.gen.jac += self.indent_str() + indented_str
-        if "\n" in node.gen.jac:
-            if strip_mode:
+        indent = self.indent_str()
+        if "\n" in s:
+            s = re.sub(r"\n(?!\n)", f"\n{indent}", s)
+        if node is not self.cur_node:
+            node.gen.jac += indent + s
+            if strip_mode and "\n" in node.gen.jac:
                 node.gen.jac = node.gen.jac.rstrip(" ")
-            else:
-                node.gen.jac = node.gen.jac
+            return
+        self.parts.append(indent + s)
+        self.multiline = self.multiline or "\n" in s
+        if strip_mode and self.multiline:
+            while self.parts and not self.parts[-1].rstrip(" "):
+                self.parts.pop()
+            if self.parts:
+                self.parts[-1] = self.parts[-1].rstrip(" ")
+
+    def jac_of(self, node: ast.AstNode) -> str:
+        """Get code emitted to node so far."""
+        if node is self.cur_node:
+            self.parts = ["".join(self.parts)]
+            return self.parts[0]
+        return node.gen.jac
+
+    def ends_with(self, node: ast.AstNode, suffix: str) -> bool:
+        """Check code emitted to node so far ends with suffix."""
+        if node is not self.cur_node:
+            return node.gen.jac.endswith(suffix)
+        tail = ""
+        for part in reversed(self.parts):
+            tail = part + tail
+            if len(tail) >= len(suffix):
+                break
+        return tail.endswith(suffix)
 
     def emit_ln(self, node: ast.AstNode, s: str) -> None:
         """Emit code to node."""
@@ -138,7 +182,7 @@ class JacFormatPass(Pass):
                     isinstance(i, ast.Architype)
                     and isinstance(last_element, ast.Architype)
                     and i.loc.first_line - last_element.loc.last_line == 2
-                    and not node.gen.jac.endswith("\n\n")
+                    and not self.ends_with(node, "\n\n")
                 ):
                     self.emit_ln(node, "")
                 self.emit_ln(node, i.gen.jac)
@@ -177,7 +221,7 @@ class JacFormatPass(Pass):
             prev_token = i
         if isinstance(
             node.kid[-1], (ast.Semi, ast.CommentToken)
-        ) and not node.gen.jac.endswith("\n"):
+        ) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_module_code(self, node: ast.ModuleCode) -> None:
@@ -250,10 +294,10 @@ class JacFormatPass(Pass):
                     self.emit(node, f" {stmt.value}")
                 elif stmt.name == Tok.RBRACE:
                     self.indent_level = max(0, self.indent_level - 1)
-                    if stmt.parent and stmt.parent.gen.jac.strip() == "{":
+                    if stmt.parent and self.jac_of(stmt.parent).strip() == "{":
                         self.emit(node, f"{stmt.value}")
                     else:
-                        if not node.gen.jac.endswith("\n"):
+                        if not self.ends_with(node, "\n"):
                             self.emit_ln(node, "")
                         self.emit(node, f"{stmt.value}")
                 elif isinstance(stmt, ast.CommentToken):
@@ -273,7 +317,7 @@ class JacFormatPass(Pass):
                             self.emit_ln(node, "")
                             self.indent_level += 1
                     else:
-                        if not node.gen.jac.endswith("\n"):
+                        if not self.ends_with(node, "\n"):
                             self.indent_level -= 1
                             self.emit_ln(node, "")
                             self.indent_level += 1
@@ -358,7 +402,7 @@ class JacFormatPass(Pass):
             if isinstance(i, ast.CommentToken):
                 if i.is_inline:
                     self.emit(node, f" {i.gen.jac}")
-                elif not node.gen.jac.endswith("\n"):
+                elif not self.ends_with(node, "\n"):
                     self.emit_ln(node, "")
                     self.emit_ln(node, i.gen.jac)
                 else:
@@ -378,7 +422,7 @@ class JacFormatPass(Pass):
                     start = False
                 else:
                     self.emit(node, f" {i.gen.jac}")
-        if isinstance(node.kid[-1], ast.Semi) and not node.gen.jac.endswith("\n"):
+        if isinstance(node.kid[-1], ast.Semi) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_func_call(self, node: ast.FuncCall) -> None:
@@ -523,7 +567,7 @@ class JacFormatPass(Pass):
                     self.emit(node, i.gen.jac)
                     if isinstance(prev_token, ast.Semi):
                         self.emit_ln(node, "")
-                elif not node.gen.jac.endswith("\n"):
+                elif not self.ends_with(node, "\n"):
                     self.indent_level -= 1
                     self.emit_ln(node, "")
                     self.indent_level += 1
@@ -552,7 +596,7 @@ class JacFormatPass(Pass):
                 else:
                     self.emit(node, f" {i.gen.jac}")
             prev_token = i
-        if isinstance(node.kid[-1], ast.Semi) and not node.gen.jac.endswith("\n"):
+        if isinstance(node.kid[-1], ast.Semi) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_event_signature(self, node: ast.EventSignature) -> None:
@@ -596,7 +640,7 @@ class JacFormatPass(Pass):
             if isinstance(i, ast.CommentToken):
                 if i.is_inline:
                     self.emit(node, f" {i.gen.jac}")
-                elif not node.gen.jac.endswith("\n"):
+                elif not self.ends_with(node, "\n"):
                     self.emit_ln(node, "")
                     self.emit_ln(node, i.gen.jac)
                 else:
@@ -611,7 +655,7 @@ class JacFormatPass(Pass):
                     start = False
                 else:
                     self.emit(node, f" {i.gen.jac}")
-        if isinstance(node.kid[-1], ast.Semi) and not node.gen.jac.endswith("\n"):
+        if isinstance(node.kid[-1], ast.Semi) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_arch_def(self, node: ast.ArchDef) -> None:
@@ -627,7 +671,7 @@ class JacFormatPass(Pass):
             if isinstance(i, ast.CommentToken):
                 if i.is_inline:
                     self.emit(node, f" {i.gen.jac}")
-                elif not node.gen.jac.endswith("\n"):
+                elif not self.ends_with(node, "\n"):
                     self.indent_level -= 1
                     self.emit_ln(node, "")
                     self.indent_level += 1
@@ -642,7 +686,7 @@ class JacFormatPass(Pass):
                     start = False
                 else:
                     self.emit(node, f" {i.gen.jac}")
-        if isinstance(node.kid[-1], ast.Semi) and not node.gen.jac.endswith("\n"):
+        if isinstance(node.kid[-1], ast.Semi) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_ability(self, node: ast.Ability) -> None:
@@ -679,7 +723,7 @@ class JacFormatPass(Pass):
                         self.indent_level -= 1
                         self.emit_ln(node, "")
                         self.indent_level += 1
-                elif not node.gen.jac.endswith("\n"):
+                elif not self.ends_with(node, "\n"):
                     self.indent_level -= 1
                     self.emit_ln(node, "")
                     self.indent_level += 1
@@ -754,7 +798,7 @@ class JacFormatPass(Pass):
                 if i.is_inline:
                     self.emit(node, f" {i.gen.jac}")
                     self.emit_ln(node, "")
-                elif not node.gen.jac.endswith("\n"):
+                elif not self.ends_with(node, "\n"):
                     self.emit(node, "\n")
                     self.emit_ln(node, i.gen.jac)
                 else:
@@ -781,7 +825,7 @@ class JacFormatPass(Pass):
                 self.emit(node, f"{i.gen.jac} ")
                 if i.gen.jac == "static":
                     indent_val = indent_val * 3
-        if isinstance(node.kid[-1], ast.Semi) and not node.gen.jac.endswith("\n"):
+        if isinstance(node.kid[-1], ast.Semi) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_arch_ref(self, node: ast.ArchRef) -> None:
@@ -793,7 +837,7 @@ class JacFormatPass(Pass):
             if isinstance(i, ast.CommentToken):
                 if i.is_inline:
                     self.emit(node, f" {i.gen.jac}")
-                elif not node.gen.jac.endswith("\n"):
+                elif not self.ends_with(node, "\n"):
                     self.indent_level -= 1
                     self.emit_ln(node, "")
                     self.indent_level += 1
@@ -806,7 +850,7 @@ class JacFormatPass(Pass):
                 self.emit(node, f"{i.gen.jac} ")
             else:
                 self.emit(node, i.gen.jac)
-        if isinstance(node.kid[-1], ast.Semi) and not node.gen.jac.endswith("\n"):
+        if isinstance(node.kid[-1], ast.Semi) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_param_var(self, node: ast.ParamVar) -> None:
@@ -869,7 +913,7 @@ class JacFormatPass(Pass):
             prev_token = i
         if isinstance(
             node.kid[-1], (ast.Semi, ast.CommentToken)
-        ) and not node.gen.jac.endswith("\n"):
+        ) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_enum_def(self, node: ast.EnumDef) -> None:
@@ -900,7 +944,7 @@ class JacFormatPass(Pass):
                     self.emit(node, f" {i.gen.jac}")
         if isinstance(
             node.kid[-1], (ast.Semi, ast.CommentToken)
-        ) and not node.gen.jac.endswith("\n"):
+        ) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_atom_trailer(self, node: ast.AtomTrailer) -> None:
@@ -991,7 +1035,7 @@ class JacFormatPass(Pass):
                 )
         if isinstance(
             node.kid[-1], (ast.Semi, ast.CommentToken)
-        ) and not node.gen.jac.endswith("\n"):
+        ) and not self.ends_with(node, "\n"):
             self.emit_ln(node, node.kid[-1].value)
 
     def exit_compare_expr(self, node: ast.CompareExpr) -> None:
@@ -1006,7 +1050,7 @@ class JacFormatPass(Pass):
             self.emit(node, f"{node.ops[i].value} {node.rights[i].gen.jac}")
         if isinstance(
             node.kid[-1], (ast.Semi, ast.CommentToken)
-        ) and not node.gen.jac.endswith("\n"):
+        ) and not self.ends_with(node, "\n"):
             self.emit_ln(node, node.kid[-1].value)
 
     def exit_has_var(self, node: ast.HasVar) -> None:
@@ -1028,8 +1072,8 @@ class JacFormatPass(Pass):
                 self.emit(node, i.gen.jac)
             else:
                 self.emit(node, f" {i.gen.jac}")
-        if isinstance(node.kid[-1], ast.CommentToken) and not node.gen.jac.endswith(
-            "\n"
+        if isinstance(node.kid[-1], ast.CommentToken) and not self.ends_with(
+            node, "\n"
         ):
             self.emit_ln(node, "")
 
@@ -1058,7 +1102,7 @@ class JacFormatPass(Pass):
                     self.emit(node, f" {i.gen.jac}")
         if isinstance(
             node.kid[-1], (ast.Semi, ast.CommentToken)
-        ) and not node.gen.jac.endswith("\n"):
+        ) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_else_if(self, node: ast.ElseIf) -> None:
@@ -1138,7 +1182,7 @@ class JacFormatPass(Pass):
                     self.emit(node, f" {i.gen.jac}")
         if isinstance(
             node.kid[-1], (ast.Semi, ast.CommentToken)
-        ):  # and not node.gen.jac.endswith("\n"):
+        ):  # and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_iter_for_stmt(self, node: ast.IterForStmt) -> None:
@@ -1196,7 +1240,7 @@ class JacFormatPass(Pass):
                 if i.is_inline:
                     self.emit(node, f" {i.gen.jac}")
                 else:
-                    if not node.gen.jac.endswith("\n"):
+                    if not self.ends_with(node, "\n"):
                         self.emit_ln(node, "")
                     self.emit_ln(node, "")
                     self.emit(node, i.gen.jac)
@@ -1210,7 +1254,7 @@ class JacFormatPass(Pass):
                     self.emit(node, f" {i.gen.jac}")
         if isinstance(
             node.kid[-1], (ast.Semi, ast.CommentToken)
-        ) and not node.gen.jac.endswith("\n"):
+        ) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_except(self, node: ast.Except) -> None:
@@ -1232,7 +1276,7 @@ class JacFormatPass(Pass):
                 if i.is_inline:
                     self.emit(node, f" {i.gen.jac}")
                 else:
-                    if not node.gen.jac.endswith("\n"):
+                    if not self.ends_with(node, "\n"):
                         self.emit_ln(node, "")
                     self.emit_ln(node, "")
                     self.emit(node, i.gen.jac)
@@ -1246,7 +1290,7 @@ class JacFormatPass(Pass):
                     self.emit(node, f" {i.gen.jac}")
         if isinstance(
             node.kid[-1], (ast.Semi, ast.CommentToken)
-        ) and not node.gen.jac.endswith("\n"):
+        ) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_finally_stmt(self, node: ast.FinallyStmt) -> None:
@@ -1277,7 +1321,7 @@ class JacFormatPass(Pass):
                 if i.is_inline:
                     self.emit(node, f" {i.gen.jac}")
                 else:
-                    if not node.gen.jac.endswith("\n"):
+                    if not self.ends_with(node, "\n"):
                         self.emit_ln(node, "")
                     self.emit_ln(node, "")
                     self.emit(node, i.gen.jac)
@@ -1291,7 +1335,7 @@ class JacFormatPass(Pass):
                     self.emit(node, f" {i.gen.jac}")
         if isinstance(
             node.kid[-1], (ast.Semi, ast.CommentToken)
-        ) and not node.gen.jac.endswith("\n"):
+        ) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_with_stmt(self, node: ast.WithStmt) -> None:
@@ -1446,7 +1490,7 @@ class JacFormatPass(Pass):
             prev_token = kid
         if isinstance(
             node.kid[-1], (ast.Semi, ast.CommentToken)
-        ) and not node.gen.jac.endswith("\n"):
+        ) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_architype(self, node: ast.Architype) -> None:
@@ -1491,7 +1535,7 @@ class JacFormatPass(Pass):
                 else:
                     self.emit(node, f" {i.gen.jac}")
             prev_token = i
-        if isinstance(node.kid[-1], ast.Semi) and not node.gen.jac.endswith("\n"):
+        if isinstance(node.kid[-1], ast.Semi) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_f_string(self, node: ast.FString) -> None:
@@ -1968,7 +2012,7 @@ class JacFormatPass(Pass):
                 if i.is_inline:
                     self.emit(node, f" {i.gen.jac}")
                 else:
-                    if not node.gen.jac.endswith("\n"):
+                    if not self.ends_with(node, "\n"):
                         self.emit_ln(node, "")
                     self.emit_ln(node, "")
                     self.emit(node, i.gen.jac)
@@ -2019,7 +2063,7 @@ class JacFormatPass(Pass):
                 if i.is_inline:
                     self.emit(node, f" {i.gen.jac}")
                 else:
-                    if not node.gen.jac.endswith("\n"):
+                    if not self.ends_with(node, "\n"):
                         self.emit_ln(node, "")
                     self.emit_ln(node, "")
                     self.emit(node, i.gen.jac)
@@ -2149,7 +2193,7 @@ class JacFormatPass(Pass):
             if isinstance(i, ast.CommentToken):
                 if i.is_inline:
                     self.emit(node, f" {i.gen.jac}")
-                elif not node.gen.jac.endswith("\n"):
+                elif not self.ends_with(node, "\n"):
                     self.emit_ln(node, "")
                     self.emit_ln(node, i.gen.jac)
                 else:
@@ -2160,7 +2204,7 @@ class JacFormatPass(Pass):
                 self.emit(node, f"{i.gen.jac} ")
             else:
                 self.emit(node, i.gen.jac)
-        if isinstance(node.kid[-1], ast.Semi) and not node.gen.jac.endswith("\n"):
+        if isinstance(node.kid[-1], ast.Semi) and not self.ends_with(node, "\n"):
             self.emit_ln(node, "")
 
     def exit_typed_ctx_block(self, node: ast.TypedCtxBlock) -> None:
@@ -3,14 +3,12 @@
 from __future__ import annotations
 
 import ast
+import copy
 import os
-from typing import Callable, TYPE_CHECKING, TextIO
+from typing import Callable, Optional, TYPE_CHECKING, TextIO
 
 from jaclang.compiler.absyntree import AstNode
 from jaclang.compiler.passes import Pass
-from jaclang.compiler.passes.main.fuse_typeinfo_pass import (
-    FuseTypeInfoPass,
-)
 
 import mypy.build as myb
 import mypy.checkexpr as mycke
@@ -130,6 +128,7 @@ class BuildManager(myb.BuildManager):
             stderr,
         )
         mypy_to_jac_node_map = {}
+        self.expr_types: dict[mypy_nodes.Node, mycke.Type] = {}
 
     def parse_file(
         self,
@@ -177,20 +176,27 @@ class ExpressionChecker(mycke.ExpressionChecker):
         msg: mycke.MessageBuilder,
         plugin: mycke.Plugin,
         per_line_checking_time_ns: dict[int, int],
+        expr_types: dict[mypy_nodes.Node, mycke.Type] | None = None,
     ) -> None:
         """Override to mypy expression checker for direct AST pass through."""
         super().__init__(tc, msg, plugin, per_line_checking_time_ns)
+        self.expr_types = expr_types
+
+    def record_type(self, e: mycke.Expression, out: mycke.Type) -> None:
+        """Record expression type for FuseTypeInfoPass."""
+        if self.expr_types is not None:
+            self.expr_types[e] = out
 
     def visit_assert_type_expr(self, e: mycke.AssertTypeExpr) -> mycke.Type:
         """Type check AssertTypeExpr expression."""
         out = super().visit_assert_type_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_assignment_expr(self, e: mycke.AssignmentExpr) -> mycke.Type:
         """Type check AssignmentExpr expression."""
         out = super().visit_assignment_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_await_expr(
@@ -198,13 +204,13 @@ class ExpressionChecker(mycke.ExpressionChecker):
     ) -> mycke.Type:
         """Type check AwaitExpr expression."""
         out = super().visit_await_expr(e, allow_none_return)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_bytes_expr(self, e: mycke.BytesExpr) -> mycke.Type:
         """Type check BytesExpr expression."""
         out = super().visit_bytes_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_call_expr(
@@ -212,25 +218,25 @@ class ExpressionChecker(mycke.ExpressionChecker):
     ) -> mycke.Type:
         """Type check CallExpr expression."""
         out = super().visit_call_expr(e, allow_none_return)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_cast_expr(self, e: mycke.CastExpr) -> mycke.Type:
         """Type check CastExpr expression."""
         out = super().visit_cast_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_comparison_expr(self, e: mycke.ComparisonExpr) -> mycke.Type:
         """Type check ComparisonExpr expression."""
         out = super().visit_comparison_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_complex_expr(self, e: mycke.ComplexExpr) -> mycke.Type:
         """Type check ComplexExpr expression."""
         out = super().visit_complex_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_conditional_expr(
@@ -238,7 +244,7 @@ class ExpressionChecker(mycke.ExpressionChecker):
     ) -> mycke.Type:
         """Type check ConditionalExpr expression."""
         out = super().visit_conditional_expr(e, allow_none_return)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_dictionary_comprehension(
@@ -246,61 +252,61 @@ class ExpressionChecker(mycke.ExpressionChecker):
     ) -> mycke.Type:
         """Type check DictionaryComprehension expression."""
         out = super().visit_dictionary_comprehension(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_dict_expr(self, e: mycke.DictExpr) -> mycke.Type:
         """Type check DictExpr expression."""
         out = super().visit_dict_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_enum_call_expr(self, e: mycke.EnumCallExpr) -> mycke.Type:
         """Type check EnumCallExpr expression."""
         out = super().visit_enum_call_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_float_expr(self, e: mycke.FloatExpr) -> mycke.Type:
         """Type check FloatExpr expression."""
         out = super().visit_float_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_generator_expr(self, e: mycke.GeneratorExpr) -> mycke.Type:
         """Type check GeneratorExpr expression."""
         out = super().visit_generator_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_index_expr(self, e: mycke.IndexExpr) -> mycke.Type:
         """Type check IndexExpr expression."""
         out = super().visit_index_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_int_expr(self, e: mycke.IntExpr) -> mycke.Type:
         """Type check IntExpr expression."""
         out = super().visit_int_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_lambda_expr(self, e: mycke.LambdaExpr) -> mycke.Type:
         """Type check LambdaExpr expression."""
         out = super().visit_lambda_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_list_comprehension(self, e: mycke.ListComprehension) -> mycke.Type:
         """Type check ListComprehension expression."""
         out = super().visit_list_comprehension(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_list_expr(self, e: mycke.ListExpr) -> mycke.Type:
         """Type check ListExpr expression."""
         out = super().visit_list_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_member_expr(
@@ -308,97 +314,97 @@ class ExpressionChecker(mycke.ExpressionChecker):
     ) -> mycke.Type:
         """Type check MemberExpr expression."""
         out = super().visit_member_expr(e, is_lvalue)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_name_expr(self, e: mycke.NameExpr) -> mycke.Type:
         """Type check NameExpr expression."""
         out = super().visit_name_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_op_expr(self, e: mycke.OpExpr) -> mycke.Type:
         """Type check OpExpr expression."""
         out = super().visit_op_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_reveal_expr(self, e: mycke.RevealExpr) -> mycke.Type:
         """Type check RevealExpr expression."""
         out = super().visit_reveal_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_set_comprehension(self, e: mycke.SetComprehension) -> mycke.Type:
         """Type check SetComprehension expression."""
         out = super().visit_set_comprehension(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_set_expr(self, e: mycke.SetExpr) -> mycke.Type:
         """Type check SetExpr expression."""
         out = super().visit_set_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_slice_expr(self, e: mycke.SliceExpr) -> mycke.Type:
         """Type check SliceExpr expression."""
         out = super().visit_slice_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_star_expr(self, e: mycke.StarExpr) -> mycke.Type:
         """Type check StarExpr expression."""
         out = super().visit_star_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_str_expr(self, e: mycke.StrExpr) -> mycke.Type:
         """Type check StrExpr expression."""
         out = super().visit_str_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_super_expr(self, e: mycke.SuperExpr) -> mycke.Type:
         """Type check SuperExpr expression."""
         out = super().visit_super_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_tuple_expr(self, e: mycke.TupleExpr) -> mycke.Type:
         """Type check TupleExpr expression."""
         out = super().visit_tuple_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_type_alias_expr(self, e: mycke.TypeAliasExpr) -> mycke.Type:
         """Type check TypeAliasExpr expression."""
         out = super().visit_type_alias_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_type_var_expr(self, e: mycke.TypeVarExpr) -> mycke.Type:
         """Type check TypeVarExpr expression."""
         out = super().visit_type_var_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_type_var_tuple_expr(self, e: mycke.TypeVarTupleExpr) -> mycke.Type:
         """Type check TypeVarTupleExpr expression."""
         out = super().visit_type_var_tuple_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_unary_expr(self, e: mycke.UnaryExpr) -> mycke.Type:
         """Type check UnaryExpr expression."""
         out = super().visit_unary_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_yield_expr(self, e: mycke.YieldExpr) -> mycke.Type:
         """Type check YieldExpr expression."""
         out = super().visit_yield_expr(e)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
     def visit_yield_from_expr(
@@ -406,7 +412,7 @@ class ExpressionChecker(mycke.ExpressionChecker):
     ) -> mycke.Type:
         """Type check YieldFromExpr expression."""
         out = super().visit_yield_from_expr(e, allow_none_return)
-        FuseTypeInfoPass.node_type_hash[e] = out
+        self.record_type(e, out)
         return out
 
 
@@ -555,6 +561,8 @@ class State(myb.State):
                 self._type_checker.msg,
                 self._type_checker.plugin,
                 self.per_line_checking_time_ns,
+                # only types of Jac modules are fused back into the Jac ast
+                manager.expr_types if self.xpath.startswith("File:") else None,
             )
 
         return self._type_checker
@@ -666,6 +674,30 @@ class State(myb.State):
 class ASTConverter(myfp.ASTConverter):
     """Overrides to mypy AST converter for direct AST pass through."""
 
+    def __init__(
+        self,
+        *args,  # noqa: ANN002
+        skipped_bodies: Optional[set[ast.AST]] = None,
+        **kwargs,  # noqa: ANN003
+    ) -> None:
+        """Override to mypy AST converter to leave out checked function bodies."""
+        self.skipped_bodies = skipped_bodies or set()
+        super().__init__(*args, **kwargs)
+
+    def do_func_def(
+        self, n: ast.FunctionDef | ast.AsyncFunctionDef, is_coroutine: bool = False
+    ) -> mypy_nodes.FuncDef | mypy_nodes.Decorator:
+        """Override to mypy AST converter to stub out skipped function bodies."""
+        if n in self.skipped_bodies:
+            n = copy.copy(n)
+            n.body = [
+                ast.copy_location(
+                    ast.Expr(value=ast.copy_location(ast.Constant(...), n.body[0])),
+                    n.body[0],
+                )
+            ]
+        return super().do_func_def(n, is_coroutine)
+
     def visit(self, node: ast.AST | None) -> myfp.Any:  # noqa: ANN401
         """Override to mypy AST converter for direct AST pass through."""
         ret = super().visit(node)
@@ -922,6 +954,23 @@ def load_graph(
     return graph
 
 
+def process_new_modules(graph: Graph, new: set[str], manager: BuildManager) -> None:
+    """Process modules added to an already processed graph.
+
+    Modules outside of new are expected to be analyzed and loaded in the
+    manager, only the SCCs of the new modules are loaded from cache or checked.
+    """
+    rechecked: set[str] = set()
+    for ascc in myb.sorted_components(graph, new):
+        scc = myb.order_ascc(graph, ascc)
+        deps = {dep for id in scc for dep in graph[id].dependencies} - ascc
+        if all(graph[id].is_fresh() for id in scc) and not deps & rechecked:
+            myb.process_fresh_modules(graph, scc, manager)
+        else:
+            myb.process_stale_scc(graph, scc, manager)
+            rechecked.update(scc)
+
+
 __all__ = [
     "BuildManager",
     "State",
@@ -933,6 +982,7 @@ __all__ = [
     "load_graph",
     "load_plugins",
     "process_graph",
+    "process_new_modules",
     "Errors",
     "Options",
     "ASTConverter",
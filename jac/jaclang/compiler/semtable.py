@@ -98,16 +98,68 @@ class SemRegistry:
     def __init__(self) -> None:
         """Initialize the class."""
         self.registry: dict[SemScope, list[SemInfo]] = {}
+        # Indexes over the registry, scopes being keyed by their string
+        self.scopes: dict[str, SemScope] = {}
+        self.scope_order: dict[str, int] = {}
+        self.scope_names: dict[tuple[str, str], SemInfo] = {}
+        self.scope_types: dict[tuple[str, str], SemInfo] = {}
+        self.names: dict[str, tuple[str, SemInfo]] = {}
+        self.types: dict[str, tuple[str, SemInfo]] = {}
+
+    def __getstate__(self) -> dict:
+        """Pickle the registry only, indexes are rebuilt on load."""
+        return {"registry": self.registry}
+
+    def __setstate__(self, state: dict) -> None:
+        """Rebuild indexes of an unpickled registry."""
+        self.__init__()  # type: ignore[misc]
+        for scope, seminfos in state["registry"].items():
+            for seminfo in seminfos:
+                self.add(scope, seminfo)
 
     def add(self, scope: SemScope, seminfo: SemInfo) -> None:
         """Add semantic information to the registry."""
-        for k in self.registry.keys():
-            if str(k) == str(scope):
-                scope = k
-                break
-        else:
+        key = str(scope)
+        if key not in self.scopes:
+            self.scopes[key] = scope
+            self.scope_order[key] = len(self.scope_order)
             self.registry[scope] = []
-        self.registry[scope].append(seminfo)
+        self.registry[self.scopes[key]].append(seminfo)
+        if seminfo.name:
+            self.scope_names.setdefault((key, seminfo.name), seminfo)
+            self.index_first(self.names, seminfo.name, key, seminfo)
+        if seminfo.type:
+            self.scope_types.setdefault((key, seminfo.type), seminfo)
+            self.index_first(self.types, seminfo.type, key, seminfo)
+
+    def index_first(
+        self, index: dict[str, tuple[str, SemInfo]], val: str, key: str, info: SemInfo
+    ) -> None:
+        """Index info unless an earlier scope already has one for val."""
+        if val not in index or self.scope_order[index[val][0]] > self.scope_order[key]:
+            index[val] = (key, info)
+
+    def merge(self, other: SemRegistry) -> None:
+        """Add scopes of another registry not registered yet."""
+        for scope, seminfos in other.registry.items():
+            if str(scope) in self.scopes:
+                continue
+            for seminfo in seminfos:
+                self.add(scope, seminfo)
+
+    def filtered(self, scope: SemScope) -> SemRegistry:
+        """Get registry of a scope and its enclosing scopes."""
+        keys = []
+        cur: Optional[SemScope] = scope
+        while cur:
+            if str(cur) in self.scopes:
+                keys.append(str(cur))
+            cur = cur.parent
+        filtered_registry = SemRegistry()
+        for key in sorted(keys, key=self.scope_order.__getitem__):
+            for seminfo in self.registry[self.scopes[key]]:
+                filtered_registry.add(self.scopes[key], seminfo)
+        return filtered_registry
 
     def lookup(
         self,
@@ -117,29 +169,18 @@ class SemRegistry:
     ) -> tuple[Optional[SemScope], Optional[SemInfo | list[SemInfo]]]:
         """Lookup semantic information in the registry."""
         if scope:
-            for k, v in self.registry.items():
-                if str(k) == str(scope):
-                    if name:
-                        for i in v:
-                            if i.name == name:
-                                return k, i
-                    elif type:
-                        for i in v:
-                            if i.type == type:
-                                return k, i
-                    else:
-                        return k, v
-        else:
-            for k, v in self.registry.items():
-                if name:
-                    for i in v:
-                        if i.name == name:
-                            return k, i
-                elif type:
-                    for i in v:
-                        if i.type == type:
-                            return k, i
-        return None, None
+            key = str(scope)
+            if key not in self.scopes:
+                return None, None
+            if name:
+                seminfo = self.scope_names.get((key, name))
+            elif type:
+                seminfo = self.scope_types.get((key, type))
+            else:
+                return self.scopes[key], self.registry[self.scopes[key]]
+            return (self.scopes[key], seminfo) if seminfo else (None, None)
+        found = self.names.get(name) if name else self.types.get(type) if type else None
+        return (self.scopes[found[0]], found[1]) if found else (None, None)
 
     @property
     def module_scope(self) -> SemScope:
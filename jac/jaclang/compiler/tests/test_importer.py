@@ -1,10 +1,13 @@
 """Tests for Jac Loader."""
 
 import io
+import os
 import sys
+from tempfile import TemporaryDirectory
 
 from jaclang import jac_import
 from jaclang.cli import cli
+from jaclang.compiler.cache import cache_targets, is_cached
 from jaclang.runtimelib.machine import JacMachine, JacProgram
 from jaclang.utils.test import TestCase
 
@@ -62,3 +65,46 @@ class TestLoader(TestCase):
             "{SomeObj(a=10): 'check'} [MyObj(apple=5, banana=7), MyObj(apple=5, banana=7)]",
             stdout_value,
         )
+
+    def test_bytecode_cache_manifest(self) -> None:
+        """Test cached bytecode is invalidated by source, annex and dep changes."""
+        with TemporaryDirectory() as tmp:
+            files = {
+                "main.jac": "import:jac dep;\ncan greet -> str;\n",
+                "main.impl.jac": ":can:greet -> str { return 'hi ' + dep.name; }\n",
+                "dep.jac": "glob name = 'one';\n",
+            }
+            paths = {name: os.path.join(tmp, name) for name in files}
+            for name, code in files.items():
+                with open(paths[name], "w") as f:
+                    f.write(code)
+
+            program = JacProgram(mod_bundle=None, bytecode=None, sem_ir=None)
+            self.assertIsNotNone(program.get_bytecode("main", paths["main.jac"], tmp))
+            for name in files:
+                self.assertTrue(is_cached(paths[name]))
+            jbc = cache_targets(paths["main.jac"])[1]
+            mtime = os.stat(jbc).st_mtime_ns
+
+            # untouched modules reuse the cache
+            program.get_bytecode("main", paths["main.jac"], tmp)
+            self.assertEqual(os.stat(jbc).st_mtime_ns, mtime)
+
+            # a changed dependency invalidates its dependents
+            with open(paths["dep.jac"], "w") as f:
+                f.write("glob name = 'two';\n")
+            self.assertFalse(is_cached(paths["dep.jac"]))
+            self.assertFalse(is_cached(paths["main.jac"]))
+            self.assertTrue(is_cached(paths["main.impl.jac"]))
+            program.get_bytecode("main", paths["main.jac"], tmp)
+            self.assertTrue(is_cached(paths["main.jac"]))
+            self.assertTrue(is_cached(paths["dep.jac"]))
+
+            # so do changed or newly added annexes
+            with open(paths["main.impl.jac"], "a") as f:
+                f.write("\n")
+            self.assertFalse(is_cached(paths["main.jac"]))
+            program.get_bytecode("main", paths["main.jac"], tmp)
+            with open(os.path.join(tmp, "main.test.jac"), "w") as f:
+                f.write("test greet { check greet() == 'hi two'; }\n")
+            self.assertFalse(is_cached(paths["main.jac"]))
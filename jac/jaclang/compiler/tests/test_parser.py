@@ -2,6 +2,7 @@
 
 import inspect
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from jaclang.compiler import jac_lark as jl
 from jaclang.compiler.absyntree import JacSource
@@ -23,6 +24,33 @@ class TestLarkParser(TestCaseMicroSuite):
         prse = JacParser(input_ir=source)
         self.assertFalse(prse.errors_had)
 
+    def test_parse_tree_cache(self) -> None:
+        """Test reparsing a cached source gives the same ast."""
+        code = 'glob a=f"{{x}} {a}", b="::py::"; with entry { print(a); }'
+        JacParser.tree_cache.clear()
+        first = JacParser(input_ir=JacSource(code, mod_path=""))
+        self.assertIn(code, JacParser.tree_cache)
+        second = JacParser(input_ir=JacSource(code, mod_path=""))
+        self.assertFalse(second.errors_had)
+        self.assertEqual(first.ir.pp(), second.ir.pp())
+        self.assertIn("String - { -", second.ir.pp())
+        self.assertEqual(len(JacParser.tree_cache), 1)
+        JacParser(input_ir=JacSource("glob a=;", mod_path=""))
+        self.assertEqual(len(JacParser.tree_cache), 1)
+
+    def test_concurrent_parse_comments(self) -> None:
+        """Test parses on several threads keep their own comments."""
+
+        def comments_of(i: int) -> list[str]:
+            code = "".join(f"# c{i}_{j}\nglob a{j} = {j};\n" for j in range(200))
+            prse = JacParser(input_ir=JacSource(code, mod_path=""))
+            return [c.value for c in prse.source.comments]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(comments_of, range(8)))
+        for i, comments in enumerate(results):
+            self.assertEqual(comments, [f"# c{i}_{j}" for j in range(200)])
+
     def micro_suite_test(self, filename: str) -> None:
         """Parse micro jac file."""
         prse = JacParser(
@@ -0,0 +1,65 @@
+"""Tests for the semantic registry."""
+
+import pickle
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.semtable import SemInfo, SemRegistry, SemScope
+from jaclang.utils.test import TestCase
+
+
+class TestSemRegistry(TestCase):
+    """Test semantic registry lookups."""
+
+    def setUp(self) -> None:
+        """Build a small registry."""
+        self.mod = SemScope("mod", "Module")
+        self.person = SemScope("Person", "obj", self.mod)
+        self.registry = SemRegistry()
+        self.registry.add(self.person, self.info("name", "str", "Name"))
+        self.registry.add(self.mod, self.info("Person", "obj", "A person"))
+        self.registry.add(self.mod, self.info("name", "str", "Module name"))
+        self.registry.add(self.person, self.info("age", "int", "Age"))
+        return super().setUp()
+
+    def info(self, name: str, type_str: str, semstr: str) -> SemInfo:
+        """Create seminfo of a variable."""
+        return SemInfo(ast.EmptyToken(), name, type_str, semstr)
+
+    def test_lookup(self) -> None:
+        """Test indexed lookups match registry order."""
+        scope = SemScope.get_scope_from_str("mod(Module).Person(obj)")
+        found_scope, found = self.registry.lookup(scope=scope, name="age")
+        self.assertIs(found_scope, self.person)
+        self.assertEqual(found.semstr if isinstance(found, SemInfo) else None, "Age")
+        _, found = self.registry.lookup(scope=scope)
+        self.assertEqual(len(found) if isinstance(found, list) else 0, 2)
+        found_scope, found = self.registry.lookup(name="name")
+        self.assertIs(found_scope, self.person)
+        _, found = self.registry.lookup(type="obj")
+        self.assertEqual(found.name if isinstance(found, SemInfo) else None, "Person")
+        self.assertEqual(self.registry.lookup(scope=scope, name="x"), (None, None))
+        self.assertEqual(
+            self.registry.lookup(scope=SemScope("other", "Module")), (None, None)
+        )
+
+    def test_merge_filter_pickle(self) -> None:
+        """Test merging, filtering and unpickling keep the indexes."""
+        other = SemRegistry()
+        other.add(SemScope("mod", "Module"), self.info("skipped", "int", ""))
+        other.add(SemScope("lib", "Module"), self.info("helper", "int", "Helper"))
+        self.registry.merge(other)
+        self.assertEqual(len(self.registry.registry), 3)
+        self.assertEqual(self.registry.lookup(name="skipped"), (None, None))
+        self.assertIsNotNone(self.registry.lookup(name="helper")[1])
+
+        filtered = self.registry.filtered(SemScope("Person", "obj", self.mod))
+        self.assertEqual(
+            [str(i) for i in filtered.registry],
+            ["mod(Module).Person(obj)", "mod(Module)"],
+        )
+        self.assertEqual(filtered.lookup(name="helper"), (None, None))
+
+        loaded = pickle.loads(pickle.dumps(self.registry))
+        self.assertEqual(loaded.pp(), self.registry.pp())
+        _, found = loaded.lookup(name="helper")
+        self.assertEqual(found.semstr if isinstance(found, SemInfo) else None, "Helper")
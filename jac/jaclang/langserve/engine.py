@@ -4,16 +4,25 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Optional
+from typing import Optional
 
 import jaclang.compiler.absyntree as ast
-from jaclang.compiler.compile import jac_str_to_pass
+from jaclang.compiler.compile import jac_pass_to_pass, jac_str_to_pass
 from jaclang.compiler.parser import JacParser
-from jaclang.compiler.passes import Pass
-from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+from jaclang.compiler.passes import Pass, PassCancelledError
+from jaclang.compiler.passes.main.schedules import py_code_gen, type_checker_sched
 from jaclang.compiler.passes.tool import FuseCommentsPass, JacFormatPass
+from jaclang.compiler.symtable import Symbol
+from jaclang.langserve.incremental import (
+    ParseSnapshot,
+    TypeCheckSnapshot,
+    check_source,
+)
+from jaclang.langserve.index import WorkspaceIndex
+from jaclang.langserve.scheduler import AnalysisScheduler
 from jaclang.langserve.sem_manager import SemTokManager
 from jaclang.langserve.utils import (
     add_unique_text_edit,
@@ -21,12 +30,12 @@ from jaclang.langserve.utils import (
     collect_child_tabs,
     create_range,
     find_deepest_symbol_node_at_pos,
-    find_index,
     gen_diagnostics,
     get_location_range,
     get_symbols_for_outline,
     parse_symbol_path,
 )
+from jaclang.settings import settings
 from jaclang.vendor.pygls import uris
 from jaclang.vendor.pygls.server import LanguageServer
 
@@ -60,8 +69,11 @@ class JacLangServer(LanguageServer):
         """Initialize workspace."""
         super().__init__("jac-lsp", "v0.1")
         self.modules: dict[str, ModuleInfo] = {}
-        self.executor = ThreadPoolExecutor()
-        self.tasks: dict[str, asyncio.Task] = {}
+        self.executor = ThreadPoolExecutor(max_workers=settings.lsp_workers or None)
+        self.scheduler = AnalysisScheduler(self.executor)
+        self.snapshots: dict[str, ParseSnapshot] = {}
+        self.type_snapshots: dict[str, TypeCheckSnapshot] = {}
+        self.index: Optional[WorkspaceIndex] = None
 
     def update_modules(
         self, file_path: str, build: Pass, refresh: bool = False
@@ -86,14 +98,14 @@ class JacLangServer(LanguageServer):
         """Rebuild a file."""
         try:
             document = self.workspace.get_text_document(file_path)
-            build = jac_str_to_pass(
-                jac_str=document.source, file_path=document.path, schedule=[]
-            )
-            self.publish_diagnostics(
+            snapshot = self.snapshots[file_path] = check_source(
                 file_path,
-                gen_diagnostics(file_path, build.errors_had, build.warnings_had),
+                document.path,
+                document.source,
+                self.snapshots.get(file_path),
             )
-            return len(build.errors_had) == 0
+            self.publish_diagnostics(file_path, snapshot.diagnostics)
+            return not snapshot.has_errors
         except Exception as e:
             self.log_error(f"Error during syntax check: {e}")
             return False
@@ -112,8 +124,24 @@ class JacLangServer(LanguageServer):
             build = jac_str_to_pass(
                 jac_str=document.source,
                 file_path=document.path,
-                schedule=py_code_gen_typed,
+                schedule=py_code_gen,
             )
+            if snapshot := ParseSnapshot.from_build(file_path, document.source, build):
+                self.snapshots[file_path] = snapshot
+            if build.errors_had and not annex_view:
+                # publish errors found before type checking right away
+                self.publish_diagnostics(
+                    file_path,
+                    gen_diagnostics(file_path, build.errors_had, build.warnings_had),
+                )
+            if not isinstance(build, JacParser):
+                type_snapshot = self.type_snapshots.pop(file_path, None)
+                reused = type_snapshot.reuse(build) if type_snapshot else {}
+                build = jac_pass_to_pass(build, schedule=type_checker_sched)
+                if type_snapshot:
+                    type_snapshot.carry_alerts(build, reused)
+                if not build.errors_had:
+                    self.type_snapshots[file_path] = TypeCheckSnapshot(build)
             self.update_modules(file_path, build)
             if discover := self.modules[file_path].ir.annexable_by:
                 return self.deep_check(
@@ -139,35 +167,56 @@ class JacLangServer(LanguageServer):
                 )
             self.log_py(f"PROFILE: Deep check took {time.time() - start_time} seconds.")
             return len(build.errors_had) == 0
+        except PassCancelledError:
+            self.log_py(f"Deep check of {file_path} cancelled.")
+            return False
         except Exception as e:
             self.log_error(f"Error during deep check: {e}")
             return False
 
-    async def launch_quick_check(self, uri: str) -> None:
-        """Analyze and publish diagnostics."""
+    def index_workspace(self) -> None:
+        """Build the symbol index of the workspace."""
+        if not self.workspace.root_path:
+            return
+        start_time = time.time()
+        self.index = WorkspaceIndex(self.workspace.root_path)
+        parsed = self.index.build()
+        self.log_py(
+            f"PROFILE: Indexed workspace ({parsed} of {len(self.index.files)} files "
+            f"parsed) in {time.time() - start_time} seconds."
+        )
+
+    def update_index(self, file_path: str) -> None:
+        """Update the symbol index with the current content of a file."""
+        if not self.index:
+            return
+        document = self.workspace.get_text_document(file_path)
+        if self.index.update(document.path, document.source):
+            self.save_index()
+
+    def save_index(self) -> None:
+        """Persist the symbol index with the changes of the next moments."""
+        if self.index:
+            self.index.schedule_save(settings.lsp_index_save_delay / 1000)
+
+    async def launch_index_workspace(self) -> None:
+        """Index workspace in the background."""
         await asyncio.get_event_loop().run_in_executor(
-            self.executor, self.quick_check, uri
+            self.executor, self.index_workspace
+        )
+
+    async def launch_quick_check(self, uri: str) -> bool:
+        """Analyze and publish diagnostics once edits pause."""
+        return await self.scheduler.schedule(
+            uri, "quick", self.quick_check, delay=settings.lsp_debounce / 1000
         )
 
-    async def launch_deep_check(self, uri: str) -> None:
-        """Analyze and publish diagnostics."""
-
-        async def run_in_executor(
-            func: Callable[[str, Optional[str]], bool],
-            file_path: str,
-            annex_view: Optional[str] = None,
-        ) -> None:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(self.executor, func, file_path, annex_view)
-
-        if uri in self.tasks and not self.tasks[uri].done():
-            self.log_py(f"Canceling {uri} deep check...")
-            self.tasks[uri].cancel()
-            del self.tasks[uri]
+    async def launch_deep_check(self, uri: str) -> bool:
+        """Analyze and publish diagnostics, cancelling outdated deep checks."""
         self.log_py(f"Analyzing {uri}...")
-        task = asyncio.create_task(run_in_executor(self.deep_check, uri))
-        self.tasks[uri] = task
-        await task
+        return await self.scheduler.schedule(
+            uri, "deep", self.deep_check, type_checks=True
+        )
 
     def get_completion(
         self, file_path: str, position: lspt.Position, completion_trigger: Optional[str]
@@ -281,11 +330,23 @@ class JacLangServer(LanguageServer):
         if old_path in self.modules and new_path != old_path:
             self.modules[new_path] = self.modules[old_path]
             del self.modules[old_path]
+        if old_path in self.snapshots and new_path != old_path:
+            self.snapshots[new_path] = self.snapshots.pop(old_path)
+        self.type_snapshots.pop(old_path, None)
+        if self.index:
+            self.index.rename(uris.to_fs_path(old_path), uris.to_fs_path(new_path))
+            self.save_index()
 
     def delete_module(self, uri: str) -> None:
         """Delete module."""
+        self.scheduler.cancel(uri)
+        self.snapshots.pop(uri, None)
+        self.type_snapshots.pop(uri, None)
         if uri in self.modules:
             del self.modules[uri]
+        if self.index:
+            self.index.remove(uris.to_fs_path(uri))
+            self.save_index()
 
     def formatted_jac(self, file_path: str) -> list[lspt.TextEdit]:
         """Return formatted jac."""
@@ -323,10 +384,8 @@ class JacLangServer(LanguageServer):
         """Return hover information for a file."""
         if file_path not in self.modules:
             return None
-        token_index = find_index(
-            self.modules[file_path].sem_manager.sem_tokens,
-            position.line,
-            position.character,
+        token_index = self.modules[file_path].sem_manager.find_index(
+            position.line, position.character
         )
         if token_index is None:
             return None
@@ -378,10 +437,8 @@ class JacLangServer(LanguageServer):
         """Return definition location for a file."""
         if file_path not in self.modules:
             return None
-        token_index = find_index(
-            self.modules[file_path].sem_manager.sem_tokens,
-            position.line,
-            position.character,
+        token_index = self.modules[file_path].sem_manager.find_index(
+            position.line, position.character
         )
         if token_index is None:
             return None
@@ -467,10 +524,8 @@ class JacLangServer(LanguageServer):
         """Return references for a file."""
         if file_path not in self.modules:
             return []
-        index1 = find_index(
-            self.modules[file_path].sem_manager.sem_tokens,
-            position.line,
-            position.character,
+        index1 = self.modules[file_path].sem_manager.find_index(
+            position.line, position.character
         )
         if index1 is None:
             return []
@@ -483,19 +538,36 @@ class JacLangServer(LanguageServer):
                 )
                 for node in node_selected.sym.uses
             ]
-            return list_of_references
+            return list_of_references + self.get_indexed_references(
+                file_path, node_selected.sym
+            )
         return []
 
+    def get_indexed_references(
+        self, file_path: str, sym: Symbol
+    ) -> list[lspt.Location]:
+        """Return mentions of a top-level symbol in files outside the build."""
+        if not self.index or not isinstance(sym.parent_tab.owner, ast.Module):
+            return []
+        module = self.modules[file_path]
+        while module.impl_parent:
+            module = module.impl_parent
+        built = {os.path.abspath(module.ir.loc.mod_path)}
+        built.update(os.path.abspath(i) for i in module.ir.mod_deps)
+        return self.index.references(sym.decl.loc.mod_path, sym.sym_name, built)
+
+    def get_workspace_symbols(self, query: str) -> list[lspt.SymbolInformation]:
+        """Return top-level symbols of the workspace matching query."""
+        return self.index.symbols(query) if self.index else []
+
     def rename_symbol(
         self, file_path: str, position: lspt.Position, new_name: str
     ) -> Optional[lspt.WorkspaceEdit]:
         """Rename a symbol in a file."""
         if file_path not in self.modules:
             return None
-        index1 = find_index(
-            self.modules[file_path].sem_manager.sem_tokens,
-            position.line,
-            position.character,
+        index1 = self.modules[file_path].sem_manager.find_index(
+            position.line, position.character
         )
         if index1 is None:
             return None
@@ -512,6 +584,10 @@ class JacLangServer(LanguageServer):
                     new_text=new_name,
                 )
                 add_unique_text_edit(changes, key, new_edit)
+            for loc in self.get_indexed_references(file_path, node_selected.sym):
+                add_unique_text_edit(
+                    changes, loc.uri, lspt.TextEdit(range=loc.range, new_text=new_name)
+                )
             return lspt.WorkspaceEdit(changes=changes)
         return None
 
@@ -519,7 +595,25 @@ class JacLangServer(LanguageServer):
         """Return semantic tokens for a file."""
         if file_path not in self.modules:
             return lspt.SemanticTokens(data=[])
-        return lspt.SemanticTokens(data=self.modules[file_path].sem_manager.sem_tokens)
+        return self.modules[file_path].sem_manager.get_full()
+
+    def get_semantic_tokens_delta(
+        self, file_path: str, previous_result_id: str
+    ) -> lspt.SemanticTokens | lspt.SemanticTokensDelta:
+        """Return semantic token edits since a previous result."""
+        if file_path not in self.modules:
+            return lspt.SemanticTokens(data=[])
+        return self.modules[file_path].sem_manager.get_delta(previous_result_id)
+
+    def get_semantic_tokens_range(
+        self, file_path: str, rng: lspt.Range
+    ) -> lspt.SemanticTokens:
+        """Return semantic tokens of a range of a file."""
+        if file_path not in self.modules:
+            return lspt.SemanticTokens(data=[])
+        return lspt.SemanticTokens(
+            data=self.modules[file_path].sem_manager.get_range_tokens(rng)
+        )
 
     def log_error(self, message: str) -> None:
         """Log an error message."""
@@ -0,0 +1,322 @@
+"""Incremental checking of open documents.
+
+A parse snapshot keeps the line spans of the top-level elements that parsed
+cleanly in the last check along with its diagnostics. On change only the lines
+between the closest untouched elements around the edit are parsed again, padded
+with newlines so locations match the document, and diagnostics of untouched lines
+are carried over, shifted by the number of inserted or removed lines.
+
+A type check snapshot keeps the analyzed module of the last deep check. Top-level
+elements whose text is unchanged and that use no name defined by a changed element
+keep their types and type checker alerts, mypy only checks the function bodies of
+the changed elements and their dependents.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from bisect import bisect_right
+from itertools import zip_longest
+from typing import Iterator, Optional
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.codeloc import CodeLocInfo
+from jaclang.compiler.parser import JacParser
+from jaclang.compiler.passes import Pass
+from jaclang.compiler.passes.main import JacTypeCheckPass
+from jaclang.compiler.passes.transform import Alert
+from jaclang.langserve.utils import gen_diagnostics
+
+import lsprotocol.types as lspt
+
+# tokens that can span lines, edits touching them may change far away elements
+MULTILINE_DELIMITERS = ("#*", "*#", '"""', "'''")
+# alerts naming other lines go stale as lines move, they are not carried over
+LINE_REFERENCE = re.compile(r"\bline \d+")
+
+
+class ParseSnapshot:
+    """Parsed top-level elements and diagnostics of a document."""
+
+    def __init__(
+        self,
+        lines: list[str],
+        elements: list[tuple[int, int]],
+        diagnostics: list[lspt.Diagnostic],
+    ) -> None:
+        """Initialize snapshot."""
+        self.lines = lines
+        # first and last line (zero based) of clean top-level elements, in order
+        self.elements = elements
+        self.diagnostics = diagnostics
+
+    @property
+    def has_errors(self) -> bool:
+        """Check for syntax errors."""
+        return any(
+            i.severity == lspt.DiagnosticSeverity.Error for i in self.diagnostics
+        )
+
+    @staticmethod
+    def from_build(uri: str, source: str, build: Pass) -> Optional[ParseSnapshot]:
+        """Take snapshot of a full build without syntax errors."""
+        if not isinstance(build.ir, ast.Module) or any(
+            i.from_pass is JacParser for i in build.errors_had
+        ):
+            return None
+        return ParseSnapshot(
+            lines=source.splitlines(keepends=True),
+            elements=element_spans(build.ir),
+            diagnostics=gen_diagnostics(
+                uri, [], [i for i in build.warnings_had if i.from_pass is JacParser]
+            ),
+        )
+
+
+def element_spans(mod: ast.Module) -> list[tuple[int, int]]:
+    """Get line spans of the top-level elements of a module."""
+    return [(i.loc.first_line - 1, i.loc.last_line - 1) for i in mod.body]
+
+
+def unchanged_lines(old: list[str], new: list[str]) -> tuple[int, int]:
+    """Count leading and trailing lines two documents have in common."""
+    limit = min(len(old), len(new))
+    head = 0
+    while head < limit and old[head] == new[head]:
+        head += 1
+    tail = 0
+    while tail < limit - head and old[-1 - tail] == new[-1 - tail]:
+        tail += 1
+    return head, tail
+
+
+def shift(diagnostic: lspt.Diagnostic, delta: int) -> lspt.Diagnostic:
+    """Move a diagnostic by delta lines."""
+    if not delta:
+        return diagnostic
+    start, end = diagnostic.range.start, diagnostic.range.end
+    return lspt.Diagnostic(
+        range=lspt.Range(
+            start=lspt.Position(start.line + delta, start.character),
+            end=lspt.Position(end.line + delta, end.character),
+        ),
+        message=diagnostic.message,
+        severity=diagnostic.severity,
+    )
+
+
+def parse_lines(
+    uri: str, mod_path: str, lines: list[str], start: int, end: int
+) -> tuple[list[tuple[int, int]], list[lspt.Diagnostic]]:
+    """Parse lines start to end of a document on their own."""
+    if start >= end:
+        return [], []
+    source = ast.JacSource("\n" * start + "".join(lines[start:end]), mod_path)
+    prse = JacParser(input_ir=source)
+    if prse.errors_had or not isinstance(prse.ir, ast.Module):
+        return [], gen_diagnostics(uri, prse.errors_had, prse.warnings_had)
+    elements = element_spans(prse.ir)
+    if start and prse.ir.doc and elements:
+        # in the document this docstring belongs to the element following it
+        elements[0] = (prse.ir.doc.loc.first_line - 1, elements[0][1])
+    return elements, gen_diagnostics(uri, prse.errors_had, prse.warnings_had)
+
+
+def check_source(
+    uri: str, mod_path: str, source: str, snapshot: Optional[ParseSnapshot]
+) -> ParseSnapshot:
+    """Syntax check a document, reparsing only what changed since snapshot."""
+    lines = source.splitlines(keepends=True)
+    if snapshot and snapshot.lines == lines:
+        return snapshot
+    head, tail = unchanged_lines(snapshot.lines, lines) if snapshot else (0, 0)
+    delta = len(lines) - len(snapshot.lines) if snapshot else 0
+    old_tail_start = len(snapshot.lines) - tail if snapshot else 0
+    if not snapshot or any(
+        token in line
+        for line in lines[head : len(lines) - tail]
+        + snapshot.lines[head:old_tail_start]
+        for token in MULTILINE_DELIMITERS
+    ):
+        return ParseSnapshot(lines, *parse_lines(uri, mod_path, lines, 0, len(lines)))
+    before = [i for i in snapshot.elements if i[1] < head]
+    after = [
+        (first + delta, last + delta)
+        for first, last in snapshot.elements
+        if first >= old_tail_start
+    ]
+    start = before[-1][1] + 1 if before else 0
+    end = after[0][0] if after else len(lines)
+    elements, diagnostics = parse_lines(uri, mod_path, lines, start, end)
+    diagnostics = (
+        [i for i in snapshot.diagnostics if i.range.end.line < start]
+        + diagnostics
+        + [
+            shift(i, delta)
+            for i in snapshot.diagnostics
+            if i.range.start.line >= end - delta
+        ]
+    )
+    return ParseSnapshot(lines, before + elements + after, diagnostics)
+
+
+class TypeCheckSnapshot:
+    """Type checked top-level elements of a module, reused by the next check."""
+
+    def __init__(self, build: Pass) -> None:
+        """Take snapshot of a type checked build."""
+        assert isinstance(build.ir, ast.Module)
+        self.module = build.ir
+        self.elements: dict[str, list[ast.AstNode]] = {}
+        for element in self.module.body:
+            self.elements.setdefault(element_text(element), []).append(element)
+        self.defined = defined_names(self.module)
+        self.alerts: dict[ast.AstNode, list[Alert]] = {}
+        for alert in build.warnings_had:
+            owner = element_at(self.module, alert.loc)
+            if alert.from_pass is JacTypeCheckPass and owner:
+                self.alerts.setdefault(owner, []).append(alert)
+        # files read by the check, a change to any of them makes the snapshot stale
+        self.stats = {
+            path: file_stat(path)
+            for path in {*self.module.mod_deps, *self.module.py_mod_dep_map.values()}
+        }
+        # where carried over alerts are located in the next build
+        self.moved: dict[CodeLocInfo, CodeLocInfo] = {}
+
+    def reuse(self, build: Pass) -> dict[ast.AstNode, ast.AstNode]:
+        """Carry types of unchanged elements over to a build about to be checked.
+
+        Returns the reused elements of the build mapped to their old elements.
+        """
+        module = build.ir
+        if not isinstance(module, ast.Module) or any(
+            file_stat(path) != stat for path, stat in self.stats.items()
+        ):
+            return {}
+        unmatched = {text: list(olds) for text, olds in self.elements.items()}
+        defined = defined_names(module)
+        changed: set[str] = set()
+        nodes: dict[ast.AstNode, list[tuple[ast.AstNode, ast.AstNode]]] = {}
+        for element in module.body:
+            olds = unmatched.get(element_text(element))
+            pairs = match_nodes(olds[0], element) if olds else None
+            if olds and pairs is not None and self.can_carry(olds[0], pairs):
+                nodes[element] = pairs
+                olds.pop(0)
+            else:
+                changed |= defined.get(element, set())
+        for olds in unmatched.values():
+            for old in olds:
+                changed |= self.defined.get(old, set())
+
+        # users of names defined by changed elements are checked again, transitively
+        users: dict[str, list[ast.AstNode]] = {}
+        for user in nodes:
+            for name in used_names(user):
+                users.setdefault(name, []).append(user)
+        queue = list(changed)
+        while queue:
+            for user in users.get(queue.pop(), ()):
+                if nodes.pop(user, None) is not None:
+                    queue.extend(defined.get(user, set()) - changed)
+                    changed |= defined.get(user, set())
+
+        reused: dict[ast.AstNode, ast.AstNode] = {}
+        for kept, matched in nodes.items():
+            reused[kept] = matched[0][0]
+            for old, new in matched:
+                if isinstance(old, ast.Expr) and isinstance(new, ast.Expr):
+                    new.expr_type = old.expr_type
+                self.moved[old.loc] = new.loc
+        module.reused_elements = set(reused)
+        module.py_raise_map.update(self.module.py_raise_map)
+        return reused
+
+    def can_carry(
+        self, old: ast.AstNode, pairs: list[tuple[ast.AstNode, ast.AstNode]]
+    ) -> bool:
+        """Check the type checker alerts of an old element can be carried over."""
+        locs = {i.loc for i, _ in pairs}
+        return all(
+            i.loc in locs and not LINE_REFERENCE.search(i.msg)
+            for i in self.alerts.get(old, ())
+        )
+
+    def carry_alerts(self, build: Pass, reused: dict[ast.AstNode, ast.AstNode]) -> None:
+        """Replace type checker alerts of reused elements with their old alerts."""
+        module = build.ir
+        if not reused or not isinstance(module, ast.Module):
+            return
+        build.warnings_had[:] = [
+            i
+            for i in build.warnings_had
+            if i.from_pass is not JacTypeCheckPass
+            or element_at(module, i.loc) not in reused
+        ] + [
+            Alert(i.msg, self.moved[i.loc], i.from_pass)
+            for old in reused.values()
+            for i in self.alerts.get(old, ())
+        ]
+
+
+def element_text(element: ast.AstNode) -> str:
+    """Get source text of a top-level element."""
+    return element.loc.orig_src.code[element.loc.pos_start : element.loc.pos_end]
+
+
+def element_at(module: ast.Module, loc: CodeLocInfo) -> Optional[ast.AstNode]:
+    """Get the top-level element of a module containing a location."""
+    if loc.mod_path != module.loc.mod_path:
+        return None
+    index = bisect_right(module.body, loc.pos_start, key=lambda i: i.loc.pos_start)
+    if index and loc.pos_start < module.body[index - 1].loc.pos_end:
+        return module.body[index - 1]
+    return None
+
+
+def walk(node: ast.AstNode) -> Iterator[ast.AstNode]:
+    """Iterate over a node and its descendants, leaving out attached modules."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(i for i in node.kid if not isinstance(i, ast.Module))
+
+
+def match_nodes(
+    old: ast.AstNode, new: ast.AstNode
+) -> Optional[list[tuple[ast.AstNode, ast.AstNode]]]:
+    """Pair up the nodes of two elements parsed from the same text."""
+    pairs = list(zip_longest(walk(old), walk(new)))
+    if any(type(i) is not type(j) for i, j in pairs):
+        return None
+    return pairs
+
+
+def defined_names(module: ast.Module) -> dict[ast.AstNode, set[str]]:
+    """Get the names each top-level element defines in the module scope."""
+    defined: dict[ast.AstNode, set[str]] = {}
+    for sym in module.sym_tab.tab.values():
+        for defn in sym.defn:
+            node: ast.AstNode = defn
+            while node.parent and node.parent is not module:
+                node = node.parent
+            if node.parent is module:
+                defined.setdefault(node, set()).add(sym.sym_name)
+    return defined
+
+
+def used_names(element: ast.AstNode) -> set[str]:
+    """Get the names used in a top-level element."""
+    return {i.sym_name for i in walk(element) if isinstance(i, ast.NameAtom)}
+
+
+def file_stat(path: str) -> Optional[tuple[int, int]]:
+    """Get modification time and size of a file."""
+    try:
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
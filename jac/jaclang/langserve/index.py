@@ -0,0 +1,352 @@
+"""Workspace symbol index of the language server.
+
+Every .jac file of the workspace is parsed once to record its top-level
+definitions, the names it mentions and where it uses the Jac modules it imports.
+Entries are keyed by content hash and persisted under the workspace's __jac_gen__
+folder, so only changed files are parsed again when the server restarts. Lookups
+are syntactic and complement the exact symbol uses of compiled modules with
+files that were never compiled.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Iterator, Optional
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.cache import file_hash, find_annexes
+from jaclang.compiler.constant import Constants as Con
+from jaclang.compiler.parser import JacParser
+from jaclang.langserve.utils import create_range, kind_map
+from jaclang.vendor.pygls import uris
+
+import lsprotocol.types as lspt
+
+INDEX_VERSION = 2
+
+# zero based start line, start column, end line, end column
+Span = list[int]
+
+
+def to_span(node: ast.AstNode) -> Span:
+    """Get span of a node."""
+    rng = create_range(node.loc)
+    return [rng.start.line, rng.start.character, rng.end.line, rng.end.character]
+
+
+def to_range(span: Span) -> lspt.Range:
+    """Get range of a span."""
+    return lspt.Range(
+        start=lspt.Position(line=span[0], character=span[1]),
+        end=lspt.Position(line=span[2], character=span[3]),
+    )
+
+
+def walk(node: ast.AstNode) -> Iterator[ast.AstNode]:
+    """Iterate over a node and all of its descendants."""
+    stack = [node]
+    while stack:
+        cur = stack.pop()
+        yield cur
+        stack.extend(reversed(cur.kid))
+
+
+def module_file(path: str) -> Optional[str]:
+    """Get Jac file of a resolved import path."""
+    if os.path.isdir(path):
+        path = os.path.join(path, "__init__.jac")
+    return os.path.abspath(path) if path.endswith(".jac") else None
+
+
+def dotted_name(node: ast.AstNode) -> Optional[str]:
+    """Get dotted name of a name or attribute chain."""
+    if isinstance(node, ast.Name):
+        return node.value
+    if (
+        isinstance(node, ast.AtomTrailer)
+        and node.is_attr
+        and isinstance(node.right, ast.Name)
+        and (target := dotted_name(node.target))
+    ):
+        return f"{target}.{node.right.value}"
+    return None
+
+
+def is_name_use(node: ast.Name) -> bool:
+    """Check if a name refers to a symbol rather than declaring or selecting one."""
+    parent = node.parent
+    if isinstance(parent, ast.AtomTrailer):
+        return not (parent.is_attr and parent.right is node)
+    if isinstance(parent, (ast.ParamVar, ast.HasVar)):
+        return parent.name is not node
+    if isinstance(parent, (ast.Architype, ast.Ability, ast.Enum)):
+        return parent.name_spec is not node
+    if isinstance(parent, ast.KWPair):
+        return parent.key is not node
+    return not isinstance(parent, (ast.ModuleItem, ast.ModulePath))
+
+
+def local_names(node: ast.Ability) -> set[str]:
+    """Collect names an ability binds, which shadow module level names."""
+    names = set()
+    for i in walk(node):
+        if isinstance(i, ast.ParamVar):
+            names.add(i.name.value)
+        elif isinstance(i, ast.Assignment):
+            names.update(j.value for j in i.target.items if isinstance(j, ast.Name))
+        elif isinstance(i, ast.InForStmt) and isinstance(i.target, ast.Name):
+            names.add(i.target.value)
+    return names
+
+
+def index_module(mod: ast.Module) -> dict:
+    """Collect definitions, name uses and uses of Jac imports of a parsed module.
+
+    Uses of an imported module are only recorded where the name resolves to it:
+    its import items, unaliased names imported from it that the module doesn't
+    redefine or an ability doesn't shadow, and attributes of its alias. Unresolved names are kept
+    apart, for impl and test annexes that share the namespace of their module.
+    """
+    defs: dict[str, list] = {}
+    names: dict[str, list[Span]] = {}
+    imports: dict[str, dict[str, list[Span]]] = {}
+    # local name -> (module file, name in module), dotted alias -> module file
+    bound: dict[str, tuple[str, str]] = {}
+    aliases: dict[str, str] = {}
+    for elem in mod.body:
+        found: list[tuple[ast.NameAtom, ast.AstNode]]
+        if isinstance(elem, ast.GlobalVars):
+            found = [
+                (i, elem)
+                for assign in elem.assignments.items
+                for i in assign.target.items
+                if isinstance(i, ast.Name)
+            ]
+        elif isinstance(elem, (ast.Architype, ast.Enum, ast.Ability)):
+            found = [(elem.name_spec, elem)]
+        else:
+            continue
+        for name, node in found:
+            defs.setdefault(name.sym_name, []).append(
+                [int(kind_map(node)), *to_span(name)]
+            )
+
+    def add_use(path: str, name: str, node: ast.AstNode) -> None:
+        imports.setdefault(path, {}).setdefault(name, []).append(to_span(node))
+
+    for node in walk(mod):
+        if not isinstance(node, ast.Import) or node.is_py:
+            continue
+        if not node.from_loc:
+            for path in node.items.items:
+                if isinstance(path, ast.ModulePath) and (
+                    target := module_file(path.resolve_relative_path())
+                ):
+                    imports.setdefault(target, {})
+                    alias = (
+                        path.alias.value
+                        if path.alias
+                        else path.dot_path_str.lstrip(".")
+                    )
+                    aliases[alias] = target
+            continue
+        target = module_file(node.from_loc.resolve_relative_path())
+        if target:
+            imports.setdefault(target, {})
+        for item in node.items.items:
+            if not isinstance(item, ast.ModuleItem):
+                continue
+            local = (item.alias or item.name).value
+            sub = module_file(node.from_loc.resolve_relative_path(item.name.value))
+            if sub and os.path.isfile(sub):
+                imports.setdefault(sub, {})
+                aliases[local] = sub
+            if target:
+                add_use(target, item.name.value, item.name)
+                # uses of an alias keep their name when the symbol is renamed
+                if not item.alias:
+                    bound[local] = (target, item.name.value)
+    for defined in defs:
+        bound.pop(defined, None)
+
+    stack: list[tuple[ast.AstNode, frozenset[str]]] = [(mod, frozenset())]
+    while stack:
+        cur, shadowed = stack.pop()
+        if isinstance(cur, ast.Ability):
+            shadowed = shadowed | local_names(cur)
+        if isinstance(cur, ast.Name) and is_name_use(cur):
+            if cur.value not in shadowed:
+                names.setdefault(cur.value, []).append(to_span(cur))
+                if cur.value in bound:
+                    add_use(*bound[cur.value], cur)
+        elif (
+            isinstance(cur, ast.AtomTrailer)
+            and cur.is_attr
+            and isinstance(cur.right, ast.Name)
+            and (prefix := dotted_name(cur.target))
+            and prefix in aliases
+            and prefix.split(".")[0] not in shadowed
+        ):
+            add_use(aliases[prefix], cur.right.value, cur.right)
+        stack.extend((i, shadowed) for i in reversed(cur.kid))
+    return {"defs": defs, "names": names, "imports": imports}
+
+
+class WorkspaceIndex:
+    """Persistent name index of the Jac files of a workspace."""
+
+    def __init__(self, root: str) -> None:
+        """Initialize index of workspace root."""
+        self.root = os.path.abspath(root)
+        self.path = os.path.join(self.root, Con.JAC_GEN_DIR, "workspace_index.json")
+        self.files: dict[str, dict] = {}
+        self.lock = threading.Lock()
+        self.save_timer: Optional[threading.Timer] = None
+
+    def load(self) -> None:
+        """Load persisted index, ignoring it when unreadable or outdated."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == INDEX_VERSION:
+            with self.lock:
+                self.files = data.get("files", {})
+
+    def save(self) -> None:
+        """Persist index, replacing the file at once so it is never half written."""
+        with self.lock:
+            self.save_timer = None
+            data = json.dumps({"version": INDEX_VERSION, "files": self.files})
+        folder = os.path.dirname(self.path)
+        try:
+            os.makedirs(folder, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            os.unlink(tmp_path)
+
+    def schedule_save(self, delay: float) -> None:
+        """Persist index after delay seconds, with the changes made until then."""
+        with self.lock:
+            if self.save_timer is None:
+                self.save_timer = threading.Timer(delay, self.save)
+                self.save_timer.start()
+
+    def jac_files(self) -> Iterator[str]:
+        """Find Jac files of the workspace."""
+        for base, dirs, files in os.walk(self.root):
+            dirs[:] = [
+                i for i in dirs if not i.startswith(".") and i != Con.JAC_GEN_DIR
+            ]
+            for name in files:
+                if name.endswith(".jac"):
+                    yield os.path.join(base, name)
+
+    def build(self) -> int:
+        """Index every Jac file of the workspace, return count of files parsed."""
+        self.load()
+        found = set(self.jac_files())
+        parsed = sum(self.update(path) for path in sorted(found))
+        with self.lock:
+            for path in set(self.files) - found:
+                del self.files[path]
+        self.save()
+        return parsed
+
+    def update(self, path: str, source: Optional[str] = None) -> bool:
+        """Index a file unless unchanged, return whether it was parsed."""
+        path = os.path.abspath(path)
+        if source is None:
+            digest = file_hash(path)
+            if digest is None:
+                self.remove(path)
+                return False
+        else:
+            digest = hashlib.sha256(source.encode()).hexdigest()
+        with self.lock:
+            if self.files.get(path, {}).get("hash") == digest:
+                return False
+        if source is None:
+            try:
+                with open(path) as f:
+                    source = f.read()
+            except (OSError, UnicodeDecodeError):
+                return False
+        prse = JacParser(input_ir=ast.JacSource(source, mod_path=path))
+        if prse.errors_had or not isinstance(prse.ir, ast.Module):
+            return False
+        entry = index_module(prse.ir)
+        entry["hash"] = digest
+        with self.lock:
+            self.files[path] = entry
+        return True
+
+    def remove(self, path: str) -> None:
+        """Drop a file from the index."""
+        with self.lock:
+            self.files.pop(os.path.abspath(path), None)
+
+    def rename(self, old_path: str, new_path: str) -> None:
+        """Move index entry of a renamed file, reindexing it on a folder change."""
+        old_path, new_path = os.path.abspath(old_path), os.path.abspath(new_path)
+        with self.lock:
+            entry = self.files.pop(old_path, None)
+            # imports are resolved relative to the file's folder
+            if entry and os.path.dirname(old_path) == os.path.dirname(new_path):
+                self.files[new_path] = entry
+                return
+        self.update(new_path)
+
+    def references(
+        self, mod_path: str, name: str, skip: set[str]
+    ) -> list[lspt.Location]:
+        """Find mentions of a top-level name of a module outside skipped files."""
+        mod_path = os.path.abspath(mod_path)
+        impls, tests = find_annexes(mod_path)
+        users = {mod_path, *impls, *tests}
+        with self.lock:
+            annexes = set(users)
+            users.update(
+                path
+                for path, entry in self.files.items()
+                if mod_path in entry["imports"]
+            )
+            return [
+                lspt.Location(uri=uris.from_fs_path(path), range=to_range(span))
+                for path in sorted(users)
+                if path not in skip and path in self.files
+                for span in (
+                    self.files[path]["names"]
+                    if path in annexes
+                    else self.files[path]["imports"].get(mod_path, {})
+                ).get(name, [])
+            ]
+
+    def symbols(self, query: str) -> list[lspt.SymbolInformation]:
+        """Find top-level definitions whose name contains query."""
+        query = query.lower()
+        with self.lock:
+            return [
+                lspt.SymbolInformation(
+                    name=name,
+                    kind=lspt.SymbolKind(kind),
+                    location=lspt.Location(
+                        uri=uris.from_fs_path(path), range=to_range(span)
+                    ),
+                )
+                for path, entry in sorted(self.files.items())
+                for name, found in entry["defs"].items()
+                if query in name.lower()
+                for kind, *span in found
+            ]
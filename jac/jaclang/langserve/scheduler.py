@@ -0,0 +1,93 @@
+"""Debounced and cancellable analyses of documents.
+
+Each document has at most one analysis of each kind waiting or running. A newer
+request for it replaces the waiting one and cancels the running one, whose passes
+stop at their next node, so analyses of stale content are dropped instead of
+queueing up behind each other while the user types. Type checks run one at a
+time in a process, so analyses running them are queued on a thread of their own
+rather than holding pool threads while they wait.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from jaclang.compiler.passes import cancellable
+
+
+class AnalysisJob:
+    """Scheduled analysis of a document."""
+
+    def __init__(self) -> None:
+        """Initialize job."""
+        self.cancel_event = threading.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def cancel(self) -> None:
+        """Drop job if waiting, stop it at the next node if running."""
+        self.cancel_event.set()
+        if self.task:
+            self.task.cancel()
+
+
+class AnalysisScheduler:
+    """Run analyses of documents on a bounded thread pool."""
+
+    def __init__(self, executor: ThreadPoolExecutor) -> None:
+        """Initialize scheduler."""
+        self.executor = executor
+        self.type_check_executor = ThreadPoolExecutor(max_workers=1)
+        # (uri, kind) -> latest job
+        self.jobs: dict[tuple[str, str], AnalysisJob] = {}
+
+    def cancel(self, uri: str, kind: Optional[str] = None) -> None:
+        """Cancel analyses of a document, of one kind or all of them."""
+        for key in [i for i in self.jobs if i[0] == uri and kind in (None, i[1])]:
+            self.jobs.pop(key).cancel()
+
+    async def schedule(
+        self,
+        uri: str,
+        kind: str,
+        func: Callable[[str], bool],
+        delay: float = 0.0,
+        type_checks: bool = False,
+    ) -> bool:
+        """Run func on a document once no newer request came in for delay seconds.
+
+        Returns False when the analysis was superseded before it finished.
+        """
+        self.cancel(uri, kind)
+        job = self.jobs[(uri, kind)] = AnalysisJob()
+        executor = self.type_check_executor if type_checks else self.executor
+        job.task = asyncio.create_task(self.run(job, func, uri, delay, executor))
+        try:
+            return await job.task
+        except asyncio.CancelledError:
+            return False
+        finally:
+            if self.jobs.get((uri, kind)) is job:
+                del self.jobs[(uri, kind)]
+
+    async def run(
+        self,
+        job: AnalysisJob,
+        func: Callable[[str], bool],
+        uri: str,
+        delay: float,
+        executor: ThreadPoolExecutor,
+    ) -> bool:
+        """Wait out delay, then run func in the executor."""
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        def call() -> bool:
+            if job.cancel_event.is_set():
+                return False
+            with cancellable(job.cancel_event):
+                return func(uri)
+
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
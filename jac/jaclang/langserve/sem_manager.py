@@ -2,27 +2,122 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from itertools import count
 from typing import List, Optional, Tuple
 
 import jaclang.compiler.absyntree as ast
-from jaclang.langserve.utils import (
-    find_surrounding_tokens,
-    get_line_of_code,
-    get_token_start,
-)
 
 import lsprotocol.types as lspt
 
+# result ids are unique across managers as modules get rebuilt
+result_ids = count(1)
+
+# a token on a line: start and end character, type, modifier and the index of
+# its node in static_sem_tokens
+SemToken = List[int]
+
 
 class SemTokManager:
     """Semantic Token Manager class."""
 
     def __init__(self, ir: ast.Module) -> None:
         """Initialize semantic token manager."""
-        self.sem_tokens: List[int] = self.gen_sem_tokens(ir)
         self.static_sem_tokens: List[
             Tuple[lspt.Position, int, int, ast.AstSymbolNode]
         ] = self.gen_sem_tok_node(ir)
+        # tokens bucketed by line, edits only touch the lines they change
+        self.lines = self.bucket_sem_tokens(self.gen_sem_tokens(ir))
+        # encoded tokens, built when a client asks for them
+        self.encoded: Optional[List[int]] = None
+        # result id and data of the last tokens sent for full/delta requests
+        self.sent: Optional[Tuple[str, List[int]]] = None
+
+    @property
+    def sem_tokens(self) -> List[int]:
+        """Return the encoded semantic tokens."""
+        if self.encoded is None:
+            self.encoded = self.encode_sem_tokens(self.lines)
+        return self.encoded
+
+    @property
+    def positions(self) -> List[Tuple[int, int, int]]:
+        """Return line, start and end character of every token."""
+        return [
+            (line, tok[0], tok[1])
+            for line, toks in enumerate(self.lines)
+            for tok in toks
+        ]
+
+    def find_index(self, line: int, char: int) -> Optional[int]:
+        """Find index of the token at a position, the earlier one if two touch."""
+        if not 0 <= line < len(self.lines):
+            return None
+        toks = self.lines[line]
+        index = bisect_right(toks, char, key=lambda tok: tok[0]) - 1
+        for i in (index - 1, index):
+            if i >= 0 and toks[i][0] <= char <= toks[i][1]:
+                return toks[i][4]
+        return None
+
+    def apply_changes(self, content_changes: lspt.DidChangeTextDocumentParams) -> None:
+        """Update semantic tokens on the lines touched by a change."""
+        for change in content_changes.content_changes:
+            if isinstance(change, lspt.TextDocumentContentChangeEvent_Type1):
+                self.update_lines(self.lines, change)
+                self.encoded = None
+
+    def get_range_tokens(self, rng: lspt.Range) -> List[int]:
+        """Return semantic tokens overlapping a range."""
+        tokens: List[int] = []
+        prev_line, prev_col = 0, 0
+        for line in range(rng.start.line, min(rng.end.line + 1, len(self.lines))):
+            for col, end_col, *kind, _ in self.lines[line]:
+                if (line == rng.start.line and end_col <= rng.start.character) or (
+                    line == rng.end.line and col >= rng.end.character
+                ):
+                    continue
+                tokens += [
+                    line - prev_line,
+                    col if line != prev_line else col - prev_col,
+                    end_col - col,
+                    *kind,
+                ]
+                prev_line, prev_col = line, col
+        return tokens
+
+    def get_full(self) -> lspt.SemanticTokens:
+        """Return all semantic tokens, remembering them for delta requests."""
+        self.sent = (str(next(result_ids)), list(self.sem_tokens))
+        return lspt.SemanticTokens(data=self.sent[1], result_id=self.sent[0])
+
+    def get_delta(
+        self, previous_result_id: str
+    ) -> lspt.SemanticTokens | lspt.SemanticTokensDelta:
+        """Return edits from previously sent semantic tokens."""
+        if not self.sent or self.sent[0] != previous_result_id:
+            return self.get_full()
+        old, new = self.sent[1], self.sem_tokens
+        limit = min(len(old), len(new))
+        head = 0
+        while head < limit and old[head] == new[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and old[-1 - tail] == new[-1 - tail]:
+            tail += 1
+        edits = (
+            [
+                lspt.SemanticTokensEdit(
+                    start=head,
+                    delete_count=len(old) - head - tail,
+                    data=new[head : len(new) - tail],
+                )
+            ]
+            if head < len(old) or head < len(new)
+            else []
+        )
+        self.sent = (str(next(result_ids)), list(new))
+        return lspt.SemanticTokensDelta(edits=edits, result_id=self.sent[0])
 
     def gen_sem_tokens(self, ir: ast.Module) -> list[int]:
         """Return semantic tokens."""
@@ -62,318 +157,76 @@ class SemTokManager:
                 tokens += [(pos, col_end, length, node)]
         return tokens
 
-    def update_sem_tokens(
-        self,
-        content_changes: lspt.DidChangeTextDocumentParams,
-        sem_tokens: list[int],
-        document_lines: List[str],
-    ) -> list[int]:
-        """Update semantic tokens on change."""
-        for change in [
-            x
-            for x in content_changes.content_changes
-            if isinstance(x, lspt.TextDocumentContentChangeEvent_Type1)
-        ]:
-            change_start_line = change.range.start.line
-            change_start_char = change.range.start.character
-            change_end_line = change.range.end.line
-            change_end_char = change.range.end.character
-
-            is_delete = change.text == ""
-            prev_token_index, next_token_index, insert_inside_token = (
-                find_surrounding_tokens(
-                    change_start_line,
-                    change_start_char,
-                    change_end_line,
-                    change_end_char,
-                    sem_tokens,
-                )
-            )
-            prev_tok_pos = get_token_start(prev_token_index, sem_tokens)
-            nxt_tok_pos = get_token_start(next_token_index, sem_tokens)
-            changing_line_text = get_line_of_code(change_start_line, document_lines)
-            if not changing_line_text:
-                return sem_tokens
-            is_edit_between_tokens = bool(
-                (
-                    change_start_line > prev_tok_pos[0]
-                    or (
-                        change_start_line == prev_tok_pos[0]
-                        and change_start_char
-                        > prev_tok_pos[1] + sem_tokens[prev_token_index + 2]
-                        if prev_token_index and prev_token_index + 2 < len(sem_tokens)
-                        else 0
-                    )
-                )
-                and (
-                    change_end_line < nxt_tok_pos[0]
-                    or (
-                        change_end_line == nxt_tok_pos[0]
-                        and change_end_char < nxt_tok_pos[1]
-                    )
-                )
-            )
-            text = r"%s" % change.text
-            line_delta = len(text.split("\n")) - 1
-
-            is_multiline_insertion = line_delta > 0
-            is_next_token_same_line = change_end_line == nxt_tok_pos[0]
-
-            if is_delete:
-                next_token_index = (
-                    prev_token_index + 5
-                    if insert_inside_token
-                    and prev_token_index is not None
-                    or (
-                        next_token_index
-                        and prev_token_index is not None
-                        and next_token_index >= 10
-                        and next_token_index - prev_token_index == 10
-                    )
-                    else next_token_index
-                )
-                if next_token_index is None:
-                    return sem_tokens
-                nxt_tok_pos = get_token_start(next_token_index, sem_tokens)
-                is_single_line_change = change_end_line == change_start_line
-                is_next_token_same_line = change_end_line == nxt_tok_pos[0]
-                if (
-                    is_single_line_change
-                    and insert_inside_token
-                    and prev_token_index is not None
-                ):
-                    sem_tokens = SemTokManager.handle_single_line_delete(
-                        sem_tokens,
-                        next_token_index,
-                        prev_token_index,
-                        is_next_token_same_line,
-                        change,
-                    )
-                elif is_single_line_change and is_edit_between_tokens:
-                    sem_tokens = SemTokManager.handle_single_line_delete_between_tokens(
-                        sem_tokens,
-                        next_token_index,
-                        is_next_token_same_line,
-                        change,
-                        change_start_line,
-                        change_end_line,
-                    )
-                else:
-                    sem_tokens = SemTokManager.handle_multi_line_delete(
-                        sem_tokens,
-                        next_token_index,
-                        nxt_tok_pos,
-                        change_start_line,
-                        change_end_line,
-                        change_start_char,
-                        change_end_char,
-                        prev_tok_pos,
-                        is_next_token_same_line,
-                    )
-                return sem_tokens
-
-            is_token_boundary_edit = False
-            if insert_inside_token and prev_token_index is not None:
-                sem_tokens, is_token_boundary_edit, nxt_tok_pos, next_token_index = (
-                    SemTokManager.handle_insert_inside_token(
-                        change,
-                        sem_tokens,
-                        prev_token_index,
-                        changing_line_text,
-                        line_delta,
-                        prev_tok_pos,
-                        change_start_char,
-                        change_end_char,
-                        is_token_boundary_edit,
-                        nxt_tok_pos,
-                    )
-                )
-            tokens_on_same_line = prev_tok_pos[0] == nxt_tok_pos[0]
-            if (
-                is_edit_between_tokens
-                or is_token_boundary_edit
-                or is_multiline_insertion
-            ) and next_token_index is not None:
-                if is_multiline_insertion:
-                    sem_tokens = SemTokManager.handle_multi_line_insertion(
-                        sem_tokens,
-                        next_token_index,
-                        nxt_tok_pos,
-                        change_start_line,
-                        change_end_line,
-                        change_end_char,
-                        prev_tok_pos,
-                        tokens_on_same_line,
-                        changing_line_text,
-                        line_delta,
-                    )
-                else:
-                    sem_tokens = SemTokManager.handle_single_line_insertion(
-                        sem_tokens,
-                        next_token_index,
-                        is_next_token_same_line,
-                        change,
-                        tokens_on_same_line,
-                        nxt_tok_pos,
-                        change_start_line,
-                        line_delta,
-                    )
-        return sem_tokens
-
     @staticmethod
-    def handle_multi_line_delete(
-        sem_tokens: list[int],
-        next_token_index: int,
-        nxt_tok_pos: tuple[int, int, int],
-        change_start_line: int,
-        change_end_line: int,
-        change_start_char: int,
-        change_end_char: int,
-        prev_tok_pos: tuple[int, int, int],
-        is_next_token_same_line: bool,
-    ) -> list[int]:
-        """Handle multi line deletion."""
-        if is_next_token_same_line:
-            char_del = nxt_tok_pos[1] - change_end_char
-            total_char_del = change_start_char + char_del
-            sem_tokens[next_token_index + 1] = (
-                (total_char_del - prev_tok_pos[1])
-                if prev_tok_pos[0] == change_start_line
-                else total_char_del
+    def bucket_sem_tokens(sem_tokens: List[int]) -> List[List[SemToken]]:
+        """Return encoded semantic tokens bucketed by line."""
+        lines: List[List[SemToken]] = []
+        line, char = 0, 0
+        for i in range(0, len(sem_tokens) - 4, 5):
+            if sem_tokens[i] > 0:
+                line += sem_tokens[i]
+                char = 0
+            char += sem_tokens[i + 1]
+            while len(lines) <= line:
+                lines.append([])
+            lines[line].append(
+                [char, char + sem_tokens[i + 2], *sem_tokens[i + 3 : i + 5], i // 5]
             )
-        sem_tokens[next_token_index] -= change_end_line - change_start_line
-        return sem_tokens
-
-    @staticmethod
-    def handle_single_line_delete_between_tokens(
-        sem_tokens: list[int],
-        next_token_index: int,
-        is_next_token_same_line: bool,
-        change: lspt.TextDocumentContentChangeEvent_Type1,
-        change_start_line: int,
-        change_end_line: int,
-    ) -> list[int]:
-        """Handle single line deletion between tokens."""
-        if is_next_token_same_line:
-            sem_tokens[next_token_index + 1] -= change.range_length
-
-        else:
-            sem_tokens[next_token_index] -= change_end_line - change_start_line
-        return sem_tokens
-
-    @staticmethod
-    def handle_single_line_delete(
-        sem_tokens: list[int],
-        next_token_index: int,
-        prev_token_index: int,
-        is_next_token_same_line: bool,
-        change: lspt.TextDocumentContentChangeEvent_Type1,
-    ) -> list[int]:
-        """Handle single line deletion."""
-        sem_tokens[prev_token_index + 2] -= change.range_length
-        if is_next_token_same_line:
-            sem_tokens[next_token_index + 1] -= change.range_length
-        return sem_tokens
-
-    @staticmethod
-    def handle_single_line_insertion(
-        sem_tokens: list[int],
-        next_token_index: int,
-        is_next_token_same_line: bool,
-        change: lspt.TextDocumentContentChangeEvent_Type1,
-        tokens_on_same_line: bool,
-        nxt_tok_pos: tuple[int, int, int],
-        change_start_line: int,
-        line_delta: int,
-    ) -> list[int]:
-        """Handle single line insertion."""
-        if tokens_on_same_line:
-            sem_tokens[next_token_index + 1] += len(change.text)
-            sem_tokens[next_token_index] += line_delta
-        else:
-            is_next_token_same_line = change_start_line == nxt_tok_pos[0]
-            if is_next_token_same_line:
-                sem_tokens[next_token_index] += line_delta
-                sem_tokens[next_token_index + 1] += len(change.text)
-            else:
-                sem_tokens[next_token_index] += line_delta
-        return sem_tokens
+        return lines
 
     @staticmethod
-    def handle_multi_line_insertion(
-        sem_tokens: list[int],
-        next_token_index: int,
-        nxt_tok_pos: tuple[int, int, int],
-        change_start_line: int,
-        change_end_line: int,
-        change_end_char: int,
-        prev_tok_pos: tuple[int, int, int],
-        tokens_on_same_line: bool,
-        changing_line_text: tuple[str, int],
-        line_delta: int,
-    ) -> list[int]:
-        """Handle multi line insertion."""
-        if tokens_on_same_line:
-            char_del = nxt_tok_pos[1] - change_end_char
-            total_char_del = changing_line_text[1] + char_del
-
-        else:
-            is_prev_token_same_line = change_end_line == prev_tok_pos[0]
-            is_next_token_same_line = change_start_line == nxt_tok_pos[0]
-            if is_prev_token_same_line:
-                total_char_del = nxt_tok_pos[1]
-            elif is_next_token_same_line:
-                char_del = nxt_tok_pos[1] - change_end_char
-                total_char_del = changing_line_text[1] + char_del
-            else:
-                total_char_del = sem_tokens[next_token_index + 1]
-                line_delta -= change_end_line - change_start_line
-        sem_tokens[next_token_index + 1] = total_char_del
-        sem_tokens[next_token_index] += line_delta
-        return sem_tokens
+    def encode_sem_tokens(lines: List[List[SemToken]]) -> List[int]:
+        """Return semantic tokens bucketed by line in the protocol encoding."""
+        tokens: List[int] = []
+        prev_line, prev_col = 0, 0
+        for line, toks in enumerate(lines):
+            for col, end_col, *kind, _ in toks:
+                tokens += [
+                    line - prev_line,
+                    col if line != prev_line else col - prev_col,
+                    end_col - col,
+                    *kind,
+                ]
+                prev_line, prev_col = line, col
+        return tokens
 
     @staticmethod
-    def handle_insert_inside_token(
+    def update_lines(
+        lines: List[List[SemToken]],
         change: lspt.TextDocumentContentChangeEvent_Type1,
-        sem_tokens: list[int],
-        prev_token_index: int,
-        changing_line_text: tuple[str, int],
-        line_delta: int,
-        prev_tok_pos: tuple[int, int, int],
-        change_start_char: int,
-        change_end_char: int,
-        is_token_boundary_edit: bool,
-        nxt_tok_pos: tuple[int, int, int],
-    ) -> tuple[list[int], bool, tuple[int, int, int], Optional[int]]:
-        """Handle insert inside token."""
-        next_token_index = None
-        for i in ["\n", " ", "\t"]:
-            if i in change.text:
-                if prev_tok_pos[1] == change_start_char:
-                    if i == "\n":
-                        sem_tokens[prev_token_index] += line_delta
-                        sem_tokens[prev_token_index + 1] = changing_line_text[1]
-                    else:
-                        sem_tokens[prev_token_index + 1] += len(change.text)
-                    return (
-                        sem_tokens,
-                        is_token_boundary_edit,
-                        nxt_tok_pos,
-                        next_token_index,
-                    )
-                else:
-                    is_token_boundary_edit = True
-                    next_token_index = prev_token_index + 5
-                    nxt_tok_pos = get_token_start(next_token_index, sem_tokens)
-                    break
-        if not is_token_boundary_edit:
-            selected_region = change_end_char - change_start_char
-            index_offset = 2
-            sem_tokens[prev_token_index + index_offset] += (
-                len(change.text) - selected_region
-            )
-            if prev_tok_pos[0] == get_token_start(prev_token_index + 5, sem_tokens)[0]:
-                sem_tokens[prev_token_index + index_offset + 4] += (
-                    len(change.text) - selected_region
-                )
-        return sem_tokens, is_token_boundary_edit, nxt_tok_pos, next_token_index
+    ) -> None:
+        """Move the tokens of the lines a change replaces, shifting later lines."""
+        start_line, start_char = change.range.start.line, change.range.start.character
+        end_line, end_char = change.range.end.line, change.range.end.character
+        text_lines = change.text.split("\n")
+        # where the character after the replaced range ends up on its new line
+        new_end_char = len(text_lines[-1]) + (start_char if len(text_lines) == 1 else 0)
+        splits_token = any(i in change.text for i in ("\n", " ", "\t"))
+        while len(lines) <= end_line:
+            lines.append([])
+        before: List[SemToken] = []
+        after: List[SemToken] = []
+        for line in range(start_line, end_line + 1):
+            for tok in lines[line]:
+                if (
+                    start_line == line == end_line
+                    and tok[0] <= start_char
+                    and end_char <= tok[1]
+                    and not splits_token
+                ):
+                    # typing inside a token resizes it
+                    tok[1] += new_end_char - end_char
+                    before.append(tok)
+                elif line == start_line and tok[0] < start_char:
+                    tok[1] = min(tok[1], start_char)
+                    before.append(tok)
+                elif line == end_line and tok[0] >= end_char:
+                    tok[0] += new_end_char - end_char
+                    tok[1] += new_end_char - end_char
+                    after.append(tok)
+                # tokens in the replaced text are gone until the next check
+        lines[start_line : end_line + 1] = (
+            [before + after]
+            if len(text_lines) == 1
+            else [before, *([] for _ in text_lines[2:]), after]
+        )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Optional
 
 from jaclang.compiler.constant import (
@@ -16,6 +17,12 @@ import lsprotocol.types as lspt
 server = JacLangServer()
 
 
+@server.feature(lspt.INITIALIZED)
+async def initialized(ls: JacLangServer, params: lspt.InitializedParams) -> None:
+    """Index workspace symbols once the client is ready."""
+    await ls.launch_index_workspace()
+
+
 @server.feature(lspt.TEXT_DOCUMENT_DID_OPEN)
 async def did_open(ls: JacLangServer, params: lspt.DidOpenTextDocumentParams) -> None:
     """Check syntax on change."""
@@ -27,6 +34,9 @@ async def did_open(ls: JacLangServer, params: lspt.DidOpenTextDocumentParams) ->
 async def did_save(ls: JacLangServer, params: lspt.DidOpenTextDocumentParams) -> None:
     """Check syntax on change."""
     file_path = params.text_document.uri
+    await asyncio.get_event_loop().run_in_executor(
+        ls.executor, ls.update_index, file_path
+    )
     if ls.modules[file_path].is_modified:
         await ls.launch_deep_check(file_path)
         ls.lsp.send_request(lspt.WORKSPACE_SEMANTIC_TOKENS_REFRESH)
@@ -38,16 +48,13 @@ async def did_change(
     ls: JacLangServer, params: lspt.DidChangeTextDocumentParams
 ) -> None:
     """Check syntax on change."""
-    module = ls.modules[params.text_document.uri]
-    module.is_modified = True
-    await ls.launch_quick_check(file_path := params.text_document.uri)
+    file_path = params.text_document.uri
     if file_path in ls.modules:
-        document = ls.workspace.get_text_document(file_path)
-        lines = document.source.splitlines()
-        ls.modules[file_path].sem_manager.update_sem_tokens(
-            params, ls.modules[file_path].sem_manager.sem_tokens, lines
-        )
+        module = ls.modules[file_path]
+        module.is_modified = True
+        module.sem_manager.apply_changes(params)
         ls.lsp.send_request(lspt.WORKSPACE_SEMANTIC_TOKENS_REFRESH)
+    await ls.launch_quick_check(file_path)
 
 
 @server.feature(lspt.TEXT_DOCUMENT_FORMATTING)
@@ -66,8 +73,12 @@ def formatting(
         ]
     ),
 )
-def did_create_files(ls: JacLangServer, params: lspt.CreateFilesParams) -> None:
+async def did_create_files(ls: JacLangServer, params: lspt.CreateFilesParams) -> None:
     """Check syntax on file creation."""
+    for file in params.files:
+        await asyncio.get_event_loop().run_in_executor(
+            ls.executor, ls.update_index, file.uri
+        )
 
 
 @server.feature(
@@ -143,6 +154,14 @@ def references(ls: JacLangServer, params: lspt.ReferenceParams) -> list[lspt.Loc
     return ls.get_references(params.text_document.uri, params.position)
 
 
+@server.feature(lspt.WORKSPACE_SYMBOL)
+def workspace_symbol(
+    ls: JacLangServer, params: lspt.WorkspaceSymbolParams
+) -> list[lspt.SymbolInformation]:
+    """Provide workspace symbols."""
+    return ls.get_workspace_symbols(params.query)
+
+
 @server.feature(lspt.TEXT_DOCUMENT_RENAME)
 def rename(
     ls: JacLangServer, params: lspt.RenameParams
@@ -166,9 +185,28 @@ def semantic_tokens_full(
     return ls.get_semantic_tokens(params.text_document.uri)
 
 
+@server.feature(lspt.TEXT_DOCUMENT_SEMANTIC_TOKENS_FULL_DELTA)
+def semantic_tokens_full_delta(
+    ls: JacLangServer, params: lspt.SemanticTokensDeltaParams
+) -> lspt.SemanticTokens | lspt.SemanticTokensDelta:
+    """Provide semantic token edits since the previous result."""
+    return ls.get_semantic_tokens_delta(
+        params.text_document.uri, params.previous_result_id
+    )
+
+
+@server.feature(lspt.TEXT_DOCUMENT_SEMANTIC_TOKENS_RANGE)
+def semantic_tokens_range(
+    ls: JacLangServer, params: lspt.SemanticTokensRangeParams
+) -> lspt.SemanticTokens:
+    """Provide semantic tokens of a range."""
+    return ls.get_semantic_tokens_range(params.text_document.uri, params.range)
+
+
 def run_lang_server() -> None:
     """Run the language server."""
     settings.pass_timer = True
+    settings.mypy_warm_cache = True
     server.start_io()
 
 
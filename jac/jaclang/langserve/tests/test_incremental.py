@@ -0,0 +1,115 @@
+"""Test incremental checking."""
+
+from typing import Optional
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.compile import jac_pass_to_pass, jac_str_to_pass
+from jaclang.compiler.passes import Pass
+from jaclang.compiler.passes.main import JacTypeCheckPass
+from jaclang.compiler.passes.main.schedules import py_code_gen, type_checker_sched
+from jaclang.langserve.incremental import TypeCheckSnapshot, check_source, walk
+from jaclang.utils.test import TestCase
+from jaclang.vendor.pygls import uris
+
+import lsprotocol.types as lspt
+
+
+class TestIncrementalCheck(TestCase):
+    """Test incremental checking."""
+
+    def setUp(self) -> None:
+        """Load document."""
+        self.path = self.fixture_abs_path("circle.jac")
+        self.uri = uris.from_fs_path(self.path)
+        with open(self.path) as f:
+            self.lines = f.read().splitlines(keepends=True)
+        return super().setUp()
+
+    def edit(self, line: int, old: str, new: str) -> None:
+        """Replace text on a line of the document."""
+        self.assertIn(old, self.lines[line])
+        self.lines[line] = self.lines[line].replace(old, new)
+
+    def test_matches_full_parse(self) -> None:
+        """Test incremental checks agree with parsing the whole document."""
+        snapshot = check_source(self.uri, self.path, "".join(self.lines), None)
+        self.assertFalse(snapshot.has_errors)
+        edits = [
+            (12, "radius * radius", "radius ** 2"),
+            (12, "return", "retrn"),
+            (42, "self.radius", "self.radius +"),
+            (12, "retrn", "return"),
+            (8, "glob RAD = 5;", "glob RAD = 5;\nglob DIAM = 10;\n"),
+            (44, "self.radius +", "self.radius"),
+        ]
+        for line, old, new in edits:
+            self.edit(line, old, new)
+            source = "".join(self.lines)
+            self.lines = source.splitlines(keepends=True)
+            snapshot = check_source(self.uri, self.path, source, snapshot)
+            full = check_source(self.uri, self.path, source, None)
+            self.assertEqual(snapshot.has_errors, full.has_errors)
+            if not full.has_errors:
+                self.assertEqual(snapshot.elements, full.elements)
+                self.assertEqual(snapshot.diagnostics, full.diagnostics)
+
+    def test_errors_carried_over(self) -> None:
+        """Test errors of untouched lines stay in place as lines move."""
+        snapshot = check_source(self.uri, self.path, "".join(self.lines), None)
+        self.edit(12, "return", "retrn")
+        snapshot = check_source(self.uri, self.path, "".join(self.lines), snapshot)
+        self.assertEqual(
+            [i.range.start.line for i in snapshot.diagnostics if self.is_error(i)],
+            [12],
+        )
+        self.lines.insert(60, "glob more = 1;\n")
+        self.lines.insert(1, "\n")
+        snapshot = check_source(self.uri, self.path, "".join(self.lines), snapshot)
+        self.assertEqual(
+            [i.range.start.line for i in snapshot.diagnostics if self.is_error(i)],
+            [13],
+        )
+
+    def test_type_check_reuse(self) -> None:
+        """Test only changed elements and their users are type checked again."""
+
+        def build(snapshot: Optional[TypeCheckSnapshot] = None) -> Pass:
+            prse = jac_str_to_pass("".join(self.lines), self.path, schedule=py_code_gen)
+            reused = snapshot.reuse(prse) if snapshot else {}
+            checked = jac_pass_to_pass(prse, schedule=type_checker_sched)
+            if snapshot:
+                snapshot.carry_alerts(checked, reused)
+            return checked
+
+        snapshot = TypeCheckSnapshot(build())
+        self.edit(12, "return", "x: int = radius;\n    return")
+        incremental, full = build(snapshot), build()
+        self.assertEqual(
+            sorted(i.as_log() for i in incremental.warnings_had),
+            sorted(i.as_log() for i in full.warnings_had),
+        )
+        self.assertIn("Incompatible types in assignment", str(incremental.warnings_had))
+        assert isinstance(incremental.ir, ast.Module)
+        assert isinstance(full.ir, ast.Module)
+        reused = [incremental.ir.body.index(i) for i in incremental.ir.reused_elements]
+        # the edited function and the entry and test calling it are checked again
+        self.assertEqual(len(reused), len(full.ir.body) - 3)
+        self.assertTrue(JacTypeCheckPass.skipped_bodies(incremental.ir))
+        for index in reused:
+            self.assertEqual(
+                [
+                    i.expr_type
+                    for i in walk(incremental.ir.body[index])
+                    if isinstance(i, ast.Expr)
+                ],
+                [
+                    i.expr_type
+                    for i in walk(full.ir.body[index])
+                    if isinstance(i, ast.Expr)
+                ],
+            )
+
+    @staticmethod
+    def is_error(diagnostic: lspt.Diagnostic) -> bool:
+        """Check diagnostic is an error."""
+        return diagnostic.severity == lspt.DiagnosticSeverity.Error
@@ -0,0 +1,132 @@
+"""Test workspace symbol index."""
+
+import os
+import tempfile
+
+from jaclang.langserve.engine import JacLangServer
+from jaclang.langserve.index import WorkspaceIndex
+from jaclang.utils.test import TestCase
+from jaclang.vendor.pygls import uris
+from jaclang.vendor.pygls.workspace import Workspace
+
+import lsprotocol.types as lspt
+
+
+class TestWorkspaceIndex(TestCase):
+    """Test workspace symbol index."""
+
+    def setUp(self) -> None:
+        """Create workspace."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        self.write(
+            "shapes.jac", "obj Shape {\n    has size: int = 1;\n}\nglob unit = 1;\n"
+        )
+        self.write(
+            "app.jac",
+            "import:jac from shapes { Shape }\n\nwith entry {\n    s = Shape();\n}\n",
+        )
+        self.write("other.jac", "obj Shape {}\n")
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        """Remove workspace."""
+        self.tmp.cleanup()
+        return super().tearDown()
+
+    def write(self, name: str, source: str) -> str:
+        """Write a workspace file."""
+        path = os.path.join(self.root, name)
+        with open(path, "w") as f:
+            f.write(source)
+        return path
+
+    def test_references_and_symbols(self) -> None:
+        """Test lookups only follow files importing the module."""
+        index = WorkspaceIndex(self.root)
+        self.assertEqual(index.build(), 3)
+        shapes = os.path.join(self.root, "shapes.jac")
+        refs = index.references(shapes, "Shape", skip={shapes})
+        self.assertEqual(
+            [(uris.to_fs_path(i.uri), i.range.start.line) for i in refs],
+            [
+                (os.path.join(self.root, "app.jac"), 0),
+                (os.path.join(self.root, "app.jac"), 3),
+            ],
+        )
+        self.assertEqual(
+            sorted(i.name for i in index.symbols("SHA")), ["Shape", "Shape"]
+        )
+        self.assertEqual([i.name for i in index.symbols("uni")], ["unit"])
+
+    def test_references_resolve_to_module(self) -> None:
+        """Test only names resolving to the module are references."""
+        app = self.write(
+            "app.jac",
+            "import:jac from shapes { Shape as S }\nimport:jac shapes as sh;\n\n"
+            "obj Box {\n    has Shape: int = 0;\n\n"
+            "    can make(Shape: int) -> S {\n        self.Shape = Shape;\n"
+            "        return S(size=Shape);\n    }\n}\n\n"
+            "with entry {\n    b = sh.Shape();\n    Shape = 2;\n}\n",
+        )
+        index = WorkspaceIndex(self.root)
+        index.build()
+        shapes = os.path.join(self.root, "shapes.jac")
+        refs = index.references(shapes, "Shape", skip={shapes})
+        self.assertEqual(
+            [(i.range.start.line, i.range.start.character) for i in refs],
+            [(0, 25), (13, 11)],
+        )
+        self.assertEqual([uris.to_fs_path(i.uri) for i in refs], [app, app])
+        self.assertEqual(index.references(shapes, "size", skip={shapes}), [])
+
+    def test_persisted_by_hash(self) -> None:
+        """Test unchanged files are not parsed again."""
+        WorkspaceIndex(self.root).build()
+        index = WorkspaceIndex(self.root)
+        self.assertEqual(index.build(), 0)
+        self.write("app.jac", "import:jac from shapes { Shape }\n")
+        os.remove(os.path.join(self.root, "other.jac"))
+        self.assertEqual(index.build(), 1)
+        self.assertEqual(len(index.files), 2)
+        app = os.path.join(self.root, "app.jac")
+        self.assertFalse(index.update(app, "import:jac from shapes { Shape }\n"))
+        self.assertTrue(index.update(app, "with entry {}\n"))
+        shapes = os.path.join(self.root, "shapes.jac")
+        self.assertEqual(index.references(shapes, "Shape", skip={shapes}), [])
+
+    def test_batched_save(self) -> None:
+        """Test changes made before a scheduled save are written together."""
+        index = WorkspaceIndex(self.root)
+        index.build()
+        app = os.path.join(self.root, "app.jac")
+        index.update(app, "with entry {}\n")
+        index.schedule_save(0.05)
+        timer = index.save_timer
+        index.remove(os.path.join(self.root, "other.jac"))
+        index.schedule_save(0.05)
+        self.assertIs(index.save_timer, timer)
+        assert timer is not None
+        timer.join()
+        self.assertIsNone(index.save_timer)
+        saved = WorkspaceIndex(self.root)
+        saved.load()
+        self.assertEqual(saved.files, index.files)
+        self.assertEqual(
+            os.listdir(os.path.dirname(index.path)), ["workspace_index.json"]
+        )
+
+    def test_server_references(self) -> None:
+        """Test references include indexed files that were not compiled."""
+        lsp = JacLangServer()
+        lsp.lsp._workspace = Workspace(self.root, lsp)
+        shapes = uris.from_fs_path(os.path.join(self.root, "shapes.jac"))
+        lsp.deep_check(shapes)
+        lsp.index_workspace()
+        refs = lsp.get_references(shapes, lspt.Position(0, 5))
+        self.assertIn(
+            (uris.from_fs_path(os.path.join(self.root, "app.jac")), 3),
+            [(i.uri, i.range.start.line) for i in refs],
+        )
+        symbols = lsp.get_workspace_symbols("shape")
+        self.assertEqual(len(symbols), 2)
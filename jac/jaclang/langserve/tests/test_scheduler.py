@@ -0,0 +1,148 @@
+"""Test scheduling of document analyses."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.compile import jac_file_to_pass, jac_str_to_pass
+from jaclang.compiler.passes import PassCancelledError
+from jaclang.compiler.passes.main.schedules import py_code_gen
+from jaclang.langserve.scheduler import AnalysisScheduler
+from jaclang.utils.test import TestCase
+
+
+class TestAnalysisScheduler(TestCase):
+    """Test scheduling of document analyses."""
+
+    def setUp(self) -> None:
+        """Create scheduler."""
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.scheduler = AnalysisScheduler(self.executor)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        """Shut down executor."""
+        self.executor.shutdown()
+        return super().tearDown()
+
+    def test_debounce(self) -> None:
+        """Test only the last of quickly repeated requests runs."""
+        calls: list[str] = []
+
+        def analyze(uri: str) -> bool:
+            calls.append(uri)
+            return True
+
+        async def run() -> list[bool]:
+            results = []
+            for _ in range(3):
+                results.append(
+                    asyncio.create_task(
+                        self.scheduler.schedule("a.jac", "quick", analyze, 0.05)
+                    )
+                )
+                await asyncio.sleep(0)
+            results.append(
+                asyncio.create_task(
+                    self.scheduler.schedule("b.jac", "quick", analyze, 0.05)
+                )
+            )
+            return list(await asyncio.gather(*results))
+
+        self.assertEqual(asyncio.run(run()), [False, False, True, True])
+        self.assertEqual(sorted(calls), ["a.jac", "b.jac"])
+        self.assertEqual(self.scheduler.jobs, {})
+
+    def test_concurrent_checks_keep_comments(self) -> None:
+        """Test checks of two documents running at once keep their own comments."""
+        sources = {
+            uri: "".join(f"# {uri} {i}\nglob x{i} = {i};\n" for i in range(300))
+            for uri in ("a.jac", "b.jac")
+        }
+        both_started = threading.Barrier(2)
+        comments: dict[str, list[str]] = {}
+
+        def analyze(uri: str) -> bool:
+            both_started.wait(10)
+            build = jac_str_to_pass(sources[uri], uri, schedule=py_code_gen)
+            assert isinstance(build.ir, ast.Module)
+            comments[uri] = [i.value for i in build.ir.source.comments]
+            return not build.errors_had
+
+        async def run() -> list[bool]:
+            return list(
+                await asyncio.gather(
+                    *(self.scheduler.schedule(i, "deep", analyze) for i in sources)
+                )
+            )
+
+        self.assertEqual(asyncio.run(run()), [True, True])
+        for uri in sources:
+            self.assertEqual(comments[uri], [f"# {uri} {i}" for i in range(300)])
+
+    def test_type_checks_queued(self) -> None:
+        """Test type checks wait for each other without holding pool threads."""
+        started, release = threading.Event(), threading.Event()
+        calls: list[str] = []
+
+        def type_check(uri: str) -> bool:
+            calls.append(uri)
+            started.set()
+            release.wait(10)
+            return True
+
+        def analyze(uri: str) -> bool:
+            calls.append(uri)
+            return True
+
+        async def run() -> list[bool]:
+            first = asyncio.create_task(
+                self.scheduler.schedule("a.jac", "deep", type_check, type_checks=True)
+            )
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 10)
+            queued = asyncio.create_task(
+                self.scheduler.schedule("b.jac", "deep", type_check, type_checks=True)
+            )
+            await asyncio.sleep(0)
+            quick = [
+                await self.scheduler.schedule(i, "quick", analyze)
+                for i in ("a.jac", "b.jac")
+            ]
+            self.scheduler.cancel("b.jac", "deep")
+            release.set()
+            return [await first, await queued, *quick]
+
+        self.assertEqual(asyncio.run(run()), [True, False, True, True])
+        self.assertEqual(calls, ["a.jac", "a.jac", "b.jac"])
+
+    def test_cancel_running(self) -> None:
+        """Test a running compilation stops once cancelled."""
+        started, release = threading.Event(), threading.Event()
+        outcome: list[str] = []
+
+        def analyze(uri: str) -> bool:
+            started.set()
+            release.wait(10)
+            try:
+                jac_file_to_pass(self.fixture_abs_path("circle.jac"))
+                outcome.append("finished")
+            except PassCancelledError:
+                outcome.append("cancelled")
+            return True
+
+        async def run() -> bool:
+            task = asyncio.create_task(
+                self.scheduler.schedule("circle.jac", "deep", analyze)
+            )
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 10)
+            self.scheduler.cancel("circle.jac")
+            release.set()
+            return await task
+
+        self.assertFalse(asyncio.run(run()))
+        self.executor.shutdown(wait=True)
+        self.assertEqual(outcome, ["cancelled"])
+        self.assertEqual(
+            jac_file_to_pass(self.fixture_abs_path("circle.jac")).errors_had, []
+        )
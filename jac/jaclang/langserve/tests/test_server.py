@@ -2,6 +2,7 @@ from jaclang.utils.test import TestCase
 from jaclang.vendor.pygls import uris
 from jaclang.vendor.pygls.workspace import Workspace
 from jaclang.langserve.engine import JacLangServer
+from jaclang.langserve.utils import decode_sem_tokens
 from .session import LspSession
 
 import lsprotocol.types as lspt
@@ -295,6 +296,55 @@ class TestJacLangServer(TestCase):
         for token_type, expected_count in expected_counts:
             self.assertEqual(str(sem_list).count(token_type), expected_count)
 
+    def test_sem_tokens_range_delta(self) -> None:
+        """Test range and delta semantic token requests."""
+        lsp = JacLangServer()
+        workspace_path = self.fixture_abs_path("")
+        workspace = Workspace(workspace_path, lsp)
+        lsp.lsp._workspace = workspace
+        circle_file = uris.from_fs_path(self.fixture_abs_path("circle.jac"))
+        lsp.deep_check(circle_file)
+        manager = lsp.modules[circle_file].sem_manager
+        math_index = manager.find_index(11, 12)
+        full = lsp.get_semantic_tokens(circle_file)
+        rng = lspt.Range(lspt.Position(10, 0), lspt.Position(13, 0))
+        part = lsp.get_semantic_tokens_range(circle_file, rng).data
+        self.assertEqual(
+            [(i, j) for i, j, _ in manager.positions if 10 <= i < 13],
+            [(i, j) for i, j, _ in decode_sem_tokens(part)],
+        )
+        self.assertEqual(part[0], 11)
+        full = lsp.get_semantic_tokens_delta(circle_file, "0")
+        self.assertIsInstance(full, lspt.SemanticTokens)
+        self.assertEqual(full.data, manager.sem_tokens)
+
+        delta = lsp.get_semantic_tokens_delta(circle_file, full.result_id)
+        self.assertEqual(delta.edits, [])
+        manager.apply_changes(
+            lspt.DidChangeTextDocumentParams(
+                text_document=lspt.VersionedTextDocumentIdentifier(
+                    version=2, uri=circle_file
+                ),
+                content_changes=[
+                    lspt.TextDocumentContentChangeEvent_Type1(
+                        range=lspt.Range(lspt.Position(11, 4), lspt.Position(11, 4)),
+                        text="\n",
+                        range_length=0,
+                    )
+                ],
+            )
+        )
+        self.assertIsNotNone(math_index)
+        self.assertEqual(manager.find_index(12, 8), math_index)
+        self.assertEqual(manager.lines[11], [])
+        old = list(full.data)
+        delta = lsp.get_semantic_tokens_delta(circle_file, delta.result_id)
+        for edit in delta.edits:
+            old[edit.start : edit.start + edit.delete_count] = edit.data
+        self.assertEqual(old, manager.sem_tokens)
+        self.assertEqual(manager.positions, decode_sem_tokens(manager.sem_tokens))
+        self.assertEqual(manager.find_index(*manager.positions[7][:2]), 7)
+
     def test_completion(self) -> None:
         """Test that the completions are correct."""
         lsp = JacLangServer()
@@ -1,10 +1,10 @@
 """Utility functions for the language server."""
 
-import asyncio
 import builtins
 import re
-from functools import wraps
-from typing import Any, Awaitable, Callable, Coroutine, Optional, ParamSpec, TypeVar
+import sys
+from bisect import bisect_right
+from typing import Optional
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.codeloc import CodeLocInfo
@@ -15,9 +15,6 @@ from jaclang.vendor.pygls import uris
 
 import lsprotocol.types as lspt
 
-T = TypeVar("T", bound=Callable[..., Coroutine[Any, Any, Any]])
-P = ParamSpec("P")
-
 
 def gen_diagnostics(
     from_path: str, errors: list[Alert], warnings: list[Alert]
@@ -42,34 +39,6 @@ def gen_diagnostics(
     ]
 
 
-def debounce(wait: float) -> Callable[[T], Callable[..., Awaitable[None]]]:
-    """Debounce decorator for async functions."""
-
-    def decorator(fn: T) -> Callable[..., Awaitable[None]]:
-        @wraps(fn)
-        async def debounced(*args: P.args, **kwargs: P.kwargs) -> None:
-            async def call_it() -> None:
-                await fn(*args, **kwargs)
-
-            if hasattr(debounced, "_task"):
-                debounced._task.cancel()
-
-            async def debounced_coro() -> None:
-                try:
-                    await asyncio.sleep(wait)
-                    await call_it()
-                except asyncio.CancelledError:
-                    pass
-
-            setattr(  # noqa: B010
-                debounced, "_task", asyncio.create_task(debounced_coro())
-            )
-
-        return debounced
-
-    return decorator
-
-
 def sym_tab_list(sym_tab: SymbolTable, file_path: str) -> list[SymbolTable]:
     """Iterate through symbol table."""
     sym_tabs = (
@@ -132,17 +101,35 @@ def find_index(
     char: int,
 ) -> Optional[int]:
     """Find index."""
-    index = None
+    return find_token(decode_sem_tokens(sem_tokens), line, char)
 
-    # A list contains all the token start positions.
-    token_start_list = [
-        get_token_start(i, sem_tokens) for i in range(0, len(sem_tokens), 5)
-    ]
-    for i, j in enumerate(token_start_list):
-        if j[0] == line and j[1] <= char <= j[2]:
-            return i
 
-    return index
+def decode_sem_tokens(sem_tokens: list[int]) -> list[tuple[int, int, int]]:
+    """Return line, start and end character of every token."""
+    positions = []
+    line, char = 0, 0
+    for i in range(0, len(sem_tokens) - 4, 5):
+        if sem_tokens[i] > 0:
+            line += sem_tokens[i]
+            char = 0
+        char += sem_tokens[i + 1]
+        positions.append((line, char, char + sem_tokens[i + 2]))
+    return positions
+
+
+def find_token(
+    positions: list[tuple[int, int, int]], line: int, char: int
+) -> Optional[int]:
+    """Binary search the token at a position, the earlier one if two touch."""
+    index = bisect_right(positions, (line, char, sys.maxsize)) - 1
+    for i in (index - 1, index):
+        if (
+            i >= 0
+            and positions[i][0] == line
+            and positions[i][1] <= char <= positions[i][2]
+        ):
+            return i
+    return None
 
 
 def get_symbols_for_outline(node: SymbolTable) -> list[lspt.DocumentSymbol]:
@@ -346,101 +333,6 @@ def parse_symbol_path(text: str, dot_position: int) -> list[str]:
     return all_words
 
 
-def get_token_start(
-    token_index: int | None, sem_tokens: list[int]
-) -> tuple[int, int, int]:
-    """Return the starting position of a token."""
-    if token_index is None or token_index >= len(sem_tokens):
-        return 0, 0, 0
-
-    current_line = 0
-    current_char = 0
-    current_tok_index = 0
-
-    while current_tok_index < len(sem_tokens):
-        token_line_delta = sem_tokens[current_tok_index]
-        token_start_char = sem_tokens[current_tok_index + 1]
-
-        if token_line_delta > 0:
-            current_line += token_line_delta
-            current_char = 0
-        if current_tok_index == token_index:
-            if token_line_delta > 0:
-                return (
-                    current_line,
-                    token_start_char,
-                    token_start_char + sem_tokens[current_tok_index + 2],
-                )
-            return (
-                current_line,
-                current_char + token_start_char,
-                current_char + token_start_char + sem_tokens[current_tok_index + 2],
-            )
-
-        current_char += token_start_char
-        current_tok_index += 5
-
-    return (
-        current_line,
-        current_char,
-        current_char + sem_tokens[current_tok_index + 2],
-    )
-
-
-def find_surrounding_tokens(
-    change_start_line: int,
-    change_start_char: int,
-    change_end_line: int,
-    change_end_char: int,
-    sem_tokens: list[int],
-) -> tuple[int | None, int | None, bool]:
-    """Find the indices of the previous and next tokens surrounding the change."""
-    prev_token_index = None
-    next_token_index = None
-    inside_tok = False
-    for i, tok in enumerate(
-        [get_token_start(i, sem_tokens) for i in range(0, len(sem_tokens), 5)][0:]
-    ):
-        if (not (prev_token_index is None or next_token_index is None)) and (
-            tok[0] > change_end_line
-            or (tok[0] == change_end_line and tok[1] > change_end_char)
-        ):
-            prev_token_index = i * 5
-            break
-        elif (
-            change_start_line == tok[0] == change_end_line
-            and tok[1] <= change_start_char
-            and tok[2] >= change_end_char
-        ):
-            prev_token_index = i * 5
-            inside_tok = True
-            break
-        elif (tok[0] < change_start_line) or (
-            tok[0] == change_start_line and tok[1] < change_start_char
-        ):
-            prev_token_index = i * 5
-        elif (tok[0] > change_end_line) or (
-            tok[0] == change_end_line and tok[1] > change_end_char
-        ):
-            next_token_index = i * 5
-            break
-
-    return prev_token_index, next_token_index, inside_tok
-
-
-def get_line_of_code(line_number: int, lines: list[str]) -> Optional[tuple[str, int]]:
-    """Get the line of code, and the first non-space character index."""
-    if 0 <= line_number < len(lines):
-        line = lines[line_number].rstrip("\n")
-        first_non_space = len(line) - len(line.lstrip())
-        return line, (
-            first_non_space + 4
-            if line.strip().endswith(("(", "{", "["))
-            else first_non_space
-        )
-    return None
-
-
 def add_unique_text_edit(
     changes: dict[str, list[lspt.TextEdit]], key: str, new_edit: lspt.TextEdit
 ) -> None:
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Callable, Optional, TYPE_CHECKING
 
 from jaclang.plugin.feature import JacFeature as Jac
 from jaclang.runtimelib.constructs import Architype, NodeArchitype
 
+if TYPE_CHECKING:
+    from jaclang.runtimelib.constructs import VisitOrder, WalkerArchitype
+
 
 def dotgen(
     node: Optional[NodeArchitype] = None,
@@ -44,3 +47,18 @@ def dotgen(
 def jid(obj: Architype) -> str:
     """Get the id of the object."""
     return Jac.object_ref(obj)
+
+
+def visit_order(
+    walker: WalkerArchitype,
+    order: VisitOrder | str,
+    priority: Optional[Callable[[NodeArchitype], Any]] = None,
+) -> None:
+    """Set the order a walker visits queued nodes in, lowest priority first."""
+    from jaclang.runtimelib.constructs import Frontier, VisitOrder
+
+    if isinstance(order, str):
+        order = VisitOrder[order.upper()]
+    frontier = Frontier(order, priority)
+    frontier.extend(list(walker.__jac__.next))
+    walker.__jac__.next = frontier
@@ -11,7 +11,7 @@ from collections import OrderedDict
 from dataclasses import field
 from functools import wraps
 from logging import getLogger
-from typing import Any, Callable, Mapping, Optional, Sequence, Type, Union, cast
+from typing import Any, Callable, Mapping, Optional, Sequence, Type, Union
 from uuid import UUID
 
 from jaclang.compiler.constant import colors
@@ -36,12 +36,12 @@ from jaclang.plugin.feature import (
     ast,
 )
 from jaclang.runtimelib.constructs import (
+    DSFuncTable,
     GenericEdge,
     JacTestCheck,
 )
 from jaclang.runtimelib.importer import ImportPathSpec, JacImporter, PythonImporter
 from jaclang.runtimelib.machine import JacMachine, JacProgram
-from jaclang.runtimelib.memory import Shelf, ShelfStorage
 from jaclang.runtimelib.utils import collect_node_connections, traverse_graph
 
 
@@ -72,7 +72,10 @@ class JacAccessValidationImpl:
 
         _root_id = str(root_id)
         if level != access.anchors.get(_root_id, AccessLevel.NO_ACCESS):
+            access = architype.__jac__.writable_access().roots
             access.anchors[_root_id] = level
+            architype.__jac__.dirty = True
+            Jac.get_context().access_cache.clear()
 
     @staticmethod
     @hookimpl
@@ -83,7 +86,9 @@ class JacAccessValidationImpl:
         level = AccessLevel.cast(level)
         access = architype.__jac__.access.roots
 
-        access.anchors.pop(str(root_id), None)
+        if access.anchors.pop(str(root_id), None) is not None:
+            architype.__jac__.dirty = True
+            Jac.get_context().access_cache.clear()
 
     @staticmethod
     @hookimpl
@@ -92,7 +97,9 @@ class JacAccessValidationImpl:
         anchor = architype.__jac__
         level = AccessLevel.cast(level)
         if level != anchor.access.all:
-            anchor.access.all = level
+            anchor.writable_access().all = level
+            anchor.dirty = True
+            Jac.get_context().access_cache.clear()
 
     @staticmethod
     @hookimpl
@@ -101,6 +108,8 @@ class JacAccessValidationImpl:
         anchor = architype.__jac__
         if anchor.access.all > AccessLevel.NO_ACCESS:
             anchor.access.all = AccessLevel.NO_ACCESS
+            anchor.dirty = True
+            Jac.get_context().access_cache.clear()
 
     @staticmethod
     @hookimpl
@@ -108,7 +117,9 @@ class JacAccessValidationImpl:
         """Read Access Validation."""
         if not (access_level := Jac.check_access_level(to) > AccessLevel.NO_ACCESS):
             logger.info(
-                f"Current root doesn't have read access to {to.__class__.__name__}[{to.id}]"
+                "Current root doesn't have read access to %s[%s]",
+                to.__class__.__name__,
+                to.id,
             )
         return access_level
 
@@ -118,7 +129,9 @@ class JacAccessValidationImpl:
         """Write Access Validation."""
         if not (access_level := Jac.check_access_level(to) > AccessLevel.READ):
             logger.info(
-                f"Current root doesn't have connect access to {to.__class__.__name__}[{to.id}]"
+                "Current root doesn't have connect access to %s[%s]",
+                to.__class__.__name__,
+                to.id,
             )
         return access_level
 
@@ -128,7 +141,9 @@ class JacAccessValidationImpl:
         """Write Access Validation."""
         if not (access_level := Jac.check_access_level(to) > AccessLevel.CONNECT):
             logger.info(
-                f"Current root doesn't have write access to {to.__class__.__name__}[{to.id}]"
+                "Current root doesn't have write access to %s[%s]",
+                to.__class__.__name__,
+                to.id,
             )
         return access_level
 
@@ -149,6 +164,10 @@ class JacAccessValidationImpl:
         if jroot == jctx.system_root or jroot.id == to.root or jroot == to:
             return AccessLevel.WRITE
 
+        # if access of current root to target anchor is already resolved
+        if (access_level := jctx.access_cache.get((jroot.id, to.id))) is not None:
+            return access_level
+
         access_level = AccessLevel.NO_ACCESS
 
         # if target anchor have set access.all
@@ -171,6 +190,7 @@ class JacAccessValidationImpl:
         if level > AccessLevel.NO_ACCESS and access_level == AccessLevel.NO_ACCESS:
             access_level = level
 
+        jctx.access_cache[(jroot.id, to.id)] = access_level
         return access_level
 
 
@@ -209,31 +229,28 @@ class JacNodeImpl:
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type[EdgeArchitype]],
     ) -> list[EdgeArchitype]:
         """Get edges connected to this node."""
         ret_edges: list[EdgeArchitype] = []
-        for anchor in node.edges:
+        targets = {i.__jac__ for i in target_obj} if target_obj else None
+        for anchor in node.edges_toward(dir, filter_func, edge_type):
+            source = anchor.source
+            target = anchor.target
             if (
-                (source := anchor.source)
-                and (target := anchor.target)
-                and (not filter_func or filter_func([anchor.architype]))
-                and source.architype
-                and target.architype
+                dir in [EdgeDir.OUT, EdgeDir.ANY]
+                and node == source
+                and (not targets or target in targets)
+                and Jac.check_read_access(target)
             ):
-                if (
-                    dir in [EdgeDir.OUT, EdgeDir.ANY]
-                    and node == source
-                    and (not target_obj or target.architype in target_obj)
-                    and Jac.check_read_access(target)
-                ):
-                    ret_edges.append(anchor.architype)
-                if (
-                    dir in [EdgeDir.IN, EdgeDir.ANY]
-                    and node == target
-                    and (not target_obj or source.architype in target_obj)
-                    and Jac.check_read_access(source)
-                ):
-                    ret_edges.append(anchor.architype)
+                ret_edges.append(anchor.architype)
+            if (
+                dir in [EdgeDir.IN, EdgeDir.ANY]
+                and node == target
+                and (not targets or source in targets)
+                and Jac.check_read_access(source)
+            ):
+                ret_edges.append(anchor.architype)
         return ret_edges
 
     @staticmethod
@@ -243,41 +260,35 @@ class JacNodeImpl:
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type[EdgeArchitype]],
     ) -> list[NodeArchitype]:
         """Get set of nodes connected to this node."""
         ret_edges: list[NodeArchitype] = []
-        for anchor in node.edges:
+        targets = {i.__jac__ for i in target_obj} if target_obj else None
+        for anchor in node.edges_toward(dir, filter_func, edge_type):
+            source = anchor.source
+            target = anchor.target
             if (
-                (source := anchor.source)
-                and (target := anchor.target)
-                and (not filter_func or filter_func([anchor.architype]))
-                and source.architype
-                and target.architype
+                dir in [EdgeDir.OUT, EdgeDir.ANY]
+                and node == source
+                and (not targets or target in targets)
+                and Jac.check_read_access(target)
             ):
-                if (
-                    dir in [EdgeDir.OUT, EdgeDir.ANY]
-                    and node == source
-                    and (not target_obj or target.architype in target_obj)
-                    and Jac.check_read_access(target)
-                ):
-                    ret_edges.append(target.architype)
-                if (
-                    dir in [EdgeDir.IN, EdgeDir.ANY]
-                    and node == target
-                    and (not target_obj or source.architype in target_obj)
-                    and Jac.check_read_access(source)
-                ):
-                    ret_edges.append(source.architype)
+                ret_edges.append(target.architype)
+            if (
+                dir in [EdgeDir.IN, EdgeDir.ANY]
+                and node == target
+                and (not targets or source in targets)
+                and Jac.check_read_access(source)
+            ):
+                ret_edges.append(source.architype)
         return ret_edges
 
     @staticmethod
     @hookimpl
     def remove_edge(node: NodeAnchor, edge: EdgeAnchor) -> None:
         """Remove reference without checking sync status."""
-        for idx, ed in enumerate(node.edges):
-            if ed.id == edge.id:
-                node.edges.pop(idx)
-                break
+        node.pop_edge(edge)
 
 
 class JacEdgeImpl:
@@ -310,19 +321,20 @@ class JacWalkerImpl:
         if isinstance(walker, WalkerArchitype):
             """Walker visits node."""
             wanch = walker.__jac__
-            before_len = len(wanch.next)
+            anchors: list[Anchor] = []
             for anchor in (
                 (i.__jac__ for i in expr) if isinstance(expr, list) else [expr.__jac__]
             ):
                 if anchor not in wanch.ignores:
                     if isinstance(anchor, NodeAnchor):
-                        wanch.next.append(anchor)
+                        anchors.append(anchor)
                     elif isinstance(anchor, EdgeAnchor):
                         if target := anchor.target:
-                            wanch.next.append(target)
+                            anchors.append(target)
                         else:
                             raise ValueError("Edge has no target.")
-            return len(wanch.next) > before_len
+            wanch.next.extend(anchors)
+            return len(anchors) > 0
         else:
             raise TypeError("Invalid walker object")
 
@@ -347,10 +359,10 @@ class JacWalkerImpl:
             ):
                 if anchor not in wanch.ignores:
                     if isinstance(anchor, NodeAnchor):
-                        wanch.ignores.append(anchor)
+                        wanch.ignores.add(anchor)
                     elif isinstance(anchor, EdgeAnchor):
                         if target := anchor.target:
-                            wanch.ignores.append(target)
+                            wanch.ignores.add(target)
                         else:
                             raise ValueError("Edge has no target.")
             return len(wanch.ignores) > before_len
@@ -383,66 +395,33 @@ class JacWalkerImpl:
             raise TypeError("Invalid walker object")
 
         walker.path = []
-        walker.next = [node]
-        if walker.next:
-            current_node = walker.next[-1].architype
-            for i in warch._jac_entry_funcs_:
-                trigger = i.get_funcparam_annotations(i.func)
-                if not trigger:
-                    if i.func:
-                        i.func(warch, current_node)
-                    else:
-                        raise ValueError(f"No function {i.name} to call.")
+        walker.next.reset(node)
+        current_node: Architype = node.architype
+        table = DSFuncTable.get(warch.__class__, current_node.__class__)
+        for i in table.entry:
+            i.func(warch, current_node)  # type: ignore[misc]
         while len(walker.next):
-            if current_node := walker.next.pop(0).architype:
-                for i in current_node._jac_entry_funcs_:
-                    trigger = i.get_funcparam_annotations(i.func)
-                    if not trigger or isinstance(warch, trigger):
-                        if i.func:
-                            i.func(current_node, warch)
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
+            if current_node := walker.next.pop().architype:
+                table = DSFuncTable.get(warch.__class__, current_node.__class__)
+                for i in table.node_entry:
+                    i.func(current_node, warch)  # type: ignore[misc]
                     if walker.disengaged:
                         return warch
-                for i in warch._jac_entry_funcs_:
-                    trigger = i.get_funcparam_annotations(i.func)
-                    if not trigger or isinstance(current_node, trigger):
-                        if i.func and trigger:
-                            i.func(warch, current_node)
-                        elif not trigger:
-                            continue
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
+                for i in table.walker_entry:
+                    i.func(warch, current_node)  # type: ignore[misc]
                     if walker.disengaged:
                         return warch
-                for i in warch._jac_exit_funcs_:
-                    trigger = i.get_funcparam_annotations(i.func)
-                    if not trigger or isinstance(current_node, trigger):
-                        if i.func and trigger:
-                            i.func(warch, current_node)
-                        elif not trigger:
-                            continue
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
+                for i in table.walker_exit:
+                    i.func(warch, current_node)  # type: ignore[misc]
                     if walker.disengaged:
                         return warch
-                for i in current_node._jac_exit_funcs_:
-                    trigger = i.get_funcparam_annotations(i.func)
-                    if not trigger or isinstance(warch, trigger):
-                        if i.func:
-                            i.func(current_node, warch)
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
+                for i in table.node_exit:
+                    i.func(current_node, warch)  # type: ignore[misc]
                     if walker.disengaged:
                         return warch
-        for i in warch._jac_exit_funcs_:
-            trigger = i.get_funcparam_annotations(i.func)
-            if not trigger:
-                if i.func:
-                    i.func(warch, current_node)
-                else:
-                    raise ValueError(f"No function {i.name} to call.")
-        walker.ignores = []
+        for i in table.exit:
+            i.func(warch, current_node)  # type: ignore[misc]
+        walker.ignores = set()
         return warch
 
     @staticmethod
@@ -579,21 +558,13 @@ class JacFeatureImpl(
     def reset_graph(root: Optional[Root] = None) -> int:
         """Purge current or target graph."""
         ctx = Jac.get_context()
-        mem = cast(ShelfStorage, ctx.mem)
         ranchor = root.__jac__ if root else ctx.root
 
         deleted_count = 0
-        for anchor in (
-            anchors.values()
-            if isinstance(anchors := mem.__shelf__, Shelf)
-            else mem.__mem__.values()
-        ):
-            if anchor == ranchor or anchor.root != ranchor.id:
-                continue
-
-            if loaded_anchor := mem.find_by_id(anchor.id):
+        for anchor in ctx.mem.find_by_root(ranchor.id):
+            if anchor != ranchor:
                 deleted_count += 1
-                Jac.destroy(loaded_anchor)
+                Jac.destroy(anchor)
 
         return deleted_count
 
@@ -909,6 +880,7 @@ class JacFeatureImpl(
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         edges_only: bool,
+        edge_type: Optional[type[EdgeArchitype]],
     ) -> list[NodeArchitype] | list[EdgeArchitype]:
         """Jac's apply_dir stmt feature."""
         if isinstance(node_obj, NodeArchitype):
@@ -920,23 +892,33 @@ class JacFeatureImpl(
         )
         if edges_only:
             connected_edges: list[EdgeArchitype] = []
+            seen_edges: set[Anchor] = set()
             for node in node_obj:
-                edges = Jac.get_edges(
-                    node.__jac__, dir, filter_func, target_obj=targ_obj_set
-                )
-                connected_edges.extend(
-                    edge for edge in edges if edge not in connected_edges
-                )
+                for edge in Jac.get_edges(
+                    node.__jac__,
+                    dir,
+                    filter_func,
+                    target_obj=targ_obj_set,
+                    edge_type=edge_type,
+                ):
+                    if (eanch := edge.__jac__) not in seen_edges:
+                        seen_edges.add(eanch)
+                        connected_edges.append(edge)
             return connected_edges
         else:
             connected_nodes: list[NodeArchitype] = []
+            seen_nodes: set[Anchor] = set()
             for node in node_obj:
-                nodes = Jac.edges_to_nodes(
-                    node.__jac__, dir, filter_func, target_obj=targ_obj_set
-                )
-                connected_nodes.extend(
-                    node for node in nodes if node not in connected_nodes
-                )
+                for target in Jac.edges_to_nodes(
+                    node.__jac__,
+                    dir,
+                    filter_func,
+                    target_obj=targ_obj_set,
+                    edge_type=edge_type,
+                ):
+                    if (nanch := target.__jac__) not in seen_nodes:
+                        seen_nodes.add(nanch)
+                        connected_nodes.append(target)
             return connected_nodes
 
     @staticmethod
@@ -971,6 +953,7 @@ class JacFeatureImpl(
         right: NodeArchitype | list[NodeArchitype],
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        edge_type: Optional[type[EdgeArchitype]],
     ) -> bool:  # noqa: ANN401
         """Jac's disconnect operator feature."""
         disconnect_occurred = False
@@ -979,30 +962,25 @@ class JacFeatureImpl(
 
         for i in left:
             node = i.__jac__
-            for anchor in set(node.edges):
+            for anchor in set(node.edges_toward(dir, filter_func, edge_type)):
+                source = anchor.source
+                target = anchor.target
+                if (
+                    dir in [EdgeDir.OUT, EdgeDir.ANY]
+                    and node == source
+                    and target.architype in right
+                    and Jac.check_write_access(target)
+                ):
+                    Jac.destroy(anchor) if anchor.persistent else Jac.detach(anchor)
+                    disconnect_occurred = True
                 if (
-                    (source := anchor.source)
-                    and (target := anchor.target)
-                    and (not filter_func or filter_func([anchor.architype]))
-                    and source.architype
-                    and target.architype
+                    dir in [EdgeDir.IN, EdgeDir.ANY]
+                    and node == target
+                    and source.architype in right
+                    and Jac.check_write_access(source)
                 ):
-                    if (
-                        dir in [EdgeDir.OUT, EdgeDir.ANY]
-                        and node == source
-                        and target.architype in right
-                        and Jac.check_write_access(target)
-                    ):
-                        Jac.destroy(anchor) if anchor.persistent else Jac.detach(anchor)
-                        disconnect_occurred = True
-                    if (
-                        dir in [EdgeDir.IN, EdgeDir.ANY]
-                        and node == target
-                        and source.architype in right
-                        and Jac.check_write_access(source)
-                    ):
-                        Jac.destroy(anchor) if anchor.persistent else Jac.detach(anchor)
-                        disconnect_occurred = True
+                    Jac.destroy(anchor) if anchor.persistent else Jac.detach(anchor)
+                    disconnect_occurred = True
 
         return disconnect_occurred
 
@@ -1049,8 +1027,8 @@ class JacFeatureImpl(
                 target=target,
                 is_undirected=is_undirected,
             )
-            source.edges.append(eanch)
-            target.edges.append(eanch)
+            source.add_edge(eanch)
+            target.add_edge(eanch)
 
             if conn_assign:
                 for fld, val in zip(conn_assign[0], conn_assign[1]):
@@ -1074,6 +1052,11 @@ class JacFeatureImpl(
 
         jctx = Jac.get_context()
 
+        if anchor.persistent and anchor.root != jctx.root.id:
+            jctx.access_cache.clear()
+        if not anchor.persistent or anchor.root != jctx.root.id:
+            anchor.dirty = True
+
         anchor.persistent = True
         anchor.root = jctx.root.id
 
@@ -115,10 +115,15 @@ class JacNode:
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type[EdgeArchitype]] = None,
     ) -> list[EdgeArchitype]:
         """Get edges connected to this node."""
         return plugin_manager.hook.get_edges(
-            node=node, dir=dir, filter_func=filter_func, target_obj=target_obj
+            node=node,
+            dir=dir,
+            filter_func=filter_func,
+            target_obj=target_obj,
+            edge_type=edge_type,
         )
 
     @staticmethod
@@ -127,10 +132,15 @@ class JacNode:
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type[EdgeArchitype]] = None,
     ) -> list[NodeArchitype]:
         """Get set of nodes connected to this node."""
         return plugin_manager.hook.edges_to_nodes(
-            node=node, dir=dir, filter_func=filter_func, target_obj=target_obj
+            node=node,
+            dir=dir,
+            filter_func=filter_func,
+            target_obj=target_obj,
+            edge_type=edge_type,
         )
 
     @staticmethod
@@ -392,6 +402,7 @@ class JacFeature(
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         edges_only: bool = False,
+        edge_type: Optional[type[EdgeArchitype]] = None,
     ) -> list[NodeArchitype] | list[EdgeArchitype]:
         """Jac's apply_dir stmt feature."""
         return plugin_manager.hook.edge_ref(
@@ -400,6 +411,7 @@ class JacFeature(
             dir=dir,
             filter_func=filter_func,
             edges_only=edges_only,
+            edge_type=edge_type,
         )
 
     @staticmethod
@@ -423,6 +435,7 @@ class JacFeature(
         right: NodeArchitype | list[NodeArchitype],
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        edge_type: Optional[type[EdgeArchitype]] = None,
     ) -> bool:
         """Jac's disconnect operator feature."""
         return plugin_manager.hook.disconnect(
@@ -430,6 +443,7 @@ class JacFeature(
             right=right,
             dir=dir,
             filter_func=filter_func,
+            edge_type=edge_type,
         )
 
     @staticmethod
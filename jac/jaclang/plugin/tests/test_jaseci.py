@@ -2,14 +2,47 @@
 
 import io
 import os
+import pickle
 import sys
+from typing import Iterable, cast
+from uuid import UUID
 
 from jaclang.cli import cli
+from jaclang.compiler.constant import EdgeDir
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.runtimelib.architype import (
+    AccessLevel,
+    DEFAULT_PERMISSION,
+    NodeArchitype,
+    Permission,
+    Root,
+)
+from jaclang.runtimelib.context import ExecutionContext
+from jaclang.runtimelib.memory import SqliteStorage
 from jaclang.utils.test import TestCase
 
 session = ""
 
 
+class Counter(NodeArchitype):
+    """Counter node for persistence tests."""
+
+    def __init__(self, value: int = 0) -> None:
+        """Create counter node."""
+        super().__init__()
+        self.value = value
+
+
+class Bag(NodeArchitype):
+    """Node holding a container attribute for persistence tests."""
+
+    def __init__(self) -> None:
+        """Create bag node."""
+        super().__init__()
+        self.items: list[int] = []
+        self.meta: dict[str, list[int]] = {"sizes": []}
+
+
 class TestJaseciPlugin(TestCase):
     """Test jaseci plugin."""
 
@@ -728,3 +761,243 @@ class TestJaseciPlugin(TestCase):
         )
 
         self._del_session(session)
+
+    def test_access_cache_invalidation(self) -> None:
+        """Test cached access levels are dropped when permissions change."""
+        ctx = ExecutionContext.create()
+        try:
+            owner = Root().__jac__
+            other = Root().__jac__
+            ctx.mem.set(owner.id, owner)
+            ctx.mem.set(other.id, other)
+
+            ctx.root = owner
+            node = NodeArchitype()
+            Jac.save(node)
+
+            ctx.root = other
+            self.assertEqual(
+                AccessLevel.NO_ACCESS, Jac.check_access_level(node.__jac__)
+            )
+            self.assertIn((other.id, node.__jac__.id), ctx.access_cache)
+
+            Jac.allow_root(node, other.id, AccessLevel.CONNECT)
+            self.assertEqual(AccessLevel.CONNECT, Jac.check_access_level(node.__jac__))
+
+            Jac.disallow_root(node, other.id, AccessLevel.CONNECT)
+            self.assertEqual(
+                AccessLevel.NO_ACCESS, Jac.check_access_level(node.__jac__)
+            )
+
+            Jac.unrestrict(owner.architype, AccessLevel.READ)
+            self.assertEqual(AccessLevel.READ, Jac.check_access_level(node.__jac__))
+
+            Jac.restrict(owner.architype)
+            self.assertEqual(
+                AccessLevel.NO_ACCESS, Jac.check_access_level(node.__jac__)
+            )
+        finally:
+            ctx.close()
+
+    def test_dirty_tracking(self) -> None:
+        """Test only modified anchors are written back on close."""
+        session = self.fixture_abs_path("test_dirty_tracking.session")
+        ctx = ExecutionContext.create(session=session)
+        Jac.connect(
+            left=ctx.root.architype,
+            right=[Counter(0), Counter(1)],
+            edge_spec=Jac.build_edge(False, None, None),
+            edges_only=False,
+        )
+        ctx.close()
+
+        ctx = ExecutionContext.create(session=session)
+        counters = [edge.target.architype for edge in ctx.root.edges]
+        self.assertFalse(any(c.__jac__.dirty for c in counters))
+        counters[0].value = 5
+        self.assertTrue(counters[0].__jac__.dirty)
+        self.assertFalse(counters[1].__jac__.dirty)
+        ctx.close()
+
+        ctx = ExecutionContext.create(session=session)
+        self.assertEqual(
+            [5, 1], [edge.target.architype.value for edge in ctx.root.edges]
+        )
+        ctx.close()
+        self._del_session(session)
+
+    def test_in_place_mutation(self) -> None:
+        """Test container changes persist and edge changes keep stored attributes."""
+        for scheme in ("", "sqlite://"):
+            session = self.fixture_abs_path("test_in_place_mutation.session")
+            ctx = ExecutionContext.create(session=f"{scheme}{session}")
+            Jac.connect(
+                left=ctx.root.architype,
+                right=Bag(),
+                edge_spec=Jac.build_edge(False, None, None),
+                edges_only=False,
+            )
+            ctx.close()
+
+            for _ in range(2):
+                ctx = ExecutionContext.create(session=f"{scheme}{session}")
+                bag = ctx.root.edges[0].target.architype
+                self.assertFalse(bag.__jac__.dirty)
+                bag.items.append(1)
+                self.assertTrue(bag.__jac__.dirty)
+                bag.__jac__.dirty = False
+                bag.meta["sizes"].append(len(bag.items))
+                self.assertTrue(bag.__jac__.dirty)
+                ctx.close()
+
+            ctx = ExecutionContext.create(session=f"{scheme}{session}")
+            bag = ctx.root.edges[0].target.architype
+            self.assertEqual([1, 1], bag.items)
+            self.assertEqual({"sizes": [1, 2]}, bag.meta)
+            self.assertIs(list, type(pickle.loads(pickle.dumps(bag.items))))
+            stale = pickle.loads(pickle.dumps(bag.__jac__))
+            bag.items = [5]
+            ctx.close()
+
+            ctx = ExecutionContext.create(session=f"{scheme}{session}")
+            ctx.mem.set(stale.id, stale)
+            Jac.connect(
+                left=stale.architype,
+                right=Counter(),
+                edge_spec=Jac.build_edge(False, None, None),
+                edges_only=False,
+            )
+            ctx.close()
+
+            ctx = ExecutionContext.create(session=f"{scheme}{session}")
+            bag = ctx.root.edges[0].target.architype
+            self.assertEqual([5], bag.items)
+            self.assertEqual(2, len(bag.__jac__.edges))
+            ctx.close()
+            self._del_session(session)
+
+    def test_sqlite_storage(self) -> None:
+        """Test sqlite session backend with root reverse index."""
+        session = self.fixture_abs_path("test_sqlite_storage.session")
+        ctx = ExecutionContext.create(session=f"sqlite://{session}")
+        self.assertIsInstance(ctx.mem, SqliteStorage)
+        Jac.connect(
+            left=ctx.root.architype,
+            right=[Counter(0), Counter(1)],
+            edge_spec=Jac.build_edge(False, None, None),
+            edges_only=False,
+        )
+        ctx.close()
+
+        ctx = ExecutionContext.create(session=f"sqlite://{session}")
+        self.assertEqual(
+            [0, 1], [edge.target.architype.value for edge in ctx.root.edges]
+        )
+        self.assertEqual(5, len(list(ctx.mem.find_by_root(ctx.root.id))))
+        self.assertEqual(4, Jac.reset_graph())
+        ctx.close()
+
+        ctx = ExecutionContext.create(session=f"sqlite://{session}")
+        self.assertEqual([], ctx.root.edges)
+        self.assertEqual([ctx.root], list(ctx.mem.find_by_root(ctx.root.id)))
+        ctx.close()
+        self._del_session(session)
+
+        with self.assertRaises(ValueError):
+            ExecutionContext.create(session=f"lmdb://{session}")
+
+    def test_shelf_root_index(self) -> None:
+        """Test shelf keeps a root index across sessions."""
+        session = self.fixture_abs_path("test_shelf_root_index.session")
+        ctx = ExecutionContext.create(session=session)
+        Jac.connect(
+            left=ctx.root.architype,
+            right=[Counter(0), Counter(1)],
+            edge_spec=Jac.build_edge(False, None, None),
+            edges_only=False,
+        )
+        ctx.close()
+
+        for file in os.listdir(os.path.dirname(session)):
+            if file.startswith("test_shelf_root_index.session.roots"):
+                os.remove(self.fixture_abs_path(file))
+
+        ctx = ExecutionContext.create(session=session)
+        self.assertEqual(5, len(list(ctx.mem.find_by_root(ctx.root.id))))
+        ctx.close()
+
+        ctx = ExecutionContext.create(session=session)
+        self.assertEqual(5, len(list(ctx.mem.find_by_root(ctx.root.id))))
+        self.assertEqual(4, Jac.reset_graph())
+        ctx.close()
+
+        ctx = ExecutionContext.create(session=session)
+        self.assertEqual([ctx.root], list(ctx.mem.find_by_root(ctx.root.id)))
+        ctx.close()
+        self._del_session(session)
+
+    def test_prefetch_stub_edges(self) -> None:
+        """Test stub edges and nodes are loaded with bulk finds."""
+        session = self.fixture_abs_path("test_prefetch_stub_edges.session")
+        ctx = ExecutionContext.create(session=f"sqlite://{session}")
+        Jac.connect(
+            left=ctx.root.architype,
+            right=[Counter(i) for i in range(10)],
+            edge_spec=Jac.build_edge(False, None, None),
+            edges_only=False,
+        )
+        ctx.close()
+
+        ctx = ExecutionContext.create(session=f"sqlite://{session}")
+        mem = cast(SqliteStorage, ctx.mem)
+        fetched: list[list[UUID]] = []
+        fetch = mem.fetch
+
+        def counted_fetch(ids: Iterable[UUID]) -> dict:
+            fetched.append(ids := list(ids))
+            return fetch(ids)
+
+        mem.fetch = counted_fetch  # type: ignore[method-assign]
+        nodes = Jac.edges_to_nodes(ctx.root, EdgeDir.OUT, None, None)
+        self.assertEqual(list(range(10)), [node.value for node in nodes])
+        self.assertEqual([10, 10], [len(ids) for ids in fetched])
+        ctx.close()
+        self._del_session(session)
+
+    def test_shared_default_permission(self) -> None:
+        """Test anchors share default permission until it is changed."""
+        ctx = ExecutionContext.create()
+        try:
+            first, second = Counter(), Counter()
+            self.assertIs(DEFAULT_PERMISSION, first.__jac__.access)
+            self.assertIs(DEFAULT_PERMISSION, second.__jac__.access)
+
+            Jac.unrestrict(first, AccessLevel.READ)
+            Jac.allow_root(second, ctx.root.id, AccessLevel.WRITE)
+            self.assertEqual(AccessLevel.READ, first.__jac__.access.all)
+            self.assertEqual(
+                AccessLevel.WRITE, second.__jac__.access.roots.check(str(ctx.root.id))
+            )
+            self.assertEqual(Permission(), DEFAULT_PERMISSION)
+
+            loaded = pickle.loads(pickle.dumps(Counter().__jac__))
+            self.assertIs(DEFAULT_PERMISSION, loaded.access)
+            loaded = pickle.loads(pickle.dumps(first.__jac__))
+            self.assertEqual(AccessLevel.READ, loaded.access.all)
+        finally:
+            ctx.close()
+
+    def test_load_unslotted_permission(self) -> None:
+        """Test permissions pickled before access objects had slots still load."""
+        # Permission(all=READ, roots=Access({"r1": WRITE})) pickled without slots
+        old = (
+            b"\x80\x04\x95\x8b\x00\x00\x00\x00\x00\x00\x00\x8c\x1cjaclang.runtimelib"
+            b".architype\x94\x8c\nPermission\x94\x93\x94)\x81\x94}\x94(\x8c\x03all"
+            b"\x94h\x00\x8c\x0bAccessLevel\x94\x93\x94K\x00\x85\x94R\x94\x8c\x05roots"
+            b"\x94h\x00\x8c\x06Access\x94\x93\x94)\x81\x94}\x94\x8c\x07anchors\x94}"
+            b"\x94\x8c\x02r1\x94h\x07K\x02\x85\x94R\x94ssbub."
+        )
+        loaded = pickle.loads(old)
+        self.assertEqual(AccessLevel.READ, loaded.all)
+        self.assertEqual(AccessLevel.WRITE, loaded.roots.check("r1"))
+        self.assertEqual(loaded, pickle.loads(pickle.dumps(loaded)))
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import inspect
+from collections import deque
 from dataclasses import asdict, dataclass, field, fields, is_dataclass
-from enum import IntEnum
+from enum import Enum, IntEnum
+from functools import cached_property
+from heapq import heappop, heappush, merge
 from logging import getLogger
-from pickle import dumps
 from types import UnionType
-from typing import Any, Callable, ClassVar, Optional, TypeVar
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Optional, TypeVar
 from uuid import UUID, uuid4
 
+from jaclang.compiler.constant import EdgeDir
+
 logger = getLogger(__name__)
 
 TARCH = TypeVar("TARCH", bound="Architype")
@@ -37,7 +41,15 @@ class AccessLevel(IntEnum):
                 return val
 
 
-@dataclass
+def restore_slots(obj: object, state: dict[str, Any] | tuple) -> None:
+    """Set slots from pickled state, including the dict state of unslotted pickles."""
+    if isinstance(state, tuple):
+        state = {**(state[0] or {}), **(state[1] or {})}
+    for name, value in state.items():
+        setattr(obj, name, value)
+
+
+@dataclass(slots=True)
 class Access:
     """Access Structure."""
 
@@ -47,14 +59,26 @@ class Access:
         """Validate access."""
         return self.anchors.get(anchor, AccessLevel.NO_ACCESS)
 
+    def __setstate__(self, state: dict[str, Any] | tuple) -> None:
+        """Deserialize Access."""
+        restore_slots(self, state)
 
-@dataclass
+
+@dataclass(slots=True)
 class Permission:
     """Anchor Access Handler."""
 
     all: AccessLevel = AccessLevel.NO_ACCESS
     roots: Access = field(default_factory=Access)
 
+    def __setstate__(self, state: dict[str, Any] | tuple) -> None:
+        """Deserialize Permission."""
+        restore_slots(self, state)
+
+
+# shared by every anchor until its access is first changed
+DEFAULT_PERMISSION = Permission()
+
 
 @dataclass
 class AnchorReport:
@@ -71,14 +95,22 @@ class Anchor:
     architype: Architype
     id: UUID = field(default_factory=uuid4)
     root: Optional[UUID] = None
-    access: Permission = field(default_factory=Permission)
+    access: Permission = field(default_factory=lambda: DEFAULT_PERMISSION)
     persistent: bool = False
-    hash: int = 0
+    dirty: bool = True
 
     def is_populated(self) -> bool:
         """Check if state."""
         return "architype" in self.__dict__
 
+    def is_modified(self) -> bool:
+        """Check if architype or access changed."""
+        return self.dirty
+
+    def needs_sync(self) -> bool:
+        """Check if anchor has changes to write back."""
+        return self.is_modified()
+
     def make_stub(self: TANCH) -> TANCH:
         """Return unsynced copy of anchor."""
         if self.is_populated():
@@ -87,6 +119,12 @@ class Anchor:
             return unloaded
         return self
 
+    def writable_access(self) -> Permission:
+        """Get own access, detaching it from the shared default first."""
+        if self.access is DEFAULT_PERMISSION:
+            self.access = Permission()
+        return self.access
+
     def populate(self) -> None:
         """Retrieve the Architype from db and return."""
         from jaclang.plugin.feature import JacFeature as Jac
@@ -119,13 +157,15 @@ class Anchor:
             unlinked.__dict__.update(self.architype.__dict__)
             unlinked.__dict__.pop("__jac__", None)
 
-            return {
+            state = {
                 "id": self.id,
                 "architype": unlinked,
                 "root": self.root,
-                "access": self.access,
                 "persistent": self.persistent,
             }
+            if self.access is not DEFAULT_PERMISSION:
+                state["access"] = self.access
+            return state
         else:
             return {"id": self.id}
 
@@ -135,7 +175,14 @@ class Anchor:
 
         if self.is_populated() and self.architype:
             self.architype.__jac__ = self
-            self.hash = hash(dumps(self))
+            self.dirty = False
+            # attribute writes flag dirty, containers flag it on in place changes
+            attrs = self.architype.__dict__
+            for name, value in attrs.items():
+                if name != "__jac__":
+                    attrs[name] = track(value, self.architype)
+            if self.__dict__.get("access", DEFAULT_PERMISSION) == DEFAULT_PERMISSION:
+                self.access = DEFAULT_PERMISSION
 
     def __repr__(self) -> str:
         """Override representation."""
@@ -179,6 +226,95 @@ class NodeAnchor(Anchor):
 
     architype: NodeArchitype
     edges: list[EdgeAnchor]
+    edges_dirty: bool = False
+
+    def edge_index(self) -> EdgeIndex:
+        """Get direction index of edges, rebuilding it if out of sync."""
+        index: EdgeIndex | None = self.__dict__.get("_edge_index")
+        if not index or not index.in_sync():
+            self.prefetch_edges()
+            index = self.__dict__["_edge_index"] = EdgeIndex(self)
+        return index
+
+    def prefetch_edges(self) -> None:
+        """Load stub edges and their nodes in bulk instead of one by one."""
+        if any(
+            not edge.is_populated()
+            or not edge.source.is_populated()
+            or not edge.target.is_populated()
+            for edge in self.edges
+        ):
+            from jaclang.plugin.feature import JacFeature as Jac
+
+            Jac.get_context().mem.populate_data(self.edges)
+
+    @property
+    def edges_version(self) -> int:
+        """Count edge mutations made through add_edge and pop_edge."""
+        return self.__dict__.get("_edges_version", 0)
+
+    def synced_edge_index(self) -> EdgeIndex | None:
+        """Get the edge index if it is built and in sync, dropping it otherwise."""
+        index: EdgeIndex | None = self.__dict__.get("_edge_index")
+        if index and not index.in_sync():
+            self.__dict__.pop("_edge_index")
+            return None
+        return index
+
+    def edges_changed(self) -> None:
+        """Bump edges version after a mutation."""
+        self.__dict__["_edges_version"] = self.edges_version + 1
+        # stubs share the architype, so flag the anchor it points back to
+        self.architype.__jac__.edges_dirty = True
+
+    def needs_sync(self) -> bool:
+        """Check if anchor has changes to write back."""
+        return self.edges_dirty or super().needs_sync()
+
+    def add_edge(self, edge: EdgeAnchor) -> None:
+        """Append edge and keep the edge index in sync."""
+        index = self.synced_edge_index()
+        self.edges.append(edge)
+        self.edges_changed()
+        if index:
+            index.add(edge)
+
+    def pop_edge(self, edge: EdgeAnchor) -> None:
+        """Remove edge reference and keep the edge index in sync."""
+        for idx, ed in enumerate(self.edges):
+            if ed.id == edge.id:
+                index = self.synced_edge_index()
+                self.edges.pop(idx)
+                self.edges_changed()
+                if index:
+                    index.remove(edge)
+                break
+
+    def edges_toward(
+        self,
+        dir: EdgeDir,
+        filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        edge_type: Optional[type[EdgeArchitype]] = None,
+    ) -> list[EdgeAnchor]:
+        """Get valid edges of edge_type that may go toward dir and pass filter_func."""
+        candidates: Iterable[EdgeAnchor]
+        if dir == EdgeDir.ANY and edge_type is None:
+            self.prefetch_edges()
+            candidates = self.edges
+        else:
+            candidates = self.edge_index().select(dir, edge_type)
+        edges = [
+            anchor
+            for anchor in candidates
+            if (source := anchor.source)
+            and (target := anchor.target)
+            and source.architype
+            and target.architype
+        ]
+        if filter_func and edges:
+            kept = {id(arch) for arch in filter_func([i.architype for i in edges])}
+            edges = [anchor for anchor in edges if id(anchor.architype) in kept]
+        return edges
 
     def __getstate__(self) -> dict[str, object]:
         """Serialize Node Anchor."""
@@ -190,6 +326,103 @@ class NodeAnchor(Anchor):
         return state
 
 
+class EdgeIndex:
+    """Edges of a node indexed by direction and edge class, in connection order."""
+
+    __slots__ = ("node", "edges", "version", "buckets", "entries", "counter", "size")
+
+    def __init__(self, node: NodeAnchor) -> None:
+        """Index node's current edges."""
+        self.node = node
+        self.edges = node.edges
+        self.version = node.edges_version
+        # direction -> edge class -> edge -> references of it in node.edges
+        self.buckets: dict[EdgeDir, dict[type, dict[EdgeAnchor, int]]] = {
+            EdgeDir.OUT: {},
+            EdgeDir.IN: {},
+            EdgeDir.ANY: {},
+        }
+        # edge -> (connection order, edge class)
+        self.entries: dict[EdgeAnchor, tuple[int, type]] = {}
+        self.counter = 0
+        self.size = 0
+        for edge in node.edges:
+            self.index(edge)
+
+    def in_sync(self) -> bool:
+        """Check no edge was changed, replaced or mutated in place since indexing."""
+        return (
+            self.edges is self.node.edges
+            and self.version == self.node.edges_version
+            and self.size == len(self.edges)
+        )
+
+    def directions(self, edge: EdgeAnchor) -> list[EdgeDir]:
+        """Get directions an edge goes from the node."""
+        dirs = [EdgeDir.ANY]
+        if edge.source == self.node:
+            dirs.append(EdgeDir.OUT)
+        if edge.target == self.node:
+            dirs.append(EdgeDir.IN)
+        return dirs
+
+    def index(self, edge: EdgeAnchor) -> None:
+        """Count edge reference in its direction and class buckets."""
+        if edge not in self.entries:
+            self.entries[edge] = (self.counter, type(edge.architype))
+            self.counter += 1
+        cls = self.entries[edge][1]
+        for dir in self.directions(edge):
+            bucket = self.buckets[dir].setdefault(cls, {})
+            bucket[edge] = bucket.get(edge, 0) + 1
+        self.size += 1
+
+    def add(self, edge: EdgeAnchor) -> None:
+        """Index edge reference added by the node."""
+        self.index(edge)
+        self.version = self.node.edges_version
+
+    def remove(self, edge: EdgeAnchor) -> None:
+        """Drop edge reference removed by the node."""
+        cls = self.entries[edge][1]
+        for dir in self.directions(edge):
+            bucket = self.buckets[dir][cls]
+            if (count := bucket[edge]) > 1:
+                bucket[edge] = count - 1
+                continue
+            del bucket[edge]
+            if not bucket:
+                del self.buckets[dir][cls]
+            if dir == EdgeDir.ANY:
+                del self.entries[edge]
+        self.size -= 1
+        self.version = self.node.edges_version
+
+    def select(
+        self, dir: EdgeDir, edge_type: Optional[type] = None
+    ) -> Iterable[EdgeAnchor]:
+        """Iterate edges toward dir in connection order, of edge_type if given."""
+        buckets = [
+            bucket
+            for cls, bucket in self.buckets[dir].items()
+            if edge_type is None or issubclass(cls, edge_type)
+        ]
+        if len(buckets) == 1:
+            return self.iter(buckets[0])
+        return merge(
+            *(self.iter(bucket) for bucket in buckets),
+            key=lambda edge: self.entries[edge][0],
+        )
+
+    @staticmethod
+    def iter(bucket: dict[EdgeAnchor, int]) -> Iterator[EdgeAnchor]:
+        """Iterate edges of bucket, repeating self loops."""
+        for edge, count in bucket.items():
+            yield edge
+            if count > 1:
+                yield from (edge for _ in range(count - 1))
+
+
 @dataclass(eq=False, repr=False, kw_only=True)
 class EdgeAnchor(Anchor):
     """Edge Anchor."""
@@ -215,14 +448,83 @@ class EdgeAnchor(Anchor):
         return state
 
 
+class VisitOrder(Enum):
+    """Walker visit order."""
+
+    BFS = 1  # visit in the order nodes were queued
+    DFS = 2  # visit newly queued nodes first
+    PRIORITY = 3  # visit lowest priority(architype) first
+
+
+class Frontier:
+    """Queue of anchors a walker has yet to visit."""
+
+    __slots__ = ("order", "priority", "queue", "heap", "count")
+
+    def __init__(
+        self,
+        order: VisitOrder = VisitOrder.BFS,
+        priority: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """Initialize frontier."""
+        if order == VisitOrder.PRIORITY and not priority:
+            raise ValueError("Priority visit order requires a priority function.")
+        self.order = order
+        self.priority = priority
+        self.queue: deque[Anchor] = deque()
+        self.heap: list[tuple[Any, int, Anchor]] = []
+        self.count = 0
+
+    def extend(self, anchors: list[Anchor]) -> None:
+        """Queue anchors keeping their relative order."""
+        match self.order:
+            case VisitOrder.BFS:
+                self.queue.extend(anchors)
+            case VisitOrder.DFS:
+                self.queue.extendleft(reversed(anchors))
+            case VisitOrder.PRIORITY:
+                for anchor in anchors:
+                    heappush(
+                        self.heap,
+                        (self.priority(anchor.architype), self.count, anchor),  # type: ignore[misc]
+                    )
+                    self.count += 1
+
+    def pop(self) -> Anchor:
+        """Dequeue next anchor to visit."""
+        if self.queue:
+            return self.queue.popleft()
+        return heappop(self.heap)[2]
+
+    def reset(self, anchor: Anchor) -> None:
+        """Drop pending anchors and start from anchor."""
+        self.queue.clear()
+        self.heap.clear()
+        self.count = 0
+        self.queue.append(anchor)
+
+    def __len__(self) -> int:
+        """Count pending anchors."""
+        return len(self.queue) + len(self.heap)
+
+    def __iter__(self) -> Iterator[Anchor]:
+        """Iterate pending anchors in visit order."""
+        yield from self.queue
+        yield from (i[2] for i in sorted(self.heap))
+
+    def __repr__(self) -> str:
+        """Override representation."""
+        return f"{self.__class__.__name__}({list(self)})"
+
+
 @dataclass(eq=False, repr=False, kw_only=True)
 class WalkerAnchor(Anchor):
     """Walker Anchor."""
 
     architype: WalkerArchitype
     path: list[Anchor] = field(default_factory=list)
-    next: list[Anchor] = field(default_factory=list)
-    ignores: list[Anchor] = field(default_factory=list)
+    next: Frontier = field(default_factory=Frontier)
+    ignores: set[Anchor] = field(default_factory=set)
     disengaged: bool = False
 
 
@@ -236,11 +538,113 @@ class Architype:
         """Create default architype."""
         self.__jac__ = Anchor(architype=self)
 
+    def __setattr__(self, name: str, value: object) -> None:
+        """Mark anchor dirty on attribute write."""
+        super().__setattr__(name, value)
+        if name != "__jac__" and (anchor := self.__dict__.get("__jac__")):
+            anchor.dirty = True
+
     def __repr__(self) -> str:
         """Override repr for architype."""
         return f"{self.__class__.__name__}"
 
 
+def tracked_type(base: type, mutators: tuple[str, ...]) -> type:
+    """Subclass a container type to flag its owner dirty before each mutation."""
+
+    def wrap(name: str) -> Callable:
+        method = getattr(base, name)
+
+        def mutate(self: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            if (owner := getattr(self, "owner", None)) is not None:
+                owner.__jac__.dirty = True
+            return method(self, *args, **kwargs)
+
+        mutate.__name__ = name
+        return mutate
+
+    def reduce(self: Iterable, protocol: int) -> tuple:
+        # pickled as the plain container, the owner is tracked again on load
+        return (base, (base(self),))
+
+    namespace: dict[str, Any] = {name: wrap(name) for name in mutators}
+    namespace.update(
+        __slots__=("owner",),
+        __reduce_ex__=reduce,
+        __doc__=f"{base.__name__} attribute of a loaded architype.",
+    )
+    return type(f"Tracked{base.__name__.capitalize()}", (base,), namespace)
+
+
+# plain container types -> subclass flagging the architype owning them dirty
+TRACKED_TYPES: dict[type, type] = {
+    list: tracked_type(
+        list,
+        (
+            "__setitem__",
+            "__delitem__",
+            "__iadd__",
+            "__imul__",
+            "append",
+            "extend",
+            "insert",
+            "pop",
+            "remove",
+            "clear",
+            "sort",
+            "reverse",
+        ),
+    ),
+    dict: tracked_type(
+        dict,
+        (
+            "__setitem__",
+            "__delitem__",
+            "__ior__",
+            "pop",
+            "popitem",
+            "clear",
+            "update",
+            "setdefault",
+        ),
+    ),
+    set: tracked_type(
+        set,
+        (
+            "__ior__",
+            "__iand__",
+            "__isub__",
+            "__ixor__",
+            "add",
+            "discard",
+            "remove",
+            "pop",
+            "clear",
+            "update",
+            "difference_update",
+            "intersection_update",
+            "symmetric_difference_update",
+        ),
+    ),
+}
+
+
+def track(value: Any, owner: Architype) -> Any:  # noqa: ANN401
+    """Wrap list, dict and set values, nested ones too, to flag owner on change.
+
+    Other mutable objects changed in place need an attribute write or Jac.save.
+    """
+    tracked_type = TRACKED_TYPES.get(type(value))
+    if tracked_type is None:
+        return value
+    if isinstance(value, dict):
+        tracked = tracked_type({k: track(v, owner) for k, v in value.items()})
+    else:
+        tracked = tracked_type(track(v, owner) for v in value)
+    tracked.owner = owner
+    return tracked
+
+
 class NodeArchitype(Architype):
     """Node Architype Protocol."""
 
@@ -297,6 +701,12 @@ class DSFunc:
     def resolve(self, cls: type) -> None:
         """Resolve the function."""
         self.func = getattr(cls, self.name)
+        self.__dict__.pop("trigger", None)
+
+    @cached_property
+    def trigger(self) -> type | UnionType | tuple[type | UnionType, ...] | None:
+        """Get the type that triggers this ability, evaluated once."""
+        return self.get_funcparam_annotations(self.func)
 
     def get_funcparam_annotations(
         self, func: Callable[[Any, Any], Any] | None
@@ -308,3 +718,68 @@ class DSFunc:
             inspect.signature(func, eval_str=True).parameters["_jac_here_"].annotation
         )
         return annotation if annotation != inspect._empty else None
+
+
+@dataclass(eq=False)
+class DSFuncTable:
+    """Abilities to invoke when a walker type visits a node type."""
+
+    entry: list[DSFunc]
+    exit: list[DSFunc]
+    node_entry: list[DSFunc]
+    walker_entry: list[DSFunc]
+    walker_exit: list[DSFunc]
+    node_exit: list[DSFunc]
+
+    __tables__: ClassVar[dict[tuple[type, type], DSFuncTable]] = {}
+
+    @staticmethod
+    def build(walker: type[Architype], node: type[Architype]) -> DSFuncTable:
+        """Resolve ability triggers of walker and node types."""
+
+        def untyped(funcs: list[DSFunc]) -> list[DSFunc]:
+            return [i for i in funcs if not i.trigger]
+
+        def triggered(
+            funcs: list[DSFunc], by: type, with_untyped: bool = False
+        ) -> list[DSFunc]:
+            return [
+                i
+                for i in funcs
+                if ((t := i.trigger) and issubclass(by, t)) or (with_untyped and not t)
+            ]
+
+        table = DSFuncTable(
+            entry=untyped(walker._jac_entry_funcs_),
+            exit=untyped(walker._jac_exit_funcs_),
+            node_entry=triggered(node._jac_entry_funcs_, walker, with_untyped=True),
+            walker_entry=triggered(walker._jac_entry_funcs_, node),
+            walker_exit=triggered(walker._jac_exit_funcs_, node),
+            node_exit=triggered(node._jac_exit_funcs_, walker, with_untyped=True),
+        )
+        for funcs in (
+            table.entry,
+            table.exit,
+            table.node_entry,
+            table.walker_entry,
+            table.walker_exit,
+            table.node_exit,
+        ):
+            for i in funcs:
+                if not i.func:
+                    raise ValueError(f"No function {i.name} to call.")
+        return table
+
+    @staticmethod
+    def get(walker: type[Architype], node: type[Architype]) -> DSFuncTable:
+        """Get dispatch table of walker and node types."""
+        if (table := DSFuncTable.__tables__.get((walker, node))) is None:
+            table = DSFuncTable.__tables__[(walker, node)] = DSFuncTable.build(
+                walker, node
+            )
+        return table
+
+    @staticmethod
+    def clear() -> None:
+        """Drop all dispatch tables."""
+        DSFuncTable.__tables__.clear()
@@ -0,0 +1,232 @@
+"""Benchmarks for the data spatial runtime on generated graphs."""
+
+from __future__ import annotations
+
+import os
+import platform
+from dataclasses import dataclass
+from math import isqrt
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, TypeVar
+
+from jaclang.compiler.constant import EdgeDir
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.runtimelib.architype import Root
+from jaclang.runtimelib.context import ExecutionContext
+
+T = TypeVar("T")
+
+# edges are (source, target) node indexes, -1 being the root
+Graph = list[tuple[int, int]]
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+@dataclass(eq=False)
+class BenchNode(Jac.Node):
+    """Node of generated graphs."""
+
+    idx: int = 0
+
+
+@Jac.make_edge(on_entry=[], on_exit=[])
+@dataclass(eq=False)
+class BenchEdge(Jac.Edge):
+    """Edge of generated graphs."""
+
+    weight: int = 0
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("traverse")], on_exit=[])
+@dataclass(eq=False)
+class BenchWalker(Jac.Walker):
+    """Walker visiting every reachable node once."""
+
+    visited: int = 0
+
+    def traverse(self, _jac_here_: BenchNode | Root) -> None:
+        """Visit unseen outgoing nodes."""
+        self.visited += 1
+        targets = Jac.edge_ref(
+            _jac_here_,
+            target_obj=None,
+            dir=EdgeDir.OUT,
+            filter_func=None,
+            edges_only=False,
+        )
+        Jac.visit_node(self, targets)
+        Jac.ignore(self, targets)
+
+
+def fan_out_graph(size: int, rng: Random) -> Graph:
+    """Root connected to every node."""
+    return [(-1, i) for i in range(size)]
+
+
+def chain_graph(size: int, rng: Random) -> Graph:
+    """Single path from root through every node."""
+    return [(-1, 0)] + [(i, i + 1) for i in range(size - 1)]
+
+
+def random_graph(size: int, rng: Random) -> Graph:
+    """Random spanning tree plus three random edges per node."""
+    edges = [(-1, 0)] + [(rng.randrange(i), i) for i in range(1, size)]
+    edges += [(rng.randrange(size), rng.randrange(size)) for _ in range(size * 3)]
+    return edges
+
+
+def hub_graph(size: int, rng: Random) -> Graph:
+    """Fully connected hubs each owning a share of leaf nodes."""
+    hubs = max(1, isqrt(size))
+    edges = [(-1, i) for i in range(hubs)]
+    edges += [(i, j) for i in range(hubs) for j in range(hubs) if i != j]
+    edges += [(i % hubs, i) for i in range(hubs, size)]
+    return edges
+
+
+WORKLOADS: dict[str, Callable[[int, Random], Graph]] = {
+    "fan_out": fan_out_graph,
+    "chain": chain_graph,
+    "random": random_graph,
+    "hub": hub_graph,
+}
+
+
+class GraphBench:
+    """Time runtime operations over a generated graph."""
+
+    def __init__(self, name: str, size: int, repeat: int, seed: int) -> None:
+        """Generate workload graph."""
+        if name not in WORKLOADS:
+            raise ValueError(
+                f"Unknown workload {name}, expected one of {', '.join(WORKLOADS)}"
+            )
+        self.name = name
+        self.size = size
+        self.repeat = repeat
+        self.rng = Random(seed)
+        self.graph = WORKLOADS[name](size, self.rng)
+        self.weights = [self.rng.randrange(10) for _ in self.graph]
+        self.timings: dict[str, list[float]] = {}
+
+    def timed(self, name: str, func: Callable[[], T]) -> T:
+        """Run func and record its duration."""
+        start = perf_counter()
+        result = func()
+        self.timings.setdefault(name, []).append(perf_counter() - start)
+        return result
+
+    def build(self, root: Root) -> list[BenchNode]:
+        """Connect generated graph under root."""
+        nodes = [BenchNode(idx=i) for i in range(self.size)]
+        for (src, dst), weight in zip(self.graph, self.weights):
+            Jac.connect(
+                left=nodes[src] if src >= 0 else root,
+                right=nodes[dst],
+                edge_spec=Jac.build_edge(
+                    is_undirected=False,
+                    conn_type=BenchEdge,
+                    conn_assign=(("weight",), (weight,)),
+                ),
+            )
+        return nodes
+
+    def traverse(self, root: Root) -> int:
+        """Spawn walker on root and return visited node count."""
+        walker = BenchWalker()
+        Jac.spawn_call(root, walker)
+        return walker.visited
+
+    def filter_edges(self, nodes: list[BenchNode]) -> None:
+        """Query heavy outgoing edges of every node."""
+        for node in nodes:
+            Jac.edge_ref(
+                node,
+                target_obj=None,
+                dir=EdgeDir.OUT,
+                filter_func=lambda edges: [
+                    i for i in edges if isinstance(i, BenchEdge) and i.weight > 4
+                ],
+                edges_only=True,
+                edge_type=BenchEdge,
+            )
+
+    def disconnect(self, root: Root, nodes: list[BenchNode]) -> None:
+        """Disconnect every generated edge."""
+        for src, dst in self.graph:
+            Jac.disconnect(
+                left=nodes[src] if src >= 0 else root,
+                right=nodes[dst],
+                dir=EdgeDir.OUT,
+                filter_func=None,
+            )
+
+    def run_memory(self) -> int:
+        """Time graph operations on an in memory context."""
+        ctx = ExecutionContext.create()
+        try:
+            root = Jac.get_root()
+            nodes = self.timed("connect", lambda: self.build(root))
+            visited = self.timed("spawn_call", lambda: self.traverse(root))
+            self.timed("edge_ref", lambda: self.filter_edges(nodes))
+            self.timed("disconnect", lambda: self.disconnect(root, nodes))
+        finally:
+            ctx.close()
+        return visited
+
+    def run_shelf(self) -> None:
+        """Time ShelfStorage save on close and load through traversal."""
+        with TemporaryDirectory() as tmp:
+            session = os.path.join(tmp, "bench.session")
+            ctx = ExecutionContext.create(session=session)
+            self.build(Jac.get_root())
+            self.timed("shelf_save", ctx.close)
+
+            ctx = ExecutionContext.create(session=session)
+            try:
+                self.timed("shelf_load", lambda: self.traverse(Jac.get_root()))
+            finally:
+                ctx.close()
+
+    def run(self) -> dict:
+        """Run all measurements, keeping the best of repeats."""
+        visited = 0
+        for _ in range(self.repeat):
+            visited = self.run_memory()
+            self.run_shelf()
+
+        ops = {
+            "connect": len(self.graph),
+            "spawn_call": visited,
+            "edge_ref": self.size,
+            "disconnect": len(self.graph),
+            "shelf_save": self.size + len(self.graph),
+            "shelf_load": visited,
+        }
+        return {
+            "nodes": self.size,
+            "edges": len(self.graph),
+            "visited": visited,
+            "timings": {
+                name: {
+                    "seconds": (best := min(times)),
+                    "ops": ops[name],
+                    "ops_per_sec": ops[name] / best if best else None,
+                }
+                for name, times in self.timings.items()
+            },
+        }
+
+
+def run_benchmarks(workloads: list[str], size: int, repeat: int, seed: int) -> dict:
+    """Run workloads and collect JSON serializable results."""
+    return {
+        "python": platform.python_version(),
+        "size": size,
+        "repeat": repeat,
+        "seed": seed,
+        "workloads": {
+            name: GraphBench(name, size, repeat, seed).run() for name in workloads
+        },
+    }
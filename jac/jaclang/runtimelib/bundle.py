@@ -0,0 +1,109 @@
+"""Jac program bundles (.jir files).
+
+A bundle holds the marshalled bytecode of every module of a program, the merged
+semantic registry and an index of both, so a built program can be run without
+its AST. The file is memory mapped and modules are unmarshalled one at a time as
+they get imported.
+
+Layout: MAGIC, header size (8 bytes little endian), marshalled header, data.
+"""
+
+from __future__ import annotations
+
+import marshal
+import mmap
+import os
+import pickle
+import struct
+import types
+from importlib.util import MAGIC_NUMBER
+from typing import Optional
+
+from jaclang.compiler.absyntree import Module
+from jaclang.compiler.semtable import SemRegistry
+
+MAGIC = b"JIR\x01"
+HEADER_SIZE = struct.Struct("<Q")
+
+
+class ProgramBundle:
+    """Memory mapped program bundle."""
+
+    def __init__(self, path: str) -> None:
+        """Map bundle file and read its index."""
+        self.base_path = os.path.dirname(os.path.abspath(path))
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a Jac program bundle.")
+        (size,) = HEADER_SIZE.unpack_from(self.data, len(MAGIC))
+        start = len(MAGIC) + HEADER_SIZE.size
+        header = marshal.loads(self.data[start : start + size])
+        if header["python"] != MAGIC_NUMBER:
+            raise ValueError(
+                f"{path} was built for another Python version, rebuild it."
+            )
+        self.start = start + size
+        self.modules: dict[str, tuple[int, int]] = header["modules"]
+        self.registry: tuple[int, int] = header["registry"]
+
+    def read(self, offset: int, size: int) -> bytes:
+        """Read a section of the bundle data."""
+        return self.data[self.start + offset : self.start + offset + size]
+
+    def get_bytecode(self, full_target: str) -> Optional[types.CodeType]:
+        """Load the bytecode of a module."""
+        key = os.path.relpath(os.path.abspath(full_target), self.base_path)
+        if key not in self.modules:
+            return None
+        return marshal.loads(self.read(*self.modules[key]))
+
+    def get_sem_ir(self) -> SemRegistry:
+        """Load the semantic registry of the program."""
+        return pickle.loads(self.read(*self.registry))
+
+    def close(self) -> None:
+        """Unmap bundle file."""
+        self.data.close()
+
+
+def write_bundle(path: str, mod: Module) -> None:
+    """Write a compiled program as a bundle."""
+    base_path = os.path.dirname(os.path.abspath(path))
+    sem_ir = SemRegistry()
+    modules: dict[str, tuple[int, int]] = {}
+    sections: list[bytes] = []
+    offset = 0
+    for mod_path, dep in mod.mod_deps.items():
+        if dep.registry:
+            sem_ir.merge(dep.registry)
+        if not dep.gen.py_bytecode:
+            continue
+        key = os.path.relpath(os.path.abspath(mod_path), base_path)
+        modules[key] = (offset, len(dep.gen.py_bytecode))
+        sections.append(dep.gen.py_bytecode)
+        offset += len(dep.gen.py_bytecode)
+    registry = pickle.dumps(sem_ir)
+    sections.append(registry)
+    header = marshal.dumps(
+        {
+            "python": MAGIC_NUMBER,
+            "modules": modules,
+            "registry": (offset, len(registry)),
+        }
+    )
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(HEADER_SIZE.pack(len(header)))
+        f.write(header)
+        for section in sections:
+            f.write(section)
+
+
+def load_bundle(path: str) -> Module | ProgramBundle:
+    """Load a .jir file, older builds being pickled modules."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            f.seek(0)
+            return pickle.load(f)
+    return ProgramBundle(path)
@@ -8,17 +8,20 @@ from .architype import (
     Anchor,
     Architype,
     DSFunc,
+    DSFuncTable,
     EdgeAnchor,
     EdgeArchitype,
+    Frontier,
     GenericEdge,
     NodeAnchor,
     NodeArchitype,
     Root,
+    VisitOrder,
     WalkerAnchor,
     WalkerArchitype,
 )
 from .context import ExecutionContext
-from .memory import Memory, ShelfStorage
+from .memory import Memory, ShelfStorage, SqliteStorage
 from .test import JacTestCheck, JacTestResult, JacTextTestRunner
 
 __all__ = [
@@ -32,10 +35,14 @@ __all__ = [
     "EdgeArchitype",
     "WalkerArchitype",
     "GenericEdge",
+    "Frontier",
+    "VisitOrder",
     "Root",
     "DSFunc",
+    "DSFuncTable",
     "Memory",
     "ShelfStorage",
+    "SqliteStorage",
     "ExecutionContext",
     "JacTestResult",
     "JacTextTestRunner",
@@ -8,8 +8,8 @@ from dataclasses import MISSING
 from typing import Any, Callable, Optional, cast
 from uuid import UUID
 
-from .architype import NodeAnchor, Root
-from .memory import Memory, ShelfStorage
+from .architype import AccessLevel, NodeAnchor, Root
+from .memory import Memory, open_storage
 
 
 EXECUTION_CONTEXT = ContextVar[Optional["ExecutionContext"]]("ExecutionContext")
@@ -26,6 +26,7 @@ class ExecutionContext:
     """Execution Context."""
 
     mem: Memory
+    access_cache: dict[tuple[UUID, UUID], AccessLevel]
     reports: list[Any]
     custom: Any = MISSING
     system_root: NodeAnchor
@@ -61,7 +62,8 @@ class ExecutionContext:
     ) -> ExecutionContext:
         """Create ExecutionContext."""
         ctx = ExecutionContext()
-        ctx.mem = ShelfStorage(session)
+        ctx.mem = open_storage(session)
+        ctx.access_cache = {}
         ctx.reports = []
 
         if not isinstance(
@@ -12,15 +12,17 @@ from contextvars import ContextVar
 from typing import Optional, Union
 
 from jaclang.compiler.absyntree import Module
+from jaclang.compiler.cache import cache_targets, is_cached
 from jaclang.compiler.compile import compile_jac
-from jaclang.compiler.constant import Constants as Con
 from jaclang.compiler.semtable import SemRegistry
 from jaclang.runtimelib.architype import (
     Architype,
+    DSFuncTable,
     EdgeArchitype,
     NodeArchitype,
     WalkerArchitype,
 )
+from jaclang.runtimelib.bundle import ProgramBundle
 from jaclang.utils.log import logging
 
 
@@ -52,7 +54,7 @@ class JacMachine:
         """Attach a JacProgram to the machine."""
         self.jac_program = jac_program
 
-    def get_mod_bundle(self) -> Optional[Module]:
+    def get_mod_bundle(self) -> Optional[Module | ProgramBundle]:
         """Retrieve the mod_bundle from the attached JacProgram."""
         if self.jac_program:
             return self.jac_program.mod_bundle
@@ -77,7 +79,7 @@ class JacMachine:
         """Update semtable on the attached JacProgram."""
         if self.jac_program and mod_sem_ir:
             if self.jac_program.sem_ir:
-                self.jac_program.sem_ir.registry.update(mod_sem_ir.registry)
+                self.jac_program.sem_ir.merge(mod_sem_ir)
             else:
                 self.jac_program.sem_ir = mod_sem_ir
 
@@ -200,6 +202,7 @@ class JacMachine:
                     items=items,
                 )
                 import_result = importer.run_import(spec, reload=True)
+                DSFuncTable.clear()
                 ret_items = []
                 if items:
                     for item_name in items:
@@ -278,13 +281,15 @@ class JacProgram:
 
     def __init__(
         self,
-        mod_bundle: Optional[Module],
+        mod_bundle: Optional[Module | ProgramBundle],
         bytecode: Optional[dict[str, bytes]],
         sem_ir: Optional[SemRegistry],
     ) -> None:
         """Initialize the JacProgram object."""
         self.mod_bundle = mod_bundle
         self.bytecode = bytecode or {}
+        if not sem_ir and isinstance(mod_bundle, ProgramBundle):
+            sem_ir = mod_bundle.get_sem_ir()
         self.sem_ir = sem_ir if sem_ir else SemRegistry()
 
     def get_bytecode(
@@ -296,13 +301,13 @@ class JacProgram:
         reload: bool = False,
     ) -> Optional[types.CodeType]:
         """Get the bytecode for a specific module."""
+        if isinstance(self.mod_bundle, ProgramBundle):
+            return self.mod_bundle.get_bytecode(full_target)
         if self.mod_bundle and isinstance(self.mod_bundle, Module):
             codeobj = self.mod_bundle.mod_deps[full_target].gen.py_bytecode
             return marshal.loads(codeobj) if isinstance(codeobj, bytes) else None
-        gen_dir = os.path.join(caller_dir, Con.JAC_GEN_DIR)
-        pyc_file_path = os.path.join(gen_dir, module_name + ".jbc")
-        if cachable and os.path.exists(pyc_file_path) and not reload:
-            with open(pyc_file_path, "rb") as f:
+        if cachable and not reload and is_cached(full_target):
+            with open(cache_targets(full_target)[1], "rb") as f:
                 return marshal.load(f)
 
         result = compile_jac(full_target, cache_result=cachable)
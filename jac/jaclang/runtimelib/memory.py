@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from pickle import dumps
+from pickle import dumps, loads
 from shelve import Shelf, open
+from sqlite3 import Connection, connect
 from typing import Callable, Generator, Generic, Iterable, TypeVar
 from uuid import UUID
 
-from .architype import Anchor, NodeAnchor, Root, TANCH
+from .architype import Anchor, EdgeAnchor, NodeAnchor, Root, TANCH
 
 ID = TypeVar("ID")
 
@@ -56,6 +57,36 @@ class Memory(Generic[ID, TANCH]):
         """Find one by id."""
         return self.__mem__.get(id)
 
+    def find_by_root(self, root_id: ID) -> Generator[TANCH, None, None]:
+        """Find anchors owned by root."""
+        return self.find(
+            [id for id, anchor in self.__mem__.items() if anchor.root == root_id]
+        )
+
+    def populate_data(self: Memory[UUID, Anchor], edges: Iterable[EdgeAnchor]) -> None:
+        """Populate stub edges then their stub nodes with one find each."""
+        edges = list(edges)
+        self.populate_stubs([edge for edge in edges if not edge.is_populated()])
+        self.populate_stubs(
+            [
+                node
+                for edge in edges
+                if edge.is_populated()
+                for node in (edge.source, edge.target)
+                if not node.is_populated()
+            ]
+        )
+
+    def populate_stubs(self: Memory[UUID, Anchor], stubs: list[Anchor]) -> None:
+        """Populate stub anchors in place."""
+        if stubs:
+            found = {
+                anchor.id: anchor for anchor in self.find([stub.id for stub in stubs])
+            }
+            for stub in stubs:
+                if anchor := found.get(stub.id):
+                    stub.__dict__.update(anchor.__dict__)
+
     def set(self, id: ID, data: TANCH) -> None:
         """Save anchor to memory."""
         self.__mem__[id] = data
@@ -70,56 +101,92 @@ class Memory(Generic[ID, TANCH]):
                 self.__gc__.add(anchor)
 
 
+def sync_anchor(anchor: Anchor, stored: Anchor | None) -> Anchor | None:
+    """Merge anchor to its stored copy, None if it should not be kept."""
+    from jaclang.plugin.feature import JacFeature as Jac
+
+    if stored:
+        if (
+            isinstance(stored, NodeAnchor)
+            and isinstance(anchor, NodeAnchor)
+            and stored.edges != anchor.edges
+            and Jac.check_connect_access(anchor)
+        ):
+            if not anchor.edges and not isinstance(anchor.architype, Root):
+                return None
+            stored.edges = anchor.edges
+
+        if anchor.is_modified() and Jac.check_write_access(anchor):
+            stored.access = anchor.access
+            stored.architype = anchor.architype
+
+        return stored
+    elif not (
+        isinstance(anchor, NodeAnchor)
+        and not isinstance(anchor.architype, Root)
+        and not anchor.edges
+    ):
+        return anchor
+
+    return None
+
+
 @dataclass
 class ShelfStorage(Memory[UUID, Anchor]):
     """Shelf Handler."""
 
     __shelf__: Shelf[Anchor] | None = None
+    __roots__: Shelf[set[UUID]] | None = None
 
     def __init__(self, session: str | None = None) -> None:
         """Initialize memory handler."""
         super().__init__()
         self.__shelf__ = open(session) if session else None  # noqa: SIM115
+        self.__roots__ = open(f"{session}.roots") if session else None  # noqa: SIM115
+
+        # sessions created before the index existed get it built once
+        if self.__shelf__ and self.__roots__ is not None and not self.__roots__:
+            self.index_roots(self.__shelf__.values(), [])
+
+    def index_roots(self, added: Iterable[Anchor], removed: Iterable[Anchor]) -> None:
+        """Update root to anchor ids index, one write per touched root."""
+        if self.__roots__ is not None:
+            roots: dict[str, set[UUID]] = {}
+            for anchors, add in ((removed, False), (added, True)):
+                for anchor in anchors:
+                    if anchor.root:
+                        key = str(anchor.root)
+                        if (ids := roots.get(key)) is None:
+                            ids = roots[key] = self.__roots__.get(key, set())
+                        if add:
+                            ids.add(anchor.id)
+                        else:
+                            ids.discard(anchor.id)
+            self.__roots__.update(roots)
 
     def close(self) -> None:
         """Close memory handler."""
         if isinstance(self.__shelf__, Shelf):
-            from jaclang.plugin.feature import JacFeature as Jac
-
+            added: list[Anchor] = []
+            removed: list[Anchor] = list(self.__gc__)
             for anchor in self.__gc__:
                 self.__shelf__.pop(str(anchor.id), None)
                 self.__mem__.pop(anchor.id, None)
 
             for d in self.__mem__.values():
-                if d.persistent and d.hash != hash(dumps(d)):
+                if d.persistent and d.needs_sync():
                     _id = str(d.id)
-                    if p_d := self.__shelf__.get(_id):
-                        if (
-                            isinstance(p_d, NodeAnchor)
-                            and isinstance(d, NodeAnchor)
-                            and p_d.edges != d.edges
-                            and Jac.check_connect_access(d)
-                        ):
-                            if not d.edges and not isinstance(d.architype, Root):
-                                self.__shelf__.pop(_id, None)
-                                continue
-                            p_d.edges = d.edges
-
-                        if Jac.check_write_access(d):
-                            if hash(dumps(p_d.access)) != hash(dumps(d.access)):
-                                p_d.access = d.access
-                            if hash(dumps(p_d.architype)) != hash(dumps(d.architype)):
-                                p_d.architype = d.architype
-
-                        self.__shelf__[_id] = p_d
-                    elif not (
-                        isinstance(d, NodeAnchor)
-                        and not isinstance(d.architype, Root)
-                        and not d.edges
-                    ):
-                        self.__shelf__[_id] = d
-
+                    if synced := sync_anchor(d, self.__shelf__.get(_id)):
+                        self.__shelf__[_id] = synced
+                        added.append(synced)
+                    else:
+                        self.__shelf__.pop(_id, None)
+                        removed.append(d)
+
+            self.index_roots(added, removed)
             self.__shelf__.close()
+        if isinstance(self.__roots__, Shelf):
+            self.__roots__.close()
         super().close()
 
     def find(
@@ -158,3 +225,136 @@ class ShelfStorage(Memory[UUID, Anchor]):
             self.__mem__[id] = data
 
         return data
+
+    def find_by_root(self, root_id: UUID) -> Generator[Anchor, None, None]:
+        """Find anchors owned by root."""
+        if isinstance(self.__roots__, Shelf):
+            ids = self.__roots__.get(str(root_id), set())
+            ids.update(
+                id for id, anchor in self.__mem__.items() if anchor.root == root_id
+            )
+            return self.find(list(ids))
+        return super().find_by_root(root_id)
+
+
+@dataclass
+class SqliteStorage(Memory[UUID, Anchor]):
+    """Sqlite Handler."""
+
+    __conn__: Connection | None = None
+
+    BATCH_SIZE = 900
+
+    def __init__(self, session: str | None = None) -> None:
+        """Initialize memory handler."""
+        super().__init__()
+        self.__conn__ = connect(session) if session else None
+        if self.__conn__:
+            with self.__conn__:
+                self.__conn__.execute(
+                    "CREATE TABLE IF NOT EXISTS anchors"
+                    " (id TEXT PRIMARY KEY, root TEXT, data BLOB NOT NULL)"
+                )
+                self.__conn__.execute(
+                    "CREATE INDEX IF NOT EXISTS anchors_root ON anchors (root)"
+                )
+
+    def fetch(self, ids: Iterable[UUID]) -> dict[UUID, Anchor]:
+        """Load stored anchors by ids with one query per batch."""
+        anchors: dict[UUID, Anchor] = {}
+        if self.__conn__:
+            keys = [str(id) for id in ids]
+            for i in range(0, len(keys), self.BATCH_SIZE):
+                batch = keys[i : i + self.BATCH_SIZE]
+                for id, data in self.__conn__.execute(
+                    "SELECT id, data FROM anchors WHERE id IN"
+                    f" ({', '.join('?' * len(batch))})",
+                    batch,
+                ):
+                    anchors[UUID(id)] = loads(data)
+        return anchors
+
+    def close(self) -> None:
+        """Close memory handler."""
+        if self.__conn__:
+            deleted = {str(anchor.id) for anchor in self.__gc__}
+            for anchor in self.__gc__:
+                self.__mem__.pop(anchor.id, None)
+
+            dirty = [
+                d for d in self.__mem__.values() if d.persistent and d.needs_sync()
+            ]
+            stored = self.fetch(d.id for d in dirty)
+
+            rows = []
+            for d in dirty:
+                _id = str(d.id)
+                if synced := sync_anchor(d, stored.get(d.id)):
+                    root = str(synced.root) if synced.root else None
+                    rows.append((_id, root, dumps(synced)))
+                elif d.id in stored:
+                    deleted.add(_id)
+
+            with self.__conn__:
+                self.__conn__.executemany(
+                    "DELETE FROM anchors WHERE id = ?", [(id,) for id in deleted]
+                )
+                self.__conn__.executemany(
+                    "INSERT OR REPLACE INTO anchors (id, root, data) VALUES (?, ?, ?)",
+                    rows,
+                )
+            self.__conn__.close()
+        super().close()
+
+    def find(
+        self,
+        ids: UUID | Iterable[UUID],
+        filter: Callable[[Anchor], Anchor] | None = None,
+    ) -> Generator[Anchor, None, None]:
+        """Find anchors from datasource by ids with filter."""
+        if not isinstance(ids, Iterable):
+            ids = [ids]
+
+        if self.__conn__:
+            ids = list(ids)
+            self.__mem__.update(
+                self.fetch(
+                    id for id in ids if id not in self.__mem__ and id not in self.__gc__
+                )
+            )
+
+        yield from super().find(ids, filter)
+
+    def find_by_id(self, id: UUID) -> Anchor | None:
+        """Find one by id."""
+        return next(self.find(id), None)
+
+    def find_by_root(self, root_id: UUID) -> Generator[Anchor, None, None]:
+        """Find anchors owned by root."""
+        if self.__conn__:
+            ids = {
+                UUID(id): None
+                for (id,) in self.__conn__.execute(
+                    "SELECT id FROM anchors WHERE root = ?", (str(root_id),)
+                )
+            }
+            ids.update(
+                (id, None)
+                for id, anchor in self.__mem__.items()
+                if anchor.root == root_id
+            )
+            return self.find(list(ids))
+        return super().find_by_root(root_id)
+
+
+STORAGES: dict[str, Callable[[str], Memory]] = {"sqlite": SqliteStorage}
+
+
+def open_storage(session: str | None = None) -> Memory:
+    """Open memory handler based on session uri scheme, defaults to shelve."""
+    scheme, sep, path = (session or "").partition("://")
+    if not sep:
+        return ShelfStorage(session)
+    if storage := STORAGES.get(scheme):
+        return storage(path)
+    raise ValueError(f"Unsupported session scheme {scheme}://")
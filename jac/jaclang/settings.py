@@ -20,12 +20,20 @@ class Settings:
     # Compiler configuration
     disable_mtllm: bool = False
     ignore_test_annex: bool = False
+    compile_workers: int = 1  # processes parsing imports, 0 for one per cpu
+    iterative_traversal: bool = False  # walk the ast without recursion
+    mypy_warm_cache: bool = False  # keep analyzed stdlib between type checks
+    mypy_warm_builds: int = 4  # module paths whose warm build is kept
+    parse_cache_size: int = 32  # parse trees of recent sources kept, 0 to disable
 
     # Formatter configuration
     max_line_length: int = 88
 
     # LSP configuration
     lsp_debug: bool = False
+    lsp_debounce: int = 150  # ms without edits before a document is checked
+    lsp_workers: int = 2  # threads analyzing documents, 0 for executor default
+    lsp_index_save_delay: int = 1000  # ms index changes are batched before a write
 
     def __post_init__(self) -> None:
         """Initialize settings."""
@@ -3,13 +3,22 @@
 import contextlib
 import inspect
 import io
+import json
 import os
+import pickle
+import shutil
 import subprocess
 import sys
+import tempfile
 import traceback
+import types
 
 from jaclang.cli import cli
+from jaclang.compiler.absyntree import Module
+from jaclang.compiler.compile import jac_file_to_pass
+from jaclang.compiler.semtable import SemRegistry
 from jaclang.plugin.builtin import dotgen
+from jaclang.runtimelib.bundle import ProgramBundle, load_bundle
 from jaclang.utils.test import TestCase
 
 
@@ -316,6 +325,49 @@ class JacCliTests(TestCase):
         self.assertIn("Errors: 0, Warnings: 0", stdout_value)
         self.assertIn("<module 'pyfunc' from", stdout_value)
 
+    def test_build_bundle(self) -> None:
+        """Test built programs are indexed bundles loading modules lazily."""
+        jir_path = self.fixture_abs_path("needs_import.jir")
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        cli.build(self.fixture_abs_path("needs_import.jac"))
+        sys.stdout = sys.__stdout__
+        bundle = load_bundle(jir_path)
+        self.assertIsInstance(bundle, ProgramBundle)
+        assert isinstance(bundle, ProgramBundle)
+        self.assertIn("needs_import.jac", bundle.modules)
+        code = bundle.get_bytecode(self.fixture_abs_path("needs_import.jac"))
+        self.assertIsInstance(code, types.CodeType)
+        self.assertIsNone(bundle.get_bytecode(self.fixture_abs_path("hello.jac")))
+        self.assertIsInstance(bundle.get_sem_ir(), SemRegistry)
+        bundle.close()
+
+        out = jac_file_to_pass(self.fixture_abs_path("hello.jac"))
+        with open(jir_path, "wb") as f:
+            pickle.dump(out.ir, f)
+        self.assertIsInstance(load_bundle(jir_path), Module)
+        os.remove(jir_path)
+
+    def test_format_check(self) -> None:
+        """Test checking and formatting a directory of files."""
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("hello.jac", "needs_import.jac"):
+                shutil.copy(self.fixture_abs_path(name), tmp)
+            with open(os.path.join(tmp, "ugly.jac"), "w") as f:
+                f.write("with entry{print( 'hi' ) ;}\n")
+            captured_err = io.StringIO()
+            with contextlib.redirect_stderr(captured_err):
+                with self.assertRaises(SystemExit):
+                    cli.format(tmp, check=True)
+                self.assertIn("Would reformat", captured_err.getvalue())
+                with open(os.path.join(tmp, "ugly.jac")) as f:
+                    self.assertEqual(f.read(), "with entry{print( 'hi' ) ;}\n")
+                cli.format(tmp)
+                cli.format(tmp, check=True)
+            self.assertIn("Checked 3 '.jac' files.", captured_err.getvalue())
+            with open(os.path.join(tmp, "ugly.jac")) as f:
+                self.assertEqual(f.read(), "with entry {\n    print('hi');\n}\n")
+
     def test_cache_no_cache_on_run(self) -> None:
         """Basic test for pass."""
         process = subprocess.Popen(
@@ -414,6 +466,30 @@ class JacCliTests(TestCase):
         self.assertIn("11\n13\n15\n>>> Graph content saved to", stdout_value)
         self.assertIn("connect_expressions.dot\n", stdout_value)
 
+    def test_bench(self) -> None:
+        """Test bench CLI cmd emits JSON results."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        cli.bench("all", size=50, repeat=1)
+        sys.stdout = sys.__stdout__
+        results = json.loads(captured_output.getvalue())
+        self.assertEqual(
+            ["fan_out", "chain", "random", "hub"], list(results["workloads"])
+        )
+        for workload in results["workloads"].values():
+            self.assertEqual(51, workload["visited"])
+            self.assertEqual(
+                {
+                    "connect",
+                    "spawn_call",
+                    "edge_ref",
+                    "disconnect",
+                    "shelf_save",
+                    "shelf_load",
+                },
+                set(workload["timings"]),
+            )
+
     def test_py_to_jac(self) -> None:
         """Test for graph CLI cmd."""
         captured_output = io.StringIO()
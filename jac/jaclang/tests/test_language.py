@@ -11,6 +11,7 @@ from jaclang import jac_import
 from jaclang.cli import cli
 from jaclang.compiler.compile import jac_file_to_pass, jac_pass_to_pass, jac_str_to_pass
 from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+from jaclang.runtimelib.architype import DSFuncTable
 from jaclang.runtimelib.context import SUPER_ROOT_ANCHOR
 from jaclang.runtimelib.machine import JacMachine, JacProgram
 from jaclang.utils.test import TestCase
@@ -1205,6 +1206,33 @@ class JacLanguageTests(TestCase):
             "Exiting at the end of walker:  test_node(value=", stdout_value[11]
         )
 
+    def test_ability_dispatch(self) -> None:
+        """Test walker and node abilities are dispatched by type."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        jac_import("ability_dispatch", base_path=self.fixture_abs_path("./"))
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue().split("\n")
+        self.assertEqual(
+            [
+                "start",
+                "A entry W()",
+                "A any W()",
+                "W on A",
+                "W exit A()",
+                "A exit W()",
+                "W exit B(val=1)",
+            ],
+            stdout_value[:7],
+        )
+        self.assertEqual(stdout_value[:13], stdout_value[13:26])
+        # exit abilities still run after a disengage in the first entry
+        self.assertEqual(["stop", "bye"], stdout_value[26:28])
+        self.assertIn(
+            ("W", "B"),
+            [(w.__name__, n.__name__) for w, n in DSFuncTable.__tables__],
+        )
+
     def test_visit_order(self) -> None:
         """Test entry and exit behavior of walker."""
         captured_output = io.StringIO()
@@ -1214,6 +1242,49 @@ class JacLanguageTests(TestCase):
         stdout_value = captured_output.getvalue()
         self.assertEqual("[MyNode(Name='End'), MyNode(Name='Middle')]\n", stdout_value)
 
+    def test_edge_index(self) -> None:
+        """Test edge queries stay in sync with connects and disconnects."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        jac_import("edge_index", base_path=self.fixture_abs_path("./"))
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue().split("\n")
+        self.assertEqual(
+            "[spoke(val=1), spoke(val=3), spoke(val=5), hub()] 4 7", stdout_value[0]
+        )
+        self.assertEqual("[spoke(val=3), spoke(val=5)]", stdout_value[1])
+        self.assertEqual("3", stdout_value[2])
+        self.assertEqual("[] 3 3", stdout_value[3])
+        self.assertEqual("[spoke(val=9)]", stdout_value[4])
+        self.assertEqual("[spoke(val=10), spoke(val=9)]", stdout_value[5])
+        self.assertEqual(
+            "[spoke(val=20), spoke(val=21), spoke(val=22), spoke(val=23)] "
+            "[spoke(val=20), spoke(val=22), spoke(val=23)] [spoke(val=22)] "
+            "[spoke(val=22), spoke(val=23)]",
+            stdout_value[6],
+        )
+        self.assertEqual("[spoke(val=20), spoke(val=23)] 0 2", stdout_value[7])
+
+    def test_visit_frontier_order(self) -> None:
+        """Test walker frontier visit orders."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        jac_import("visit_frontier", base_path=self.fixture_abs_path("./"))
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue().split("\n")
+        self.assertEqual(
+            "BFS a1, BFS a2, BFS b1, BFS b2, BFS b3, BFS a1, BFS b1, BFS b2",
+            ", ".join(stdout_value[0:8]),
+        )
+        self.assertEqual(
+            "DFS a1, DFS b1, DFS b2, DFS a2, DFS b3, DFS a1, DFS b1, DFS b2",
+            ", ".join(stdout_value[8:16]),
+        )
+        self.assertEqual(
+            "PRIORITY a2, PRIORITY b3, PRIORITY a1, PRIORITY b2, PRIORITY b1",
+            ", ".join(stdout_value[16:21]),
+        )
+
     def test_global_multivar(self) -> None:
         """Test supporting multiple global variable in a statement."""
         captured_output = io.StringIO()
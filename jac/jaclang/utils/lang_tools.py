@@ -2,6 +2,7 @@
 
 import ast as py_ast
 import inspect
+import json
 import os
 import sys
 from typing import List, Optional, Type
@@ -11,6 +12,7 @@ from jaclang.compiler.compile import jac_file_to_pass
 from jaclang.compiler.passes.main.pyast_load_pass import PyastBuildPass
 from jaclang.compiler.passes.main.schedules import py_code_gen, type_checker_sched
 from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+from jaclang.compiler.passes.profiler import CompileProfiler
 from jaclang.compiler.symtable import SymbolTable
 from jaclang.utils.helpers import auto_generate_refs, pascal_to_snake
 
@@ -278,6 +280,29 @@ class AstTool:
         else:
             return "Not a .jac or .py file, or invalid command for file type."
 
+    def profile_compile(self, args: List[str]) -> str:
+        """Profile passes and node handlers compiling a .jac file."""
+        error = (
+            "Usage: profile_compile <.jac file_path> [json / stacks] [--no-memory]\n"
+            "stacks are flamegraph compatible, self time in microseconds."
+        )
+        flags = [i for i in args if i.startswith("--")]
+        args = [i for i in args if not i.startswith("--")]
+        if not 1 <= len(args) <= 2 or any(i != "--no-memory" for i in flags):
+            return error
+        file_name, output = args[0], args[1] if len(args) == 2 else "json"
+        if output not in ("json", "stacks"):
+            return error
+        if not file_name.endswith(".jac"):
+            return "Not a .jac file."
+        if not os.path.isfile(file_name):
+            return f"Error: {file_name} not found"
+        with CompileProfiler(trace_memory="--no-memory" not in flags) as profiler:
+            jac_file_to_pass(file_name, schedule=py_code_gen_typed)
+        if output == "stacks":
+            return profiler.collapsed_stacks()
+        return json.dumps({"file": file_name, **profiler.report()}, indent=2)
+
     def automate_ref(self) -> str:
         """Automate the reference guide generation."""
         auto_generate_refs()
@@ -1,8 +1,12 @@
 """Test ast build pass module."""
 
+import json
 import os
 
 import jaclang
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.passes import Pass
+from jaclang.compiler.passes.main import PyastGenPass
 from jaclang.utils.helpers import extract_headings, heading_to_snake
 from jaclang.utils.lang_tools import AstTool
 from jaclang.utils.test import TestCase
@@ -121,3 +125,21 @@ class JacFormatPassTests(TestCase):
         out = AstTool().ir(["sym.", jac_file])
         self.assertEqual('2 [label="(e)x"];', out.split("\n")[4])
         self.assertNotIn('[label="str"];', out)
+
+    def test_profile_compile(self) -> None:
+        """Testing pass and handler profile of a compile."""
+        jac_file = os.path.join(
+            os.path.dirname(jaclang.__file__), "../examples/reference/atom.jac"
+        )
+        report = json.loads(AstTool().profile_compile([jac_file, "--no-memory"]))
+        self.assertIn("JacTypeCheckPass", report["passes"])
+        self.assertEqual(report["passes"]["PyastGenPass"]["calls"], 1)
+        self.assertGreater(report["handlers"]["PyastGenPass.exit_module"]["calls"], 0)
+        self.assertGreaterEqual(
+            report["total_time"], report["passes"]["PyastGenPass"]["total_time"]
+        )
+        self.assertIsNone(Pass.profiler)
+        self.assertNotIn("profiled", str(PyastGenPass.get_handlers(ast.Module)))
+        stacks = AstTool().profile_compile([jac_file, "stacks", "--no-memory"])
+        self.assertIn("\nPyastGenPass;PyastGenPass.exit_module ", stacks)
+        self.assertIn("Usage", AstTool().profile_compile([jac_file, "dot"]))